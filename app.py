@@ -1,5 +1,5 @@
 # app.py
-from flask import Flask, render_template, request, redirect, url_for, session, jsonify, flash
+from flask import Flask, render_template, request, redirect, url_for, session, jsonify, flash, Response
 from markupsafe import Markup
 import markdown as md
 from flask_sqlalchemy import SQLAlchemy
@@ -10,16 +10,26 @@ from io import BytesIO
 import base64
 import os
 import uuid
-import requests
 import json
+import math
+import random
+import re
 from datetime import datetime, timedelta
 import markdown
 import threading
 import time
+import heapq
+import hashlib
+import socket
+from concurrent.futures import ThreadPoolExecutor, Future
 import secrets
 import string
 from difflib import SequenceMatcher
-from collections import defaultdict
+from collections import defaultdict, namedtuple, OrderedDict
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import make_url
+from llm_client import LLMClient, LLMError, CircuitBreaker, DeadlineExceededError
+from feedback_grouping import group_near_duplicates, cluster_by_topic
 
 app = Flask(__name__)
 
@@ -32,13 +42,75 @@ if not SECRET_KEY:
     print("*** Setzen Sie SECRET_KEY als Umgebungsvariable für Produktionsumgebung ***\n\n")
 
 app.config['SECRET_KEY'] = SECRET_KEY
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///presentations.db'
+app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///presentations.db')
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+# Warteschlange und Leases nutzen INSERT ... ON CONFLICT (siehe upsert_insert)
+SUPPORTED_DATABASES = ('sqlite', 'postgresql')
+if make_url(app.config['SQLALCHEMY_DATABASE_URI']).get_backend_name() not in SUPPORTED_DATABASES:
+    raise RuntimeError(f"DATABASE_URL: nur {' und '.join(SUPPORTED_DATABASES)} werden unterstützt")
+
 # Konfiguration für die Feedback-Verarbeitung
 app.config['FEEDBACK_PROCESSING_INTERVAL'] = 60  # Feste Zeitslots für AI-Verarbeitung (alle 60s ab Mitternacht)
+app.config['FEEDBACK_MAX_IN_FLIGHT'] = int(os.environ.get('FEEDBACK_MAX_IN_FLIGHT', 4))  # Parallel verarbeitete Präsentationen
+app.config['FEEDBACK_LEASE_SECONDS'] = int(os.environ.get('FEEDBACK_LEASE_SECONDS', 300))  # Max. Verarbeitungsdauer, danach darf ein anderer Prozess übernehmen
+app.config['FEEDBACK_LEASE_RETRY'] = float(os.environ.get('FEEDBACK_LEASE_RETRY', 5))  # Sekunden bis zum nächsten Versuch, wenn ein anderer Prozess verarbeitet
+app.config['FEEDBACK_PROCESSING_MODE'] = os.environ.get('FEEDBACK_PROCESSING_MODE', 'inline')  # 'inline' oder 'worker' (Web-Prozesse planen nur, siehe `flask feedback-worker`)
+app.config['FEEDBACK_WORKER_POLL_INTERVAL'] = float(os.environ.get('FEEDBACK_WORKER_POLL_INTERVAL', 1))  # Sekunden - Worker-Modus: Abfrage neuer Feedbacks
+app.config['FEEDBACK_RECOVER_ON_STARTUP'] = os.environ.get('FEEDBACK_RECOVER_ON_STARTUP', 'true').lower() == 'true'  # Warteschlange nach Neustart wiederherstellen
+app.config['FEEDBACK_RETRY_DELAY'] = 10  # Sekunden bis zum erneuten Versuch nach fehlgeschlagener AI-Verarbeitung
+app.config['FEEDBACK_RETRY_MAX_DELAY'] = 300  # Sekunden - Obergrenze des exponentiellen Backoffs pro Präsentation
+app.config['FEEDBACK_SLOT_JITTER'] = 3  # Sekunden - feste Slots: zusätzliche (pro Präsentation und Slot feste) Streuung
+app.config['FEEDBACK_DEADLINE_FRACTION'] = float(os.environ.get('FEEDBACK_DEADLINE_FRACTION', 0.5))  # Anteil des Intervalls, den ein Durchlauf für KI-Aufrufe hat
+
+# Adaptives Sammelfenster statt fester Slots (pro Präsentation, aus der Eingangsrate abgeleitet)
+app.config['FEEDBACK_ADAPTIVE_BATCHING'] = os.environ.get('FEEDBACK_ADAPTIVE_BATCHING', 'true').lower() == 'true'
+app.config['FEEDBACK_WINDOW_MIN'] = float(os.environ.get('FEEDBACK_WINDOW_MIN', 5))  # Sekunden - ruhiger Raum: Einzelfrage schnell verarbeiten
+app.config['FEEDBACK_WINDOW_MAX'] = float(os.environ.get('FEEDBACK_WINDOW_MAX', 60))  # Sekunden - längste Wartezeit auf weitere Feedbacks
+app.config['FEEDBACK_BATCH_THRESHOLD'] = int(os.environ.get('FEEDBACK_BATCH_THRESHOLD', 30))  # Ab so vielen wartenden Feedbacks sofort verarbeiten
+app.config['FEEDBACK_MIN_SPACING'] = float(os.environ.get('FEEDBACK_MIN_SPACING', 15))  # Sekunden - Mindestabstand zwischen zwei KI-Aufrufen
+app.config['FEEDBACK_RATE_HALF_LIFE'] = float(os.environ.get('FEEDBACK_RATE_HALF_LIFE', 30))  # Sekunden - Halbwertszeit der gemessenen Eingangsrate
 app.config['CLIENT_REFRESH_INTERVAL'] = 20  # Sekunden zwischen Client-Aktualisierungen (Frontend-Polling)
 
+# Gebündeltes Schreiben von Feedback (Group Commit)
+app.config['FEEDBACK_INGEST_FLUSH_INTERVAL'] = 0.02  # Sekunden Sammelfenster pro Batch
+app.config['FEEDBACK_INGEST_BATCH_SIZE'] = 100  # Maximale Feedbacks pro Transaktion
+app.config['FEEDBACK_INGEST_WAIT_FOR_COMMIT'] = True  # Erst nach dem Commit bestätigen (siehe FeedbackIngestBuffer)
+app.config['FEEDBACK_INGEST_TIMEOUT'] = 10  # Sekunden, die ein Request maximal auf den Commit wartet
+
+# Server-Sent Events als Push-Kanal (Polling bleibt als Fallback)
+# HINWEIS: Nur aktivieren, wenn /events über einen async-fähigen Server läuft (siehe start_events_server.sh)
+app.config['SSE_ENABLED'] = os.environ.get('SSE_ENABLED', '').lower() in ('1', 'true', 'yes')
+app.config['SSE_CHECK_INTERVAL'] = 2  # Sekunden zwischen Versionsprüfungen pro Stream (prozessübergreifend)
+app.config['SSE_STREAM_MAX_DURATION'] = 300  # Sekunden, danach verbindet sich der Browser neu
+app.config['PREVIEW_STREAM_RENDER_INTERVAL'] = 0.25  # Sekunden zwischen zwei gerenderten Zwischenständen der Vorschau
+app.config['PREVIEW_STREAM_DEADLINE'] = float(os.environ.get('PREVIEW_STREAM_DEADLINE', 90))  # Sekunden für die gesamte gestreamte Vorschau
+
+# Cache für Access-Code-Lookups (öffentliche Seite und Feedback-POST)
+app.config['ACCESS_CODE_CACHE_SIZE'] = 1024  # Maximale Anzahl gecachter Access Codes
+app.config['ACCESS_CODE_CACHE_TTL'] = 300    # Sekunden - Obergrenze, Invalidierung erfolgt über Signaldatei
+
+# Hintergrund-Jobs für die Generierung der Info-Seite
+app.config['STATIC_INFO_JOB_WORKERS'] = int(os.environ.get('STATIC_INFO_JOB_WORKERS', 2))  # Parallele Generierungen
+app.config['STATIC_INFO_JOB_TIMEOUT'] = 180  # Sekunden, nach denen ein hängender Job (z.B. nach Neustart) neu gestartet wird
+
+# Persistenter Cache für generierte Info-Seiten
+app.config['STATIC_INFO_CACHE_MAX_BYTES'] = 20 * 1024 * 1024  # Älteste Einträge werden darüber hinaus verdrängt
+app.config['STATIC_INFO_CACHE_WAIT_TIMEOUT'] = 120  # Sekunden, die auf einen identischen laufenden Aufruf gewartet wird
+
+# Verdichtung des Feedback-Bereichs (Token grob geschätzt: 4 Zeichen pro Token)
+app.config['FEEDBACK_COMPACTION_THRESHOLD_TOKENS'] = 1000  # Ab dieser Größe wird verdichtet (max_tokens der Generierung: 1500)
+app.config['FEEDBACK_COMPACTION_TARGET_TOKENS'] = 500  # Zielgröße nach der Verdichtung
+app.config['STATIC_INFO_DIGEST_MAX_TOKENS'] = 400  # Kurzfassung der Info-Seite im Feedback-Prompt
+app.config['FEEDBACK_DUPLICATE_THRESHOLD'] = 0.6  # Jaccard-Ähnlichkeit (Trigramme), ab der Feedbacks zusammengefasst werden
+app.config['FEEDBACK_CLUSTER_MIN_BATCH'] = 50  # Ab so vielen Prompt-Zeilen zusätzlich thematisch clustern
+app.config['FEEDBACK_CLUSTER_THRESHOLD'] = 0.5  # Kosinus-Ähnlichkeit (TF-IDF) für ein gemeinsames Themen-Cluster
+app.config['FEEDBACK_CLUSTER_MEMBER_CHARS'] = 80  # Weitere Fragen eines Themen-Clusters stehen so weit gekürzt im Prompt
+app.config['FEEDBACK_CLUSTER_MAX_MEMBERS'] = 5  # Höchstens so viele weitere Fragen pro Cluster ausschreiben
+app.config['FEEDBACK_MAP_CHUNK_TOKENS'] = 3000  # Feedback-Zeilen pro Prompt; darüber Map-Reduce in Abschnitten
+app.config['FEEDBACK_MAP_WORKERS'] = 4  # Parallele KI-Aufrufe im Map-Schritt
+app.config['FEEDBACK_MAP_RETRIES'] = 2  # Wiederholungen für fehlgeschlagene Abschnitte
+
 # Rate-Limiting für AI-Calls (Schutz vor Missbrauch)
 # HINWEIS: Nur für manuelle API-Aufrufe, NICHT für automatische Feedback-Verarbeitung
 ai_call_limits = defaultdict(list)  # user_id -> [timestamp, timestamp, ...]
@@ -59,6 +131,42 @@ def markdown_filter(text):
 
 # OpenAI API Key - in production, use environment variables
 app.config['OPENAI_API_KEY'] = os.environ.get('OPENAI_API_KEY', 'your-api-key')
+app.config['OPENAI_API_BASE'] = os.environ.get('OPENAI_API_BASE', 'https://api.openai.com/v1')
+
+# HTTP-Client für KI-Aufrufe (Timeouts unter dem Gunicorn-Timeout von 60s)
+app.config['LLM_CONNECT_TIMEOUT'] = float(os.environ.get('LLM_CONNECT_TIMEOUT', 5))
+app.config['LLM_READ_TIMEOUT'] = float(os.environ.get('LLM_READ_TIMEOUT', 45))
+app.config['LLM_POOL_CONNECTIONS'] = int(os.environ.get('LLM_POOL_CONNECTIONS', 4))  # Anzahl gepoolter Hosts
+app.config['LLM_POOL_MAXSIZE'] = int(os.environ.get('LLM_POOL_MAXSIZE', 16))  # Keep-Alive-Verbindungen pro Host
+app.config['LLM_MAX_CONCURRENT'] = int(os.environ.get('LLM_MAX_CONCURRENT', 8))  # Gleichzeitige KI-Aufrufe pro Prozess (0 = unbegrenzt)
+app.config['LLM_QUEUE_TIMEOUT'] = float(os.environ.get('LLM_QUEUE_TIMEOUT', 30))  # Max. Wartezeit auf einen freien Platz
+# Circuit Breaker: nach X Störungen in Folge keine Aufrufe mehr, Probe nach 2s, 4s, 8s ... (max. 120s)
+app.config['LLM_BREAKER_FAILURES'] = int(os.environ.get('LLM_BREAKER_FAILURES', 5))
+app.config['LLM_BREAKER_BASE_DELAY'] = float(os.environ.get('LLM_BREAKER_BASE_DELAY', 2))
+app.config['LLM_BREAKER_MAX_DELAY'] = float(os.environ.get('LLM_BREAKER_MAX_DELAY', 120))
+# Gesicherte Feedback-Aufrufe: zweite Anfrage, wenn nach dem 90. Perzentil der Latenz keine Antwort da ist
+app.config['LLM_HEDGE_PERCENTILE'] = float(os.environ.get('LLM_HEDGE_PERCENTILE', 0.9))  # 0 = aus
+app.config['LLM_HEDGE_MAX_RATE'] = float(os.environ.get('LLM_HEDGE_MAX_RATE', 0.1))  # Max. 10% zusätzliche Anfragen
+app.config['LLM_HEDGE_MIN_SAMPLES'] = int(os.environ.get('LLM_HEDGE_MIN_SAMPLES', 20))  # Messwerte vor dem ersten Hedge
+
+llm_client = LLMClient(
+    api_key=app.config['OPENAI_API_KEY'],
+    base_url=app.config['OPENAI_API_BASE'],
+    connect_timeout=app.config['LLM_CONNECT_TIMEOUT'],
+    read_timeout=app.config['LLM_READ_TIMEOUT'],
+    pool_connections=app.config['LLM_POOL_CONNECTIONS'],
+    pool_maxsize=app.config['LLM_POOL_MAXSIZE'],
+    max_concurrent=app.config['LLM_MAX_CONCURRENT'] or None,
+    queue_timeout=app.config['LLM_QUEUE_TIMEOUT'],
+    breaker=CircuitBreaker(
+        failure_threshold=app.config['LLM_BREAKER_FAILURES'],
+        base_delay=app.config['LLM_BREAKER_BASE_DELAY'],
+        max_delay=app.config['LLM_BREAKER_MAX_DELAY']
+    ),
+    hedge_percentile=app.config['LLM_HEDGE_PERCENTILE'] or None,
+    hedge_max_rate=app.config['LLM_HEDGE_MAX_RATE'],
+    hedge_min_samples=app.config['LLM_HEDGE_MIN_SAMPLES']
+)
 
 db = SQLAlchemy(app)
 login_manager = LoginManager(app)
@@ -96,6 +204,11 @@ class Presentation(db.Model):
     cached_ai_content = db.Column(db.Text)  # Deprecated - wird durch static_info_content ersetzt
     static_info_content = db.Column(db.Text)  # Statische Info-Seite (einmal generiert)
     feedback_content = db.Column(db.Text)     # Dynamischer Feedback-Bereich
+    feedback_items = db.Column(db.Text, nullable=True)  # Strukturierter Feedback-Bereich (JSON), Quelle für feedback_content
+    static_info_html = db.Column(db.Text)     # Vorgerendertes HTML der Info-Seite
+    static_info_digest = db.Column(db.Text, nullable=True)  # Kurzfassung für Feedback-Prompts
+    static_info_digest_hash = db.Column(db.String(64), nullable=True)  # SHA-256 der Info-Seite, zu der die Kurzfassung gehört
+    feedback_html = db.Column(db.Text)        # Vorgerendertes HTML des Feedback-Bereichs
     last_updated = db.Column(db.DateTime)
     processing_scheduled = db.Column(db.Boolean, default=False)
     next_processing_time = db.Column(db.DateTime)
@@ -112,6 +225,15 @@ class Presentation(db.Model):
     # Live info visibility for public view
     live_info_visible = db.Column(db.Boolean, default=False, nullable=False)  # Sichtbarkeit der Live-Info für Zuhörer
     
+    # Hintergrund-Job für die Info-Seite
+    static_info_job_status = db.Column(db.String(20), nullable=True)  # None, 'queued', 'running', 'failed'
+    static_info_job_generation = db.Column(db.Integer, default=0, nullable=False)  # Steigt mit jeder Anforderung
+    static_info_job_error = db.Column(db.Text, nullable=True)
+    static_info_job_requested_at = db.Column(db.DateTime, nullable=True)
+    
+    # Inhaltsversion für Caching und ETags (steigt bei jeder Änderung der Live-Info)
+    content_version = db.Column(db.Integer, default=0, nullable=False)
+    
     # Feedback control
     feedback_disabled = db.Column(db.Boolean, default=False, nullable=False)  # Feedback-Eingabe sperren/entsperren
     
@@ -120,6 +242,63 @@ class Presentation(db.Model):
     deleted_at = db.Column(db.DateTime, nullable=True)
     deleted_by_user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=True)
     
+    def bump_content_version(self):
+        """Erhöht die Inhaltsversion atomar in der Datenbank"""
+        self.content_version = Presentation.content_version + 1
+    
+    def set_static_info_content(self, content):
+        """Setzt die Info-Seite samt vorgerendertem HTML"""
+        self.static_info_content = content
+        self.static_info_html = render_markdown_html(content)
+        self.static_info_digest = build_static_info_digest(content)
+        self.static_info_digest_hash = static_info_digest_hash(content)
+        self.bump_content_version()
+    
+    def set_feedback_content(self, content):
+        """Setzt den Feedback-Bereich samt vorgerendertem HTML"""
+        self.feedback_content = content
+        self.feedback_html = render_markdown_html(content)
+        self.bump_content_version()
+    
+    def get_feedback_items(self):
+        """Strukturierter Feedback-Bereich (übernimmt ältere, frei generierte Bereiche)"""
+        if self.feedback_items:
+            return json.loads(self.feedback_items)
+        return feedback_items_from_markdown(self.feedback_content)
+    
+    def set_feedback_items(self, items):
+        """Speichert den strukturierten Feedback-Bereich und rendert daraus feedback_content"""
+        self.feedback_items = json.dumps(items, ensure_ascii=False) if items else None
+        self.set_feedback_content(render_feedback_items(items) if items else None)
+    
+    def request_static_info_regeneration(self):
+        """Fordert eine neue Info-Seite an - der Job wird nach dem Commit mit submit_static_info_job gestartet"""
+        self.static_info_job_generation = Presentation.static_info_job_generation + 1
+        self.static_info_job_status = 'queued'
+        self.static_info_job_error = None
+        self.static_info_job_requested_at = datetime.utcnow()
+        self.bump_content_version()
+    
+    def get_static_info_digest(self):
+        """Kurzfassung der Info-Seite - wird nur bei geänderter Info-Seite neu erzeugt"""
+        content_hash = static_info_digest_hash(self.static_info_content)
+        if self.static_info_digest_hash != content_hash:
+            self.static_info_digest = build_static_info_digest(self.static_info_content)
+            self.static_info_digest_hash = content_hash
+        return self.static_info_digest
+    
+    def get_static_info_html(self):
+        """HTML der Info-Seite (rendert nur bei noch nicht befüllter Spalte)"""
+        if self.static_info_html is None and self.static_info_content:
+            return render_markdown_html(self.static_info_content)
+        return self.static_info_html or ""
+    
+    def get_feedback_html(self):
+        """HTML des Feedback-Bereichs (rendert nur bei noch nicht befüllter Spalte)"""
+        if self.feedback_html is None and self.feedback_content:
+            return render_markdown_html(self.feedback_content)
+        return self.feedback_html or ""
+    
     # Soft Delete Helper Methods
     def soft_delete(self, deleted_by_user_id):
         """Markiert die Präsentation als gelöscht"""
@@ -146,6 +325,14 @@ class Presentation(db.Model):
         """Gibt eine aktive Präsentation anhand des Access Codes zurück"""
         return cls.query.filter_by(access_code=access_code, is_deleted=False).first()
     
+    @classmethod
+    def lookup_access_code(cls, access_code):
+        """Gibt den gecachten Eintrag einer aktiven Präsentation zurück (oder None)"""
+        entry = access_code_cache.get(access_code)
+        if not entry or entry.is_deleted:
+            return None
+        return entry
+    
     @classmethod
     def get_active_by_user(cls, user_id):
         """Gibt alle aktiven Präsentationen eines Benutzers zurück"""
@@ -160,6 +347,124 @@ class Feedback(db.Model):
     ai_response = db.Column(db.Text)
     participant_name = db.Column(db.String(100), nullable=True)
 
+    # Unverarbeitetes Feedback finden (Verarbeitung, Wiederherstellung nach Neustart)
+    __table_args__ = (db.Index('ix_feedback_is_processed', 'is_processed', 'presentation_id'),)
+
+class ProcessingQueueEntry(db.Model):
+    """Dauerhafte Planung der Feedback-Verarbeitung - überlebt Neustarts und Deployments.
+
+    Der Verarbeitungsthread arbeitet mit der Warteschlange im Speicher; diese Tabelle
+    hält dieselben Fälligkeiten fest, damit sie nach einem Neustart wiederhergestellt
+    werden können (recover_processing_queue).
+    """
+    __tablename__ = 'processing_queue'
+    presentation_id = db.Column(db.Integer, db.ForeignKey('presentation.id'), primary_key=True)
+    due_at = db.Column(db.DateTime, nullable=False, index=True)
+    attempts = db.Column(db.Integer, default=0, nullable=False)  # Fehlgeschlagene Versuche seit dem letzten Erfolg
+    lease_owner = db.Column(db.String(64))                       # Prozess, der die Präsentation gerade verarbeitet
+    lease_expires_at = db.Column(db.DateTime)
+
+# Cache für Access-Code-Lookups
+AccessCodeEntry = namedtuple('AccessCodeEntry', ['id', 'is_deleted', 'feedback_disabled', 'live_info_visible'])
+
+class AccessCodeCache:
+    """Begrenzter LRU/TTL-Cache für access_code -> AccessCodeEntry.
+
+    Invalidierungen werden über eine Signaldatei an alle Prozesse verteilt:
+    Jede Invalidierung hängt ein Byte an, jeder Lookup vergleicht mtime und
+    Größe per stat() und leert bei Änderungen den lokalen Cache.
+    """
+
+    def __init__(self, max_size, ttl, signal_file):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.signal_file = signal_file
+        self._entries = OrderedDict()  # access_code -> (expires_at, entry)
+        self._lock = threading.Lock()
+        self._signal_state = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def _read_signal_state(self):
+        try:
+            stat = os.stat(self.signal_file)
+            return (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            return None
+
+    def get(self, access_code):
+        now = time.monotonic()
+        signal_state = self._read_signal_state()
+        with self._lock:
+            if signal_state != self._signal_state:
+                # Ein anderer Prozess hat invalidiert
+                self._entries.clear()
+                self._signal_state = signal_state
+
+            cached = self._entries.get(access_code)
+            if cached and cached[0] > now:
+                self._entries.move_to_end(access_code)
+                self.hits += 1
+                return cached[1]
+            self.misses += 1
+
+        row = db.session.query(
+            Presentation.id, Presentation.is_deleted,
+            Presentation.feedback_disabled, Presentation.live_info_visible
+        ).filter_by(access_code=access_code).first()
+        entry = AccessCodeEntry(*row) if row else None
+
+        with self._lock:
+            # Nicht speichern, wenn während der Abfrage invalidiert wurde
+            if self._signal_state == signal_state:
+                self._entries[access_code] = (now + self.ttl, entry)
+                self._entries.move_to_end(access_code)
+                while len(self._entries) > self.max_size:
+                    self._entries.popitem(last=False)
+        return entry
+
+    def invalidate(self, access_code):
+        """Nach dem Commit aufrufen - gilt für alle Prozesse"""
+        with self._lock:
+            self._entries.pop(access_code, None)
+            self.invalidations += 1
+        try:
+            os.makedirs(os.path.dirname(self.signal_file), exist_ok=True)
+            with open(self.signal_file, 'ab') as signal:
+                signal.write(b'.')
+                if signal.tell() > 4096:
+                    signal.truncate(0)
+        except OSError as e:
+            print(f"Warnung: Access-Code-Cache konnte nicht prozessübergreifend invalidiert werden: {e}")
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_size': self.max_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else None,
+                'invalidations': self.invalidations
+            }
+
+access_code_cache = AccessCodeCache(
+    max_size=app.config['ACCESS_CODE_CACHE_SIZE'],
+    ttl=app.config['ACCESS_CODE_CACHE_TTL'],
+    signal_file=os.path.join(app.instance_path, 'access_code_cache.signal')
+)
+
+class StaticInfoCacheEntry(db.Model):
+    """Generierte Info-Seite, adressiert über einen Hash aller Eingaben"""
+    __tablename__ = 'static_info_cache'
+    key = db.Column(db.String(64), primary_key=True)
+    content = db.Column(db.Text, nullable=False)
+    size = db.Column(db.Integer, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    last_used_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+
 @login_manager.user_loader
 def load_user(user_id):
     return User.query.get(int(user_id))
@@ -191,6 +496,170 @@ def markdown_to_html(text):
     cleaned_text = clean_markdown_response(text)
     return Markup(markdown.markdown(cleaned_text, extensions=['tables']))
 
+def render_markdown_html(text):
+    """Rendert Markdown einmalig beim Schreiben für die HTML-Spalten"""
+    if not text:
+        return None
+    return str(markdown_to_html(text))
+
+# Cache für gerendertes HTML der Live-Info-Endpunkte
+class RenderedHtmlCache:
+    """Hält gerendertes HTML pro (Präsentation, Variante) und Inhaltsversion vor.
+
+    Gleichzeitige Cache-Misses für denselben Schlüssel werden zusammengefasst,
+    sodass pro Schlüssel immer nur ein Rendering gleichzeitig läuft.
+    """
+
+    def __init__(self):
+        self._entries = {}       # (presentation_id, variant) -> (version, html)
+        self._render_locks = {}  # (presentation_id, variant) -> Lock
+        self._lock = threading.Lock()
+
+    def get_or_render(self, presentation_id, variant, version, render):
+        key = (presentation_id, variant)
+        entry = self._entries.get(key)
+        if entry and entry[0] == version:
+            return entry[1]
+
+        with self._lock:
+            render_lock = self._render_locks.setdefault(key, threading.Lock())
+
+        with render_lock:
+            # Ein anderer Thread hat eventuell gerade gerendert
+            entry = self._entries.get(key)
+            if entry and entry[0] == version:
+                return entry[1]
+
+            html = render()
+            with self._lock:
+                self._entries[key] = (version, html)
+            return html
+
+    def invalidate(self, presentation_id):
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == presentation_id]:
+                del self._entries[key]
+
+rendered_html_cache = RenderedHtmlCache()
+
+class ContentChangeNotifier:
+    """Weckt wartende Event-Streams einer Präsentation bei Änderungen (prozesslokal).
+
+    Andere Prozesse erkennen Änderungen über die regelmäßige Versionsprüfung
+    in den Streams, dieser Mechanismus sorgt nur für sofortige Zustellung.
+    Einträge gibt es nur für Präsentationen mit offenen Streams; sie werden
+    entfernt, sobald sich der letzte Stream abmeldet.
+    """
+
+    def __init__(self):
+        self._conditions = {}  # presentation_id -> Condition
+        self._counters = {}
+        self._subscribers = {}
+        self._lock = threading.Lock()
+
+    def subscribe(self, presentation_id):
+        """Meldet einen Stream an und gibt den aktuellen Zählerstand zurück"""
+        with self._lock:
+            self._conditions.setdefault(presentation_id, threading.Condition())
+            self._subscribers[presentation_id] = self._subscribers.get(presentation_id, 0) + 1
+            return self._counters.setdefault(presentation_id, 0)
+
+    def unsubscribe(self, presentation_id):
+        """Meldet einen Stream ab. True, wenn es der letzte der Präsentation war"""
+        with self._lock:
+            remaining = self._subscribers.get(presentation_id, 0) - 1
+            if remaining > 0:
+                self._subscribers[presentation_id] = remaining
+                return False
+            self._subscribers.pop(presentation_id, None)
+            self._conditions.pop(presentation_id, None)
+            self._counters.pop(presentation_id, None)
+            return True
+
+    def counter(self, presentation_id):
+        return self._counters.get(presentation_id, 0)
+
+    def notify(self, presentation_id):
+        with self._lock:
+            condition = self._conditions.get(presentation_id)
+        if condition is None:
+            return  # Kein offener Stream in diesem Prozess
+        with condition:
+            with self._lock:
+                if presentation_id in self._counters:
+                    self._counters[presentation_id] += 1
+            condition.notify_all()
+
+    def wait(self, presentation_id, since, timeout):
+        """Wartet bis zur nächsten Änderung nach `since` oder bis zum Timeout (nur angemeldet)"""
+        with self._lock:
+            condition = self._conditions[presentation_id]
+        with condition:
+            condition.wait_for(lambda: self.counter(presentation_id) != since, timeout)
+            return self.counter(presentation_id)
+
+    def stats(self):
+        with self._lock:
+            return {'presentations': len(self._subscribers), 'streams': sum(self._subscribers.values())}
+
+content_change_notifier = ContentChangeNotifier()
+
+def notify_content_changed(presentation_id):
+    """Verwirft gecachtes HTML und benachrichtigt offene Event-Streams"""
+    rendered_html_cache.invalidate(presentation_id)
+    content_change_notifier.notify(presentation_id)
+
+def render_public_live_info(presentation):
+    """Rendert die Live-Info für Zuhörer (gecacht)"""
+    def render():
+        # Vorgerenderte Info-Seite und Feedback-Bereich kombinieren
+        static_html = presentation.get_static_info_html()
+        feedback_html = presentation.get_feedback_html()
+
+        if static_html and feedback_html:
+            return f"{static_html}\n{feedback_html}"
+        elif static_html:
+            return static_html
+        elif feedback_html:
+            return feedback_html
+        return "<p>Noch keine Inhalte verfügbar.</p>"
+
+    return rendered_html_cache.get_or_render(presentation.id, 'public', presentation.content_version, render)
+
+def render_presenter_ai_content(presentation):
+    """Rendert die Präsentator-Ansicht aus Info-Seite und Feedback-Bereich (gecacht)"""
+    def render():
+        # Vorgerenderte Info-Seite hinzufügen
+        combined_html = presentation.get_static_info_html()
+
+        # Feedback-Bereich hinzufügen (falls vorhanden)
+        feedback_html = presentation.get_feedback_html()
+        if feedback_html:
+            combined_html += "\n<hr />\n<h1>Feedback der Zuhörer</h1>\n" + feedback_html
+
+        return combined_html
+
+    return rendered_html_cache.get_or_render(presentation.id, 'presenter', presentation.content_version, render)
+
+# Bedingte GET-Anfragen (ETag / If-None-Match)
+def make_etag(*parts):
+    """Erzeugt einen starken ETag-Wert aus den gegebenen Bestandteilen"""
+    return '-'.join(str(part) for part in parts)
+
+def conditional_json_response(etag, build_payload, private=False):
+    """Antwortet mit 304, wenn der Client den ETag bereits kennt - sonst mit JSON.
+
+    build_payload wird nur aufgerufen, wenn tatsächlich ein Body gesendet wird,
+    damit der 304-Pfad weder Markdown rendert noch JSON serialisiert.
+    """
+    if etag in request.if_none_match:
+        response = app.response_class(status=304)
+    else:
+        response = jsonify(build_payload())
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'private, no-cache' if private else 'no-cache'
+    return response
+
 # Rate-Limiting Hilfsfunktion
 def check_ai_rate_limit(user_id):
     """Überprüft, ob der Benutzer das AI-Rate-Limit erreicht hat"""
@@ -245,13 +714,154 @@ def check_duplicate_additional_info(existing_info, new_info, similarity_threshol
 
 # KI-Integration
 
+# Version des Prompts für die Info-Seite - bei Prompt-Änderungen erhöhen, damit der Cache neu erzeugt
+STATIC_INFO_PROMPT_VERSION = 1
+STATIC_INFO_MODEL = "gpt-4.1"
+
+class StaticInfoResultCache:
+    """Inhaltsadressierter Cache für generierte Info-Seiten in SQLite.
+
+    Identische Eingaben liefern sofort das gespeicherte Ergebnis, identische
+    gleichzeitige Anfragen teilen sich einen einzigen laufenden KI-Aufruf.
+    Lesen und Schreiben laufen über eigene Verbindungen, damit die Transaktion
+    der aufrufenden Route unberührt bleibt.
+    """
+
+    def __init__(self, max_bytes, wait_timeout):
+        self.max_bytes = max_bytes
+        self.wait_timeout = wait_timeout
+        self._in_flight = {}  # key -> Future
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(*inputs):
+        return hashlib.sha256(json.dumps(inputs, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+    def lookup(self, key):
+        """Liefert ein gespeichertes Ergebnis (oder None) und markiert es als benutzt"""
+        table = StaticInfoCacheEntry.__table__
+        try:
+            with db.engine.begin() as conn:
+                cached = conn.execute(db.select(table.c.content).where(table.c.key == key)).scalar()
+                if cached is not None:
+                    conn.execute(table.update().where(table.c.key == key).values(last_used_at=datetime.utcnow()))
+        except Exception as e:
+            print(f"Warnung: Info-Seiten-Cache nicht lesbar: {e}")
+            return None
+
+        if cached is not None:
+            self.hits += 1
+        return cached
+
+    def get_or_generate(self, key, generate):
+        cached = self.lookup(key)
+        if cached is not None:
+            return cached
+
+        with self._lock:
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not owner:
+            # Identischer Aufruf läuft bereits - Ergebnis teilen
+            self.shared += 1
+            try:
+                return future.result(timeout=self.wait_timeout)
+            except Exception:
+                return None
+
+        self.misses += 1
+        result = None
+        try:
+            result = generate()
+            if result is not None:
+                self.store(key, result)
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            future.set_result(result)
+        return result
+
+    def store(self, key, content):
+        table = StaticInfoCacheEntry.__table__
+        now = datetime.utcnow()
+        size = len(content.encode('utf-8'))
+        try:
+            with db.engine.begin() as conn:
+                conn.execute(table.delete().where(table.c.key == key))
+                conn.execute(table.insert().values(key=key, content=content, size=size, created_at=now, last_used_at=now))
+
+                # Größenbasierte Verdrängung: am längsten ungenutzte Einträge zuerst
+                total = conn.execute(db.select(db.func.sum(table.c.size))).scalar() or 0
+                if total > self.max_bytes:
+                    rows = conn.execute(
+                        db.select(table.c.key, table.c.size).order_by(table.c.last_used_at)
+                    ).fetchall()
+                    for row in rows:
+                        if total <= self.max_bytes or row.key == key:
+                            break
+                        conn.execute(table.delete().where(table.c.key == row.key))
+                        total -= row.size
+                        self.evictions += 1
+        except Exception as e:
+            print(f"Warnung: Info-Seite konnte nicht gecacht werden: {e}")
+
+    def stats(self):
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'shared_in_flight': self.shared,
+            'evictions': self.evictions,
+            'max_bytes': self.max_bytes
+        }
+
+static_info_result_cache = StaticInfoResultCache(
+    max_bytes=app.config['STATIC_INFO_CACHE_MAX_BYTES'],
+    wait_timeout=app.config['STATIC_INFO_CACHE_WAIT_TIMEOUT']
+)
+
+def static_info_cache_key(title, description, context, content, additional_info=None):
+    return StaticInfoResultCache.make_key(
+        title, description, context, content, additional_info,
+        STATIC_INFO_MODEL, STATIC_INFO_PROMPT_VERSION
+    )
+
 def generate_static_info_content(title, description, context, content, additional_info=None):
-    """Generiert statische Info-Seite basierend auf Präsentationsdaten."""
+    """Generiert statische Info-Seite basierend auf Präsentationsdaten (mit Cache)."""
+    key = static_info_cache_key(title, description, context, content, additional_info)
+    return static_info_result_cache.get_or_generate(
+        key,
+        lambda: request_static_info_content(title, description, context, content, additional_info)
+    )
+
+def request_static_info_content(title, description, context, content, additional_info=None):
+    """Fragt die statische Info-Seite bei der KI an (ohne Cache)."""
     print("\n--- Statische Info-Generierung ---")
     print(f"Titel: {title}")
     print(f"Beschreibung: {description}")
     print("----------------------------------\n")
     
+    try:
+        ai_response = llm_client.chat_completion(
+            model=STATIC_INFO_MODEL,
+            messages=build_static_info_messages(title, description, context, content, additional_info),
+            max_tokens=5000
+        )
+        cleaned_response = clean_markdown_response(ai_response)
+        return cleaned_response
+    except LLMError as e:
+        print(f"Fehler bei der statischen Info-Generierung: {str(e)}")
+        return None
+
+def build_static_info_messages(title, description, context, content, additional_info=None):
+    """Prompt für die statische Info-Seite (gemeinsam für normale und gestreamte Aufrufe)"""
     additional_section = ""
     if additional_info:
         additional_section = f"""
@@ -285,143 +895,631 @@ def generate_static_info_content(title, description, context, content, additiona
     {content}{additional_section}
     """
     
+    return [
+        {"role": "system", "content": "Du bist ein Experte für die Erstellung von informativen und gut strukturierten Präsentationsinhalten im Markdown-Format. Erstelle klare, sachliche Inhalte basierend auf den gegebenen Informationen."},
+        {"role": "user", "content": prompt}
+    ]
+
+UNVERIFIED_LINKS_HEADING = "## ⚠️ Ungeprüfte Links"
+
+# Kategorien des Feedback-Bereichs in Anzeigereihenfolge: (Schlüssel im JSON, Überschrift)
+FEEDBACK_CATEGORIES = [
+    ('facts', 'Faktische Informationen'),
+    ('questions', 'Fragen'),
+    ('answers', 'Antworten auf Fragen'),
+    ('positive', 'Positive Kommentare'),
+    ('other', 'Sonstige Kommentare')
+]
+FEEDBACK_CATEGORY_KEYS = [key for key, _ in FEEDBACK_CATEGORIES]
+
+URL_PATTERN = re.compile(r'https?://[^\s<>()\[\]"\']+')
+
+def estimate_tokens(text):
+    """Grobe Token-Schätzung (ca. 4 Zeichen pro Token) - genügt für Schwellwerte"""
+    return (len(text) + 3) // 4 if text else 0
+
+def extract_urls(text):
+    """Alle URLs eines Textes (ohne abschließende Satzzeichen), in Reihenfolge, ohne Duplikate"""
+    urls = [url.rstrip('.,;:!?') for url in URL_PATTERN.findall(text or '')]
+    return list(dict.fromkeys(urls))
+
+def empty_feedback_items():
+    return {'next_id': 1, 'preamble': None, 'items': [], 'links': []}
+
+def split_link_section(feedback_content):
+    """Trennt die Sektion 'Ungeprüfte Links' ab: (restlicher Inhalt, Liste der Link-Zeilen)"""
+    if not feedback_content:
+        return feedback_content, []
+    
+    body_lines = []
+    link_lines = []
+    in_links = False
+    for line in feedback_content.splitlines():
+        if line.startswith('## ') or line.startswith('# '):
+            in_links = line.strip() == UNVERIFIED_LINKS_HEADING
+            if in_links:
+                continue
+        if in_links:
+            if line.strip():
+                link_lines.append(line.rstrip())
+        else:
+            body_lines.append(line)
+    return '\n'.join(body_lines).strip(), link_lines
+
+def feedback_items_from_markdown(feedback_content):
+    """Übernimmt einen bisher frei generierten Feedback-Bereich in die strukturierte Form.
+    
+    Der Text bleibt als Vorspann erhalten, die Link-Sektion wird in einzelne Links zerlegt.
+    """
+    items = empty_feedback_items()
+    if not feedback_content:
+        return items
+    
+    body, link_lines = split_link_section(feedback_content)
+    items['preamble'] = body or None
+    for line in link_lines:
+        description = re.search(r'\[([^\]]*)\]', line)
+        for url in extract_urls(line):
+            items['links'].append({'url': url, 'description': description.group(1) if description else ''})
+    return items
+
+def render_feedback_items(items):
+    """Rendert den strukturierten Feedback-Bereich deterministisch als Markdown"""
+    sections = []
+    if items.get('preamble'):
+        sections.append(items['preamble'])
+    
+    for key, heading in FEEDBACK_CATEGORIES:
+        entries = [item for item in items['items'] if item['category'] == key]
+        if not entries:
+            continue
+        lines = []
+        for item in entries:
+            suffix = f" ({item['count']}×)" if item.get('count', 1) > 1 else ""
+            lines.append(f"- {item['text']}{suffix}")
+        sections.append(f"## {heading}\n\n" + '\n'.join(lines))
+    
+    if items['links']:
+        lines = [
+            f"- [{link['description'] or link['url']}]({link['url']})"
+            for link in items['links']
+        ]
+        sections.append(f"{UNVERIFIED_LINKS_HEADING}\n\n" + '\n'.join(lines))
+    
+    return '\n\n'.join(sections)
+
+def parse_json_response(text):
+    """Liest eine JSON-Antwort des Modells (auch in Code-Block-Markierungen)"""
+    data = json.loads(clean_markdown_response(text).removeprefix('json').strip())
+    if not isinstance(data, dict):
+        raise ValueError("JSON-Objekt erwartet")
+    return data
+
+def clean_item_text(text):
+    """Entfernt URLs aus Eintragstexten - Links gehören nur in die Link-Sektion"""
+    text = URL_PATTERN.sub('', str(text or ''))
+    return re.sub(r'\s+', ' ', text).strip(' -')
+
+def merge_feedback_items(items, result, feedbacks, member_links=()):
+    """Fügt die vom Modell gelieferten neuen Einträge in den bestehenden Bereich ein.
+    
+    Verweise auf bestehende Einträge ('duplicate_of') erhöhen nur deren Zähler. Links
+    werden nur übernommen, wenn die URL tatsächlich in einem der Feedbacks steht.
+    member_links (URL, Beschreibung) stammen aus Feedbacks, deren URLs das Modell nicht
+    gesehen hat (weitere Mitglieder eines Themen-Clusters), und werden direkt übernommen.
+    """
+    merged = json.loads(json.dumps(items))
+    by_id = {item['id']: item for item in merged['items']}
+    
+    for entry in result.get('items') or []:
+        if not isinstance(entry, dict):
+            continue
+        count = entry.get('count') if isinstance(entry.get('count'), int) and entry['count'] > 0 else 1
+        duplicate_of = entry.get('duplicate_of')
+        if duplicate_of in by_id:
+            by_id[duplicate_of]['count'] = by_id[duplicate_of].get('count', 1) + count
+            continue
+        text = clean_item_text(entry.get('text'))
+        if not text:
+            continue
+        category = entry.get('category') if entry.get('category') in FEEDBACK_CATEGORY_KEYS else 'other'
+        item = {'id': merged['next_id'], 'category': category, 'text': text, 'count': count}
+        merged['next_id'] += 1
+        merged['items'].append(item)
+        by_id[item['id']] = item
+    
+    feedback_urls = set()
+    for feedback in feedbacks:
+        feedback_urls.update(extract_urls(feedback.content))
+    known_urls = {link['url'] for link in merged['links']}
+    for link in result.get('links') or []:
+        if not isinstance(link, dict):
+            continue
+        url = str(link.get('url') or '').rstrip('.,;:!?')
+        if url in feedback_urls and url not in known_urls:
+            merged['links'].append({'url': url, 'description': clean_item_text(link.get('description'))})
+            known_urls.add(url)
+    for url, description in member_links:
+        if url not in known_urls:
+            merged['links'].append({'url': url, 'description': description})
+            known_urls.add(url)
+    
+    return merged
+
+def format_items_for_prompt(items):
+    """Kompakte Liste der bestehenden Einträge als Kontext für das Modell"""
+    lines = []
+    if items.get('preamble'):
+        lines.append(items['preamble'])
+    for item in items['items']:
+        lines.append(f"[{item['id']}] ({item['category']}) {item['text']}")
+    return '\n'.join(lines)
+
+# Häufige großgeschriebene Wörter, die keine Schlüsselbegriffe sind (Satzanfänge usw.)
+DIGEST_STOPWORDS = {
+    'Der', 'Die', 'Das', 'Den', 'Dem', 'Des', 'Ein', 'Eine', 'Einer', 'Eines', 'Einem', 'Einen',
+    'Und', 'Oder', 'Aber', 'Wenn', 'Dann', 'Diese', 'Dieser', 'Dieses', 'Diesem', 'Diesen',
+    'Es', 'Sie', 'Wir', 'Ihr', 'Ich', 'Er', 'Mit', 'Für', 'Von', 'Bei', 'Auf', 'Aus', 'Nach',
+    'Über', 'Unter', 'Durch', 'Auch', 'Dabei', 'Damit', 'Zudem', 'Außerdem', 'Zum', 'Zur',
+    'Im', 'In', 'Am', 'An', 'Als', 'Wie', 'Was', 'Wer', 'Welche', 'Welcher', 'Hier', 'Dort',
+    'Zusammenfassung', 'Einleitung', 'Fazit', 'Überblick', 'Inhalt', 'Informationen'
+}
+
+def build_static_info_digest(static_info_content, max_tokens=None):
+    """Kurzfassung der Info-Seite für Feedback-Prompts: Gliederung plus Schlüsselbegriffe.
+    
+    Wird deterministisch (ohne KI-Aufruf) aus dem Markdown erzeugt und auf
+    max_tokens (geschätzt) begrenzt.
+    """
+    if not static_info_content:
+        return ""
+    max_tokens = max_tokens or app.config['STATIC_INFO_DIGEST_MAX_TOKENS']
+    
+    outline = []
+    for line in static_info_content.splitlines():
+        match = re.match(r'^(#{1,4})\s+(.*\S)', line)
+        if match:
+            level = len(match.group(1))
+            heading = re.sub(r'[*_`]', '', match.group(2))
+            outline.append(f"{'  ' * (level - 1)}- {heading}")
+    
+    # Hervorgehobene Begriffe zuerst, dann häufige Substantive
+    terms = [re.sub(r'\s+', ' ', term).strip() for term in
+             re.findall(r'\*\*([^*\n]{2,60})\*\*|`([^`\n]{2,40})`', static_info_content)
+             for term in term if term]
+    text = re.sub(r'^#.*$', '', static_info_content, flags=re.MULTILINE)
+    word_counts = defaultdict(int)
+    for word in re.findall(r'\b[A-ZÄÖÜ][\wäöüß-]{3,}\b', text):
+        if word not in DIGEST_STOPWORDS:
+            word_counts[word] += 1
+    emphasized = ' '.join(terms)
+    frequent = [word for word, count in sorted(word_counts.items(), key=lambda item: (-item[1], item[0]))
+                if count > 1 and word not in emphasized]
+    key_terms = list(dict.fromkeys(terms + frequent))
+    
+    # Gliederung höchstens 60% des Budgets, der Rest bleibt für die Schlüsselbegriffe
+    outline_budget = int(max_tokens * 4 * 0.6)
+    while outline and len('\n'.join(outline)) > outline_budget:
+        outline.pop()
+    digest = "Gliederung:\n" + '\n'.join(outline) if outline else ""
+    budget = max_tokens * 4 - len(digest)
+    selected = []
+    for term in key_terms:
+        budget -= len(term) + 2
+        if budget < len("Schlüsselbegriffe: "):
+            break
+        selected.append(term)
+    if selected:
+        digest += ("\n\n" if digest else "") + "Schlüsselbegriffe: " + ', '.join(selected)
+    
+    if estimate_tokens(digest) > max_tokens:
+        digest = digest[:max_tokens * 4].rsplit('\n', 1)[0]
+    return digest
+
+def static_info_digest_hash(static_info_content):
+    return hashlib.sha256((static_info_content or '').encode('utf-8')).hexdigest()
+
+# Laufzeitstatistik der Gruppierung (pro Prozess)
+feedback_clustering_stats = {'batches': 0, 'feedbacks': 0, 'prompt_lines': 0, 'last_ratio': None, 'last_duration_ms': None}
+
+def group_feedbacks_for_prompt(feedbacks):
+    """Fasst Feedbacks für den Prompt zusammen: erst Beinahe-Duplikate, bei großen
+    Batches zusätzlich Themen-Cluster. Gibt Cluster zurück - Listen von Duplikat-Gruppen,
+    ohne Clustering je eine Gruppe. Die Gruppe des Repräsentanten steht vorne.
+    """
+    start = time.perf_counter()
+    groups = group_near_duplicates(
+        feedbacks, text=lambda feedback: feedback.content,
+        threshold=app.config['FEEDBACK_DUPLICATE_THRESHOLD']
+    )
+    if len(groups) >= app.config['FEEDBACK_CLUSTER_MIN_BATCH']:
+        clusters = cluster_by_topic(
+            groups, text=lambda group: group[0].content,
+            threshold=app.config['FEEDBACK_CLUSTER_THRESHOLD']
+        )
+    else:
+        clusters = [[group] for group in groups]
+    
+    duration_ms = (time.perf_counter() - start) * 1000
+    ratio = len(feedbacks) / len(clusters) if clusters else None
+    feedback_clustering_stats['batches'] += 1
+    feedback_clustering_stats['feedbacks'] += len(feedbacks)
+    feedback_clustering_stats['prompt_lines'] += len(clusters)
+    feedback_clustering_stats['last_ratio'] = round(ratio, 2) if ratio else None
+    feedback_clustering_stats['last_duration_ms'] = round(duration_ms, 1)
+    if len(clusters) < len(feedbacks):
+        print(f"{len(feedbacks)} Feedbacks zu {len(clusters)} Prompt-Zeilen zusammengefasst "
+              f"(Kompression {ratio:.1f}x, {duration_ms:.0f}ms)")
+    return clusters
+
+def shorten_text(text, limit):
+    text = clean_item_text(text)
+    return text if len(text) <= limit else text[:limit].rstrip() + '…'
+
+def cluster_prompt_line(cluster):
+    """Prompt-Zeile (Text, Anzahl) für ein Cluster: der Repräsentant vollständig, die
+    übrigen Fragen des Clusters gekürzt dahinter, damit keine stillschweigend wegfällt"""
+    text = cluster[0][0].content
+    members = list(dict.fromkeys(
+        shorten_text(group[0].content, app.config['FEEDBACK_CLUSTER_MEMBER_CHARS']) for group in cluster[1:]
+    ))
+    shown = members[:app.config['FEEDBACK_CLUSTER_MAX_MEMBERS']]
+    if shown:
+        more = f"; {len(members) - len(shown)} weitere" if len(members) > len(shown) else ""
+        text += " (ähnlich: " + "; ".join(f'"{member}"' for member in shown) + more + ")"
+    return text, sum(len(group) for group in cluster)
+
+def cluster_member_links(clusters):
+    """URLs der weiteren Cluster-Mitglieder - sie stehen nicht im Prompt und werden
+    serverseitig in die Link-Sektion übernommen"""
+    links = []
+    for cluster in clusters:
+        shown = set(extract_urls(cluster[0][0].content))
+        for group in cluster[1:]:
+            description = shorten_text(group[0].content, app.config['FEEDBACK_CLUSTER_MEMBER_CHARS'])
+            links.extend((url, description) for url in extract_urls(group[0].content) if url not in shown)
+    return links
+
+# Laufzeitstatistik der Verdichtung (pro Prozess)
+feedback_compaction_stats = {'compactions': 0, 'failures': 0, 'tokens_before': 0, 'tokens_after': 0}
+
+def compact_feedback_items(items, deadline=None):
+    """Verdichtet die Einträge des Feedback-Bereichs, sobald sie die Schwelle überschreiten.
+    
+    Ältere Einträge werden in einem Zusammenfassungsdurchlauf zu kompakten Sammelpunkten
+    je Kategorie zusammengefasst, damit der Prompt pro Verarbeitungszyklus ungefähr gleich
+    groß bleibt. Links bleiben unverändert. Bei Fehlern bleiben die Einträge wie sie sind.
+    """
+    current = format_items_for_prompt(items)
+    tokens_before = estimate_tokens(current)
+    if tokens_before <= app.config['FEEDBACK_COMPACTION_THRESHOLD_TOKENS']:
+        return items
+    
+    target_tokens = app.config['FEEDBACK_COMPACTION_TARGET_TOKENS']
+    print(f"Feedback-Bereich wird verdichtet: ca. {tokens_before} Token -> Ziel {target_tokens}")
+    
+    prompt = f"""
+    Verdichte die folgenden Feedback-Einträge auf insgesamt höchstens ca. {int(target_tokens * 0.75)} Wörter.
+    
+    REGELN:
+    - Fasse ähnliche oder ältere Punkte zu kurzen Sammelpunkten zusammen (z.B. "Mehrere Zuhörer fragten nach ...")
+    - Beantwortete Fragen als Frage mit Kurzantwort zusammenfassen
+    - Zahlen, Fakten und offene Fragen bleiben erhalten
+    - Nichts hinzufügen, was nicht in den Einträgen steht
+    - Keine Links aufführen
+    - Kategorien: {', '.join(FEEDBACK_CATEGORY_KEYS)}
+    
+    Antworte ausschließlich mit JSON im Format:
+    {{"items": [{{"category": "questions", "text": "...", "count": 3}}]}}
+    ("count" = Anzahl der zusammengefassten Rückmeldungen)
+    
+    # Feedback-Einträge
+    {current}
+    """
+    
     try:
-        response = requests.post(
-            "https://api.openai.com/v1/chat/completions",
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {app.config['OPENAI_API_KEY']}"
-            },
-            json={
-                "model": "gpt-4.1",
-                "messages": [
-                    {"role": "system", "content": "Du bist ein Experte für die Erstellung von informativen und gut strukturierten Präsentationsinhalten im Markdown-Format. Erstelle klare, sachliche Inhalte basierend auf den gegebenen Informationen."},
-                    {"role": "user", "content": prompt}
-                ],
-                "max_tokens": 5000
-            }
+        ai_response = llm_client.chat_completion(
+            model="gpt-4.1-mini",
+            messages=[
+                {"role": "system", "content": "Du fasst Feedback-Einträge verlustarm zusammen. Inhalte verdichten, nichts erfinden, nur JSON ausgeben."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=target_tokens * 2,
+            response_format={"type": "json_object"},
+            deadline=deadline,
+            hedge=True
         )
-        response_data = response.json()
-        if 'choices' not in response_data:
-            print(f"Fehler bei der statischen Info-Generierung: {response_data}")
-            return None
-        
-        ai_response = response_data['choices'][0]['message']['content']
-        cleaned_response = clean_markdown_response(ai_response)
-        return cleaned_response
-    except Exception as e:
-        print(f"Fehler bei der statischen Info-Generierung: {str(e)}")
-        return None
+        result = parse_json_response(ai_response)
+    except (LLMError, ValueError) as e:
+        print(f"Fehler bei der Verdichtung des Feedback-Bereichs: {str(e)}")
+        feedback_compaction_stats['failures'] += 1
+        return items
+    
+    compacted = dict(items, preamble=None, items=[])
+    for entry in result.get('items') or []:
+        if not isinstance(entry, dict):
+            continue
+        text = clean_item_text(entry.get('text'))
+        if not text:
+            continue
+        category = entry.get('category') if entry.get('category') in FEEDBACK_CATEGORY_KEYS else 'other'
+        count = entry.get('count') if isinstance(entry.get('count'), int) and entry['count'] > 0 else 1
+        compacted['items'].append({'id': compacted['next_id'], 'category': category, 'text': text, 'count': count})
+        compacted['next_id'] += 1
+    
+    tokens_after = estimate_tokens(format_items_for_prompt(compacted))
+    if not compacted['items'] or tokens_after >= tokens_before:
+        feedback_compaction_stats['failures'] += 1
+        return items
+    
+    feedback_compaction_stats['compactions'] += 1
+    feedback_compaction_stats['tokens_before'] += tokens_before
+    feedback_compaction_stats['tokens_after'] += tokens_after
+    return compacted
 
-def generate_feedback_content(feedbacks, static_info_content, existing_feedback_content=None):
-    """Generiert dynamischen Feedback-Bereich basierend auf Zuhörer-Feedback."""
+def generate_feedback_items(feedbacks, static_info_digest, existing_items=None, errors=None):
+    """Ergänzt den strukturierten Feedback-Bereich um neue Zuhörer-Feedbacks.
+    
+    Das Modell liefert nur die neuen Einträge als JSON, der Bereich selbst wird
+    serverseitig zusammengeführt und gerendert. Passen die Feedbacks nicht in einen
+    Prompt, wird im Map-Reduce-Modus gearbeitet. Alle KI-Aufrufe eines Durchlaufs
+    teilen sich eine Deadline (feedback_deadline). Gibt None bei Fehlern zurück;
+    die Fehler werden dann an die Liste errors angehängt.
+    """
     print("\n--- Feedback-Bereich Generierung ---")
     print(f"Anzahl der Feedbacks: {len(feedbacks) if feedbacks else 0}")
     print("-----------------------------------\n")
     
+    items = existing_items or empty_feedback_items()
     if not feedbacks:
-        return ""
+        return items
     
-    prompt = f"""
-    WICHTIG: Du sollst den bestehenden Feedback-Bereich als BASIS nehmen und nur die NEUEN Feedbacks ERGÄNZEN!
-    
-    AUFGABE: Erweitere den bestehenden Feedback-Bereich um die neuen Feedbacks (nicht alles neu erstellen!).
-    
-    KRITISCHE REGEL: ALLE URLs/Links GEHÖREN NUR IN "## ⚠️ Ungeprüfte Links" - NIEMALS WOANDERS!
-    
-    VORGEHEN:
-    1. Nimm den bestehenden Feedback-Bereich als Grundlage
-    2. Füge die neuen Feedbacks in die passenden Sektionen ein
-    3. Erweitere bestehende Sektionen oder erstelle neue falls nötig
-    4. Fasse ähnliche neue Inhalte mit bestehenden zusammen
+    deadline = feedback_deadline()
+    items = compact_feedback_items(items, deadline)
     
-    LINK-BEHANDLUNG:
-    - Extrahiere ALLE URLs/Links aus den NEUEN Feedbacks
-    - Füge sie zur bestehenden "## ⚠️ Ungeprüfte Links" Sektion hinzu
-    - Format: "- [Beschreibung](URL) - Info" (jeder Link einzeln)
+    # Ähnliche Feedbacks nur einmal (mit Anzahl) aufführen - die Feedback-Zeilen selbst bleiben unverändert
+    clusters = group_feedbacks_for_prompt(feedbacks)
+    lines = [cluster_prompt_line(cluster) for cluster in clusters]
+    chunks = chunk_prompt_lines(lines, app.config['FEEDBACK_MAP_CHUNK_TOKENS'])
     
-    KATEGORISIERUNG (nur für NEUE Feedbacks):
-    - Faktische Informationen (Daten, Zahlen, Fakten - ABER KEINE LINKS!)
-    - Fragen (erkennbar an Fragezeichen oder Fragewörtern)
-    - Antworten auf vorherige Fragen
-    - Positive Kommentare und Meinungen  
-    - Sonstige relevante Kommentare
+    if len(chunks) == 1:
+        result = request_feedback_items(chunks[0], static_info_digest, items, errors, deadline)
+    else:
+        result = map_reduce_feedback_items(chunks, static_info_digest, items, errors, deadline)
+    if result is None:
+        return None
     
-    ABSOLUTES VERBOT:
-    - NIEMALS bestehende Inhalte löschen oder überschreiben
-    - NIEMALS Links außerhalb der "Ungeprüfte Links" Sektion
-    - NIEMALS Inhalte erfinden, die nicht aus den neuen Feedbacks ableitbar sind
+    return merge_feedback_items(items, result, feedbacks, cluster_member_links(clusters))
+
+def feedback_deadline():
+    """Deadline (time.monotonic) für einen Verarbeitungsdurchlauf: ein Bruchteil des
+    Verarbeitungsintervalls, damit ein langsamer Aufruf nicht auch den nächsten Slot blockiert"""
+    interval = app.config['FEEDBACK_PROCESSING_INTERVAL']
+    return time.monotonic() + interval * app.config['FEEDBACK_DEADLINE_FRACTION']
+
+def format_prompt_line(number, text, count):
+    multiplicity = f" ({count}×)" if count > 1 else ""
+    return f"{number}. NEUES FEEDBACK{multiplicity}: {text}"
+
+def chunk_prompt_lines(lines, max_tokens):
+    """Teilt Prompt-Zeilen (Text, Anzahl) in Abschnitte mit höchstens max_tokens (geschätzt)"""
+    chunks = []
+    current = []
+    current_tokens = 0
+    for text, count in lines:
+        tokens = estimate_tokens(format_prompt_line(len(current) + 1, text, count))
+        if current and current_tokens + tokens > max_tokens:
+            chunks.append(current)
+            current = []
+            current_tokens = 0
+        current.append((text, count))
+        current_tokens += tokens
+    if current:
+        chunks.append(current)
+    return chunks
+
+def request_feedback_items(lines, static_info_digest, items, errors=None, deadline=None):
+    """Ein KI-Aufruf für eine Liste von Prompt-Zeilen - liefert das JSON-Ergebnis oder None"""
+    prompt = f"""
+    AUFGABE: Ordne die NEUEN Zuhörer-Feedbacks ein. Gib NUR neue Einträge zurück - die bestehenden Einträge werden automatisch übernommen.
+    
+    KATEGORIEN:
+    - facts: Faktische Informationen (Daten, Zahlen, Fakten - ABER KEINE LINKS!)
+    - questions: Fragen (erkennbar an Fragezeichen oder Fragewörtern)
+    - answers: Antworten auf vorherige Fragen
+    - positive: Positive Kommentare und Meinungen
+    - other: Sonstige relevante Kommentare
+    
+    REGELN:
+    - Formuliere jeden Eintrag kurz und sachlich
+    - Sagt ein neues Feedback dasselbe wie ein bestehender Eintrag, gib nur {{"duplicate_of": <Nummer>}} zurück
+    - "count" = Anzahl der abgedeckten Feedbacks (mehrfach eingegangene Feedbacks sind mit "(N×)" markiert)
+    - Fasse gleichartige neue Feedbacks zu einem Eintrag zusammen
+    - URLs/Links NIEMALS in "text", sondern nur unter "links" (mit kurzer Beschreibung)
+    - Keine Inhalte erfinden, die nicht aus den neuen Feedbacks ableitbar sind
     
     IGNORIERE KOMPLETT, NICHT AUFFÜHREN!:
     - Beleidigungen, Spam, Off-Topic, Trolle, Werbung, Porn (sog. Erwachseneninhalte), Nicht zum Thema passende Inhalte (du kennst den Kontext, also ignoriere alles, was nicht zum Thema passt; z.b. Vortrag über KI, keine politischen Themen!)
     
-    # Info-Seite (als Kontext für Kategorisierung)
-    {static_info_content}
+    Antworte ausschließlich mit JSON im Format:
+    {{"items": [{{"category": "questions", "text": "...", "count": 1}}, {{"duplicate_of": 3, "count": 2}}],
+      "links": [{{"url": "https://...", "description": "..."}}]}}
+    
+    # Info-Seite in Kurzfassung (als Kontext für Kategorisierung)
+    {static_info_digest or "Keine Info-Seite vorhanden."}
     
-    # Bisheriger Feedback-Bereich (bereits verarbeitet)
-    {existing_feedback_content or "Noch kein Feedback vorhanden."}
+    # Bestehende Einträge [Nummer] (Kategorie) Text
+    {format_items_for_prompt(items) or "Noch kein Feedback vorhanden."}
     
-    # NEUE unverarbeitete Zuhörer-Feedbacks (zu dem obigen Bereich hinzufügen):
+    # NEUE unverarbeitete Zuhörer-Feedbacks:
     """
     
-    for i, feedback in enumerate(feedbacks, 1):
-        prompt += f"\n{i}. NEUES FEEDBACK: {feedback.content}"
+    for i, (text, count) in enumerate(lines, 1):
+        prompt += "\n" + format_prompt_line(i, text, count)
     
     try:
-        response = requests.post(
-            "https://api.openai.com/v1/chat/completions",
-            headers={
-                "Content-Type": "application/json",
-                "Authorization": f"Bearer {app.config['OPENAI_API_KEY']}"
-            },
-            json={
-                "model": "gpt-4.1-mini",
-                "messages": [
-                    {"role": "system", "content": "Du bist Experte für Feedback-Ergänzung. KRITISCH: 1) BESTEHENDEN Feedback-Bereich als BASIS nehmen 2) Nur NEUE Feedbacks ergänzen (nicht überschreiben!) 3) ALLE URLs/Links NUR in '## ⚠️ Ungeprüfte Links' (NIEMALS woanders!) 4) Links einzeln untereinander 5) Bestehende Inhalte NIEMALS löschen"},
-                    {"role": "user", "content": prompt}
-                ],
-                "max_tokens": 1500
-            }
+        ai_response = llm_client.chat_completion(
+            model="gpt-4.1-mini",
+            messages=[
+                {"role": "system", "content": "Du bist Experte für die Einordnung von Zuhörer-Feedback. Gib nur die NEUEN Einträge als JSON zurück, niemals den bestehenden Bereich. Links nur im Feld 'links'."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=1500,
+            response_format={"type": "json_object"},
+            deadline=deadline,
+            hedge=True
         )
-        response_data = response.json()
-        if 'choices' not in response_data:
-            print(f"Fehler bei der Feedback-Generierung: {response_data}")
-            return None
-        
-        ai_response = response_data['choices'][0]['message']['content']
-        cleaned_response = clean_markdown_response(ai_response)
-        return cleaned_response
-    except Exception as e:
+        return parse_json_response(ai_response)
+    except (LLMError, ValueError) as e:
         print(f"Fehler bei der Feedback-Generierung: {str(e)}")
+        if errors is not None:
+            errors.append(e)
         return None
 
+# Map-Reduce für sehr große Batches
+feedback_map_executor = None
+feedback_map_lock = threading.Lock()
+# Erfolgreiche Map-Ergebnisse überleben einen fehlgeschlagenen Zyklus, damit beim
+# nächsten Versuch nur die fehlgeschlagenen Abschnitte neu angefragt werden
+feedback_map_results = OrderedDict()
+FEEDBACK_MAP_RESULTS_MAX = 256
 
-def store_error_context(presentation_id, error_msg, previous_content, feedbacks):
-    """Speichert Fehlerkontext für spätere Wiederverwendung."""
-    if presentation_id:
-        try:
-            presentation = Presentation.query.get(presentation_id)
-            if presentation:
-                now = datetime.utcnow()
-                presentation.last_error_message = error_msg
-                presentation.last_error_time = now
-                
-                # Retry-Verzögerung: 10 Sekunden warten
-                from datetime import timedelta
-                presentation.retry_after = now + timedelta(seconds=10)
-                
-                # Kontext für Wiederverwendung speichern
-                # WICHTIG: Aktuellen Seiteninhalt verwenden (vor dem fehlgeschlagenen Update)
-                # Das ist der cached_ai_content OHNE die neuen Feedbacks
-                if presentation.cached_ai_content:
-                    presentation.failed_context = presentation.cached_ai_content
-                else:
-                    # Bei Ersterstellung Kontext aus Präsentation verwenden
-                    presentation.failed_context = f"## {presentation.title}\n\n{presentation.description or ''}"
-                
-                db.session.commit()
-        except Exception as e:
-            print(f"Fehler beim Speichern des Fehlerkontexts: {e}")
+def feedback_map_key(lines, items, static_info_digest):
+    """Cache-Schlüssel eines Map-Abschnitts. Verweise (duplicate_of) beziehen sich auf die
+    bestehenden Einträge - nach Verdichtung oder Zurücksetzen darf ein altes Ergebnis daher
+    nicht wiederverwendet werden, auch wenn next_id gleich ist"""
+    payload = [lines, items.get('items'), items['next_id'], static_info_digest]
+    return hashlib.sha256(json.dumps(payload, ensure_ascii=False, sort_keys=True).encode('utf-8')).hexdigest()
+
+def map_reduce_feedback_items(chunks, static_info_digest, items, errors=None, deadline=None):
+    """Map: Abschnitte parallel einordnen (nur fehlgeschlagene werden wiederholt).
+    Reduce: neue Einträge aller Abschnitte in einem Aufruf zusammenführen.
+    """
+    global feedback_map_executor
+    
+    with feedback_map_lock:
+        if feedback_map_executor is None:
+            feedback_map_executor = ThreadPoolExecutor(
+                max_workers=app.config['FEEDBACK_MAP_WORKERS'],
+                thread_name_prefix='feedback-map'
+            )
+        keys = [feedback_map_key(chunk, items, static_info_digest) for chunk in chunks]
+        results = {index: feedback_map_results[key] for index, key in enumerate(keys) if key in feedback_map_results}
+    
+    print(f"Map-Reduce: {len(chunks)} Abschnitte, {len(results)} bereits aus einem früheren Versuch vorhanden")
+    
+    for attempt in range(1 + app.config['FEEDBACK_MAP_RETRIES']):
+        pending = [index for index in range(len(chunks)) if index not in results]
+        if not pending:
+            break
+        if attempt > 0:
+            print(f"Map-Reduce: Wiederhole {len(pending)} fehlgeschlagene Abschnitte")
+        futures = {
+            index: feedback_map_executor.submit(request_feedback_items, chunks[index], static_info_digest, items, errors, deadline)
+            for index in pending
+        }
+        for index, future in futures.items():
+            result = future.result()
+            if result is not None:
+                results[index] = result
+                with feedback_map_lock:
+                    feedback_map_results[keys[index]] = result
+                    while len(feedback_map_results) > FEEDBACK_MAP_RESULTS_MAX:
+                        feedback_map_results.popitem(last=False)
+    
+    if len(results) < len(chunks):
+        print(f"Map-Reduce: {len(chunks) - len(results)} von {len(chunks)} Abschnitten fehlgeschlagen")
+        return None
+    
+    partials = [results[index] for index in range(len(chunks))]
+    combined = reduce_feedback_items(partials, items, deadline)
+    
+    with feedback_map_lock:
+        for key in keys:
+            feedback_map_results.pop(key, None)
+    return combined
+
+def reduce_feedback_items(partials, items, deadline=None):
+    """Führt die neuen Einträge mehrerer Abschnitte zusammen (Duplikate über Abschnittsgrenzen).
+    
+    Verweise auf bestehende Einträge und Links werden unverändert übernommen. Schlägt der
+    Reduce-Aufruf fehl, werden die Einträge ohne weitere Zusammenfassung übernommen.
+    """
+    new_entries = []
+    references = []
+    links = []
+    for partial in partials:
+        for entry in partial.get('items') or []:
+            if not isinstance(entry, dict):
+                continue
+            if entry.get('duplicate_of') is not None:
+                references.append(entry)
+            elif entry.get('text'):
+                new_entries.append(entry)
+        links.extend(partial.get('links') or [])
+    
+    if len(new_entries) < 2:
+        return {'items': references + new_entries, 'links': links}
+    
+    entry_lines = '\n'.join(
+        f"- ({entry.get('category', 'other')}, {entry.get('count', 1)}×) {entry['text']}" for entry in new_entries
+    )
+    prompt = f"""
+    Die folgenden Feedback-Einträge wurden abschnittsweise erstellt und können sich überschneiden.
+    Führe gleiche oder sehr ähnliche Einträge zusammen und addiere ihre Anzahl.
+    Entspricht ein Eintrag einem bestehenden Eintrag, gib {{"duplicate_of": <Nummer>, "count": <Anzahl>}} zurück.
+    Nichts hinzufügen, keine Links.
+    
+    Antworte ausschließlich mit JSON im Format:
+    {{"items": [{{"category": "questions", "text": "...", "count": 3}}, {{"duplicate_of": 3, "count": 2}}]}}
+    
+    # Bestehende Einträge [Nummer] (Kategorie) Text
+    {format_items_for_prompt(items) or "Noch kein Feedback vorhanden."}
+    
+    # Zusammenzuführende Einträge (Kategorie, Anzahl) Text
+    {entry_lines}
+    """
+    
+    try:
+        ai_response = llm_client.chat_completion(
+            model="gpt-4.1-mini",
+            messages=[
+                {"role": "system", "content": "Du führst Feedback-Einträge zusammen. Nichts erfinden, nur JSON ausgeben."},
+                {"role": "user", "content": prompt}
+            ],
+            max_tokens=1500,
+            response_format={"type": "json_object"},
+            deadline=deadline,
+            hedge=True
+        )
+        reduced = parse_json_response(ai_response)
+    except (LLMError, ValueError) as e:
+        print(f"Fehler beim Zusammenführen der Abschnitte (Einträge werden einzeln übernommen): {str(e)}")
+        return {'items': references + new_entries, 'links': links}
+    
+    return {'items': references + (reduced.get('items') or []), 'links': links}
+
+def feedback_retry_delay(attempts):
+    """Exponentieller Backoff pro Präsentation mit Streuung (attempts = bisherige Fehlversuche)"""
+    delay = min(app.config['FEEDBACK_RETRY_MAX_DELAY'], app.config['FEEDBACK_RETRY_DELAY'] * 2 ** attempts)
+    return delay * random.uniform(0.5, 1.0)
+
+def store_error_context(presentation, error, attempts=0):
+    """Speichert den Fehlerkontext eines fehlgeschlagenen KI-Aufrufs (ohne Commit).
+    
+    retry_after ist der spätere von eigenem Backoff und gemeinsamem Circuit Breaker -
+    bei einem gestörten Upstream testet so nur ein Aufruf, ob er wieder erreichbar ist.
+    Gibt retry_after zurück.
+    """
+    now = datetime.utcnow()
+    delay = max(feedback_retry_delay(attempts), llm_client.retry_after())
+    presentation.last_error_message = str(error) if error else 'Unbekannter Fehler bei der KI-Verarbeitung'
+    presentation.last_error_time = now
+    presentation.retry_after = now + timedelta(seconds=delay)
+    
+    # Stand vor dem fehlgeschlagenen Update (der bestehende Feedback-Bereich bleibt sichtbar)
+    presentation.failed_context = presentation.feedback_content
+    return presentation.retry_after
 
 # Routen
 @app.route('/')
@@ -511,12 +1609,13 @@ def new_presentation():
         
         db.session.add(presentation)
         db.session.commit()
+        # Ein zuvor gecachter Fehlschlag für diesen Code darf nicht mehr greifen
+        access_code_cache.invalidate(access_code)
         
-        # Statische Info-Seite generieren
-        static_info = generate_static_info_content(title, description, context, content)
-        if static_info:
-            presentation.static_info_content = static_info
-            db.session.commit()
+        # Statische Info-Seite im Hintergrund generieren
+        presentation.request_static_info_regeneration()
+        db.session.commit()
+        submit_static_info_job(presentation.id)
         
         return redirect(url_for('dashboard'))
     
@@ -574,25 +1673,16 @@ def edit_presentation(id):
         presentation.context = new_context
         presentation.content = new_content
         
-        # Statische Info-Seite neu generieren (wie bei neuer Präsentation)
-        try:
-            static_content = generate_static_info_content(
-                title=new_title,
-                description=new_description,
-                context=new_context,
-                content=new_content,
-                additional_info=presentation.additional_info
-            )
-            presentation.static_info_content = static_content
-            flash('Präsentation wurde erfolgreich aktualisiert und die statische Info-Seite neu generiert.', 'success')
-        except Exception as e:
-            print(f"Fehler bei der Generierung der statischen Info-Seite: {e}")
-            flash('Präsentation wurde aktualisiert, aber die statische Info-Seite konnte nicht neu generiert werden.', 'warning')
+        # Statische Info-Seite im Hintergrund neu generieren (wie bei neuer Präsentation)
+        presentation.request_static_info_regeneration()
         
         # Cache zurücksetzen, da sich der Inhalt geändert hat
         presentation.cached_ai_content = None
         
         db.session.commit()
+        notify_content_changed(presentation.id)
+        submit_static_info_job(presentation.id)
+        flash('Präsentation wurde aktualisiert. Die statische Info-Seite wird im Hintergrund neu generiert.', 'success')
         return redirect(url_for('view_presentation', id=id))
     
     return render_template('edit_presentation.html', presentation=presentation)
@@ -609,6 +1699,8 @@ def delete_presentation(id):
     # Soft Delete: Präsentation als gelöscht markieren, aber in DB behalten
     presentation.soft_delete(current_user.id)
     db.session.commit()
+    access_code_cache.invalidate(presentation.access_code)
+    content_change_notifier.notify(presentation.id)  # Offene Streams melden 'deleted'
     
     flash(f'Präsentation "{presentation.title}" wurde gelöscht.', 'success')
     return redirect(url_for('dashboard'))
@@ -638,20 +1730,17 @@ def add_additional_info(id):
             presentation.additional_info = f"--- Hinzugefügt am {datetime.utcnow().strftime('%d.%m.%Y %H:%M')} ---\n{additional_info.strip()}"
         
         # Statischen Inhalt neu generieren (da zusätzliche Infos in den statischen Bereich gehören)
-        if presentation.context and presentation.content:
-            static_content = generate_static_info_content(
-                title=presentation.title,
-                description=presentation.description,
-                context=presentation.context,
-                content=presentation.content,
-                additional_info=presentation.additional_info
-            )
-            if static_content is not None:
-                presentation.static_info_content = static_content
-                presentation.last_updated = datetime.utcnow()
+        regenerate = bool(presentation.context and presentation.content)
+        if regenerate:
+            presentation.request_static_info_regeneration()
         
         db.session.commit()
-        flash('Zusätzliche Information wurde hinzugefügt und der statische Bereich wurde aktualisiert.', 'success')
+        notify_content_changed(presentation.id)
+        if regenerate:
+            submit_static_info_job(presentation.id)
+            flash('Zusätzliche Information wurde hinzugefügt. Der statische Bereich wird im Hintergrund aktualisiert.', 'success')
+        else:
+            flash('Zusätzliche Information wurde hinzugefügt.', 'success')
     else:
         flash('Bitte geben Sie eine gültige Information ein.', 'error')
     
@@ -670,20 +1759,17 @@ def clear_additional_info(id):
     presentation.additional_info = None
     
     # Statischen Inhalt neu generieren (ohne zusätzliche Infos)
-    if presentation.context and presentation.content:
-        static_content = generate_static_info_content(
-            title=presentation.title,
-            description=presentation.description,
-            context=presentation.context,
-            content=presentation.content,
-            additional_info=None
-        )
-        if static_content is not None:
-            presentation.static_info_content = static_content
-            presentation.last_updated = datetime.utcnow()
+    regenerate = bool(presentation.context and presentation.content)
+    if regenerate:
+        presentation.request_static_info_regeneration()
     
     db.session.commit()
-    flash('Alle zusätzlichen Informationen wurden gelöscht und der statische Bereich wurde aktualisiert.', 'success')
+    notify_content_changed(presentation.id)
+    if regenerate:
+        submit_static_info_job(presentation.id)
+        flash('Alle zusätzlichen Informationen wurden gelöscht. Der statische Bereich wird im Hintergrund aktualisiert.', 'success')
+    else:
+        flash('Alle zusätzlichen Informationen wurden gelöscht.', 'success')
     
     return redirect(url_for('view_presentation', id=id))
 
@@ -698,7 +1784,10 @@ def toggle_live_info_visibility(id):
     
     # Sichtbarkeit umschalten
     presentation.live_info_visible = not presentation.live_info_visible
+    presentation.bump_content_version()
     db.session.commit()
+    access_code_cache.invalidate(presentation.access_code)
+    notify_content_changed(presentation.id)
     
     if presentation.live_info_visible:
         flash('Live-Info ist jetzt für Zuhörer sichtbar.', 'success')
@@ -719,6 +1808,7 @@ def toggle_feedback(id):
     # Feedback-Status umschalten
     presentation.feedback_disabled = not presentation.feedback_disabled
     db.session.commit()
+    access_code_cache.invalidate(presentation.access_code)
     
     if presentation.feedback_disabled:
         flash('Feedback wurde für Zuhörer gesperrt.', 'warning')
@@ -741,6 +1831,7 @@ def delete_feedback(presentation_id, feedback_id):
     if feedback:
         db.session.delete(feedback)
         db.session.commit()
+        content_change_notifier.notify(presentation_id)
         flash(f'Feedback #{feedback_id} wurde gelöscht.', 'success')
     else:
         flash('Feedback nicht gefunden.', 'error')
@@ -757,10 +1848,11 @@ def clear_feedback_area(id):
         return redirect(url_for('dashboard'))
     
     # Feedback-Bereich leeren (statischer Bereich bleibt unverändert)
-    presentation.feedback_content = None
+    presentation.set_feedback_items(None)
     presentation.last_updated = datetime.utcnow()
     
     db.session.commit()
+    notify_content_changed(presentation.id)
     
     flash('Der Feedback-Bereich wurde geleert. Der statische Bereich bleibt unverändert.', 'success')
     return redirect(url_for('view_presentation', id=id))
@@ -781,12 +1873,15 @@ def reset_feedback_processing(id):
     
     # Feedback-Verarbeitung planen
     presentation.processing_scheduled = True
-    presentation.next_processing_time = datetime.utcnow() + timedelta(seconds=app.config['FEEDBACK_PROCESSING_INTERVAL'])
+    presentation.next_processing_time = planned_processing_time(presentation.id, count=len(feedbacks))
+    upsert_processing_queue({presentation.id: presentation.next_processing_time})
     
     db.session.commit()
+    content_change_notifier.notify(presentation.id)
     
-    # Feedback-Verarbeitung im Hintergrund planen
-    schedule_feedback_processing(presentation.id)
+    # Feedback-Verarbeitung im Hintergrund planen (im Worker-Modus über processing_queue)
+    if feedback_processing_inline():
+        schedule_feedback_processing(presentation.id, count=len(feedbacks))
     
     flash('Alle Feedbacks wurden wieder auf wartend gestellt und die Verarbeitung wurde geplant.', 'success')
     return redirect(url_for('view_presentation', id=id))
@@ -800,54 +1895,91 @@ def retry_ai_generation(id):
     if presentation.user_id != current_user.id and not current_user.is_admin:
         return redirect(url_for('dashboard'))
     
-    # Unverarbeitete Feedbacks abrufen
-    unprocessed_feedbacks = Feedback.query.filter_by(
-        presentation_id=id, 
-        is_processed=False
-    ).all()
+    # Nicht parallel zum Hintergrund-Worker verarbeiten
+    with processing_lock:
+        if id in presentations_in_flight:
+            flash('Die Feedbacks werden gerade verarbeitet. Bitte versuchen Sie es gleich noch einmal.', 'info')
+            return redirect(url_for('view_presentation', id=id))
+        presentations_in_flight.add(id)
     
-    # Kontext für KI-Aufruf bestimmen (mit Fehlerkontext falls verfügbar)
-    content_to_use = presentation.failed_context or presentation.cached_ai_content
-    
-    # Manuellen KI-Aufruf durchführen
-    if unprocessed_feedbacks or content_to_use:
-        ai_response = generate_ai_content(
-            feedbacks=unprocessed_feedbacks,
-            previous_content=content_to_use,
-            context=presentation.context,
-            content=presentation.content,
-            presentation_id=id
-        )
+    # ... und auch nicht parallel zu anderen Prozessen
+    if not claim_processing_lease(id):
+        with processing_lock:
+            presentations_in_flight.discard(id)
+        flash('Die Feedbacks werden gerade verarbeitet. Bitte versuchen Sie es gleich noch einmal.', 'info')
+        return redirect(url_for('view_presentation', id=id))
+    
+    try:
+        # Unverarbeitete Feedbacks abrufen
+        unprocessed_feedbacks = Feedback.query.filter_by(
+            presentation_id=id, 
+            is_processed=False
+        ).all()
         
-        # Bei erfolgreichem KI-Aufruf aktualisieren
-        if ai_response is not None:
-            for feedback in unprocessed_feedbacks:
-                feedback.ai_response = ai_response
-                feedback.is_processed = True
-            
-            # Präsentations-Cache aktualisieren und Fehlerkontext löschen
-            presentation.cached_ai_content = ai_response
-            presentation.last_updated = datetime.utcnow()
-            presentation.processing_scheduled = False
-            presentation.next_processing_time = None
-            presentation.last_error_message = None
-            presentation.last_error_time = None
-            presentation.failed_context = None
-            presentation.retry_after = None  # Retry-Verzögerung zurücksetzen
+        # Manuellen KI-Aufruf durchführen
+        if unprocessed_feedbacks:
+            errors = []
+            feedback_items = generate_feedback_items(
+                feedbacks=unprocessed_feedbacks,
+                static_info_digest=presentation.get_static_info_digest(),
+                existing_items=presentation.get_feedback_items(),
+                errors=errors
+            )
             
-            db.session.commit()
-            flash('KI-Inhalte erfolgreich aktualisiert!', 'success')
+            # Bei erfolgreichem KI-Aufruf aktualisieren
+            if feedback_items is not None:
+                for feedback in unprocessed_feedbacks:
+                    feedback.is_processed = True
+                
+                # Feedback-Bereich aktualisieren und Fehlerkontext löschen
+                presentation.set_feedback_items(feedback_items)
+                presentation.last_updated = datetime.utcnow()
+                presentation.processing_scheduled = False
+                presentation.next_processing_time = None
+                presentation.last_error_message = None
+                presentation.last_error_time = None
+                presentation.failed_context = None
+                presentation.retry_after = None  # Retry-Verzögerung zurücksetzen
+                
+                if release_processing_lease(id):
+                    complete_processing_queue(id)
+                    db.session.commit()
+                    notify_content_changed(id)
+                    flash('KI-Inhalte erfolgreich aktualisiert!', 'success')
+                else:
+                    db.session.rollback()
+                    flash('Die Verarbeitung hat zu lange gedauert und wurde verworfen. Bitte versuchen Sie es erneut.', 'error')
+            else:
+                entry = db.session.get(ProcessingQueueEntry, id)
+                retry_at = store_error_context(presentation, errors[-1] if errors else None, entry.attempts if entry else 0)
+                persist_processing_retry(id, retry_at)
+                db.session.commit()
+                flash('Fehler beim Generieren der KI-Inhalte. Bitte versuchen Sie es später erneut.', 'error')
         else:
-            flash('Fehler beim Generieren der KI-Inhalte. Bitte versuchen Sie es später erneut.', 'error')
-    else:
-        flash('Keine neuen Feedbacks zum Verarbeiten vorhanden.', 'info')
+            flash('Keine neuen Feedbacks zum Verarbeiten vorhanden.', 'info')
+    finally:
+        # Lease freigeben, falls sie nicht schon mit dem Ergebnis freigegeben wurde
+        db.session.rollback()
+        if release_processing_lease(id):
+            complete_processing_queue(id)
+        db.session.commit()
+        with processing_lock:
+            presentations_in_flight.discard(id)
     
     return redirect(url_for('view_presentation', id=id))
 
 @app.route('/p/<access_code>')
 def public_view(access_code):
-    presentation = Presentation.get_by_access_code(access_code)
-    if not presentation:
+    entry = Presentation.lookup_access_code(access_code)
+    if not entry:
+        from flask import abort
+        abort(404)
+    # Die Seite braucht Inhalt und Verarbeitungsstatus, daher weiterhin ein Primärschlüssel-Zugriff;
+    # der Cache erspart nur die Suche über den Access Code
+    presentation = db.session.get(Presentation, entry.id)
+    if presentation is None or presentation.is_deleted:
+        # Veralteter Cache-Eintrag (in einem anderen Prozess gelöscht)
+        access_code_cache.invalidate(access_code)
         from flask import abort
         abort(404)
     
@@ -861,143 +1993,897 @@ def public_view(access_code):
                           processing_status=processing_status,
                           config=app.config)
 
-# Globales Wörterbuch für die Feedback-Verarbeitung
+# Hintergrund-Jobs für die Info-Seite
+# Pro Präsentation läuft höchstens ein Job; er liest beim Start die aktuellen Eingaben,
+# weitere Anforderungen bis dahin werden zu einem Folgejob zusammengefasst. Ergebnisse
+# überholter Jobs (neuere Generation angefordert) werden verworfen.
+static_info_executor = None
+static_info_jobs_pending = set()
+static_info_jobs_running = set()
+static_info_jobs_rerun = set()
+static_info_jobs_lock = threading.Lock()
+
+def submit_static_info_job(presentation_id):
+    """Startet die Generierung der Info-Seite im Hintergrund (nach dem Commit aufrufen)"""
+    global static_info_executor
+    
+    with static_info_jobs_lock:
+        if presentation_id in static_info_jobs_pending:
+            # Wartender Job liest beim Start ohnehin die neuesten Eingaben
+            return
+        if presentation_id in static_info_jobs_running:
+            # Laufender Job ist überholt - danach genau einmal neu starten
+            static_info_jobs_rerun.add(presentation_id)
+            return
+        static_info_jobs_pending.add(presentation_id)
+        if static_info_executor is None:
+            static_info_executor = ThreadPoolExecutor(
+                max_workers=app.config['STATIC_INFO_JOB_WORKERS'],
+                thread_name_prefix='static-info-job'
+            )
+    static_info_executor.submit(run_static_info_job, presentation_id)
+
+def run_static_info_job(presentation_id):
+    """Generiert die Info-Seite für die zuletzt angeforderte Generation"""
+    with static_info_jobs_lock:
+        static_info_jobs_pending.discard(presentation_id)
+        static_info_jobs_running.add(presentation_id)
+    
+    try:
+        with app.app_context():
+            presentation = Presentation.get_active(presentation_id)
+            if not presentation or presentation.static_info_job_status is None:
+                return
+            
+            generation = presentation.static_info_job_generation
+            inputs = dict(
+                title=presentation.title,
+                description=presentation.description,
+                context=presentation.context,
+                content=presentation.content,
+                additional_info=presentation.additional_info
+            )
+            
+            update_static_info_job(presentation_id, generation, {'static_info_job_status': 'running'})
+            static_content = generate_static_info_content(**inputs)
+            
+            if static_content is not None:
+                applied = update_static_info_job(presentation_id, generation, {
+                    'static_info_content': static_content,
+                    'static_info_html': render_markdown_html(static_content),
+                    'static_info_digest': build_static_info_digest(static_content),
+                    'static_info_digest_hash': static_info_digest_hash(static_content),
+                    'static_info_job_status': None,
+                    'static_info_job_error': None,
+                    'last_updated': datetime.utcnow()
+                })
+            else:
+                applied = update_static_info_job(presentation_id, generation, {
+                    'static_info_job_status': 'failed',
+                    'static_info_job_error': 'Die KI-Generierung ist fehlgeschlagen.'
+                })
+            
+            if not applied:
+                print(f"Info-Seiten-Job für Präsentation {presentation_id} überholt - Ergebnis verworfen")
+    except Exception as e:
+        print(f"Fehler im Info-Seiten-Job für Präsentation {presentation_id}: {e}")
+    finally:
+        with static_info_jobs_lock:
+            static_info_jobs_running.discard(presentation_id)
+            rerun = presentation_id in static_info_jobs_rerun
+            static_info_jobs_rerun.discard(presentation_id)
+        if rerun:
+            submit_static_info_job(presentation_id)
+
+def update_static_info_job(presentation_id, generation, values):
+    """Schreibt Job-Ergebnisse nur, wenn keine neuere Generation angefordert wurde"""
+    values = dict(values, content_version=Presentation.content_version + 1)
+    updated = Presentation.query.filter_by(
+        id=presentation_id, static_info_job_generation=generation
+    ).update(values, synchronize_session=False)
+    db.session.commit()
+    if updated:
+        notify_content_changed(presentation_id)
+    return bool(updated)
+
+def resume_stale_static_info_job(presentation):
+    """Startet Jobs neu, die z.B. durch einen Neustart verloren gegangen sind"""
+    if (presentation.static_info_job_status in ('queued', 'running') and
+            presentation.static_info_job_requested_at and
+            datetime.utcnow() - presentation.static_info_job_requested_at > timedelta(seconds=app.config['STATIC_INFO_JOB_TIMEOUT'])):
+        presentation.static_info_job_requested_at = datetime.utcnow()
+        db.session.commit()
+        submit_static_info_job(presentation.id)
+
+def static_info_job_stats():
+    with static_info_jobs_lock:
+        return {
+            'pending': len(static_info_jobs_pending),
+            'running': len(static_info_jobs_running),
+            'workers': app.config['STATIC_INFO_JOB_WORKERS']
+        }
+
+# Globale Warteschlange für die Feedback-Verarbeitung
+# feedback_processing_queue: presentation_id -> aktueller Eintrag
+# feedback_processing_heap: (next_processing_time, presentation_id), nach Fälligkeit sortiert.
+# Veraltete Heap-Einträge (verschoben oder entfernt) werden beim Entnehmen übersprungen.
 feedback_processing_queue = {}
+feedback_processing_heap = []
 processing_thread = None
 processing_lock = threading.Lock()
+processing_condition = threading.Condition(processing_lock)
+processing_thread_lock = threading.Lock()
+processing_recovered = False
+processing_recovery_lock = threading.Lock()
+processing_seen_feedback_id = 0  # Worker-Modus: höchste bereits eingeplante Feedback-ID
 
-def process_feedback_queue():
-    """Hintergrundthread zur Verarbeitung von Feedback-Anfragen in Batches"""
-    global feedback_processing_queue
+# Worker-Pool für parallele AI-Aufrufe; jede Präsentation ist höchstens einmal in Arbeit
+feedback_executor = None
+presentations_in_flight = set()
+
+# Adaptives Sammelfenster: presentation_id -> Eingangsrate, wartende Feedbacks, letzter Aufruf
+# (geschützt durch processing_lock)
+feedback_batching_state = {}
+
+def _stable_fraction(*parts):
+    """Über Prozesse und Neustarts stabile Pseudo-Zufallszahl in [0, 1)"""
+    digest = hashlib.blake2b(':'.join(map(str, parts)).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'big') / 2 ** 64
+
+def next_processing_slot(now, presentation_id=None):
+    """Berechnet den nächsten festen Zeitslot (alle X Sekunden ab Mitternacht).
     
-    while True:
-        time.sleep(1)  # Kurze Pause, um CPU-Last zu reduzieren
-        
+    Mit presentation_id sind die Slots pro Präsentation um eine feste Phase (Hash der ID)
+    versetzt und um bis zu FEEDBACK_SLOT_JITTER Sekunden gestreut, damit nicht alle
+    Präsentationen in derselben Sekunde die KI aufrufen. Phase und Streuung hängen nur
+    von ID und Slot ab - der angezeigte Zeitpunkt bleibt damit vorhersagbar.
+    """
+    processing_interval = app.config['FEEDBACK_PROCESSING_INTERVAL']
+    phase = 0.0
+    if presentation_id is not None:
+        phase = _stable_fraction('phase', presentation_id) * processing_interval
+
+    # Beispiel: bei 30s Intervall und 7s Phase → 00:00:07, 00:00:37, 00:01:07, etc.
+    midnight_today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    seconds_since_midnight = (now - midnight_today).total_seconds()
+    slot_index = math.floor((seconds_since_midnight - phase) / processing_interval) + 1
+    next_slot = midnight_today + timedelta(seconds=slot_index * processing_interval + phase)
+    
+    if presentation_id is not None:
+        jitter = _stable_fraction('jitter', presentation_id, midnight_today.date(), slot_index)
+        next_slot += timedelta(seconds=jitter * app.config['FEEDBACK_SLOT_JITTER'])
+
+    # Falls das in der Vergangenheit liegt (sehr unwahrscheinlich), nimm nächsten Tag
+    if next_slot <= now:
+        next_slot += timedelta(days=1)
+    return next_slot
+
+def _batching_state_locked(presentation_id):
+    return feedback_batching_state.setdefault(presentation_id, {
+        'rate': 0.0,            # Feedbacks pro Sekunde (exponentiell gleitend)
+        'last_arrival': None,
+        'pending': 0,           # Seit dem letzten Aufruf eingegangen
+        'first_pending': None,  # Eingang des ältesten wartenden Feedbacks
+        'last_dispatch': None   # Start des letzten KI-Aufrufs
+    })
+
+def _record_arrivals_locked(state, now, count):
+    """Aktualisiert die Eingangsrate (exponentiell abklingende Zählung) und die wartenden Feedbacks"""
+    half_life = app.config['FEEDBACK_RATE_HALF_LIFE']
+    if state['last_arrival'] is not None:
+        elapsed = max(0.0, (now - state['last_arrival']).total_seconds())
+        state['rate'] *= 0.5 ** (elapsed / half_life)
+    state['rate'] += count * math.log(2) / half_life
+    state['last_arrival'] = now
+    state['pending'] += count
+    if state['first_pending'] is None:
+        state['first_pending'] = now
+
+def batching_window(rate):
+    """Sammelfenster in Sekunden für eine Eingangsrate (Feedbacks pro Sekunde).
+    
+    Kommt im Mindestfenster voraussichtlich kein weiteres Feedback, lohnt Warten nicht.
+    Sonst wird so lange gesammelt, bis die Schwelle voraussichtlich erreicht ist -
+    begrenzt auf FEEDBACK_WINDOW_MIN..FEEDBACK_WINDOW_MAX.
+    """
+    window_min = app.config['FEEDBACK_WINDOW_MIN']
+    window_max = app.config['FEEDBACK_WINDOW_MAX']
+    if rate * window_min < 1:
+        return window_min
+    return max(window_min, min(window_max, app.config['FEEDBACK_BATCH_THRESHOLD'] / rate))
+
+def adaptive_due_time(state, now):
+    """Fälligkeit nach adaptiver Strategie: Schwelle erreicht -> sofort, sonst nach dem
+    Sammelfenster; in jedem Fall mindestens FEEDBACK_MIN_SPACING nach dem letzten Aufruf."""
+    if state['pending'] >= app.config['FEEDBACK_BATCH_THRESHOLD']:
+        due = now
+    else:
+        due = (state['first_pending'] or now) + timedelta(seconds=batching_window(state['rate']))
+    if state['last_dispatch'] is not None:
+        due = max(due, state['last_dispatch'] + timedelta(seconds=app.config['FEEDBACK_MIN_SPACING']))
+    return max(due, now)
+
+def _next_due_locked(presentation_id, now):
+    if app.config['FEEDBACK_ADAPTIVE_BATCHING']:
+        return adaptive_due_time(_batching_state_locked(presentation_id), now)
+    return next_processing_slot(now, presentation_id)
+
+def planned_processing_time(presentation_id, count=1):
+    """Voraussichtliche Verarbeitung nach count neuen Feedbacks, ohne den Zustand zu ändern.
+    
+    Entspricht der Planung von schedule_feedback_processing und wird als
+    next_processing_time gespeichert (Anzeige in der öffentlichen Ansicht).
+    """
+    with processing_lock:
         now = datetime.utcnow()
-        presentations_to_process = []
-        
-        with processing_lock:
-            # Präsentationen identifizieren, die verarbeitet werden müssen
-            for presentation_id, data in list(feedback_processing_queue.items()):
-                if now >= data['next_processing_time']:
-                    presentations_to_process.append(presentation_id)
-        
-        # Verarbeitung der identifizierten Präsentationen
-        for presentation_id in presentations_to_process:
-            try:
-                with app.app_context():
-                    # Präsentation und alle zugehörigen Feedbacks abrufen
-                    presentation = Presentation.query.get(presentation_id)
-                    if not presentation or presentation.is_deleted:
-                        with processing_lock:
-                            if presentation_id in feedback_processing_queue:
-                                del feedback_processing_queue[presentation_id]
-                        continue
-                    
-                    # Prüfen, ob Retry-Verzögerung noch aktiv ist
-                    if presentation.retry_after and now < presentation.retry_after:
-                        print(f"Presentation {presentation_id}: Retry-Verzögerung noch aktiv bis {presentation.retry_after}")
-                        continue
-                    
-                    # Unverarbeitete Feedbacks abrufen
-                    unprocessed_feedbacks = Feedback.query.filter_by(
-                        presentation_id=presentation_id, 
-                        is_processed=False
-                    ).all()
-
-                    if not unprocessed_feedbacks:
-                        with processing_lock:
-                            if presentation_id in feedback_processing_queue:
-                                del feedback_processing_queue[presentation_id]
-                        continue
-
-                    # Nur unverarbeitete Feedbacks für KI verwenden
-                    # (Bereits verarbeitete sind im existing_feedback_content enthalten)
-                    
-                    # Neuen Feedback-Bereich generieren (nur mit neuen Feedbacks)
-                    feedback_response = generate_feedback_content(
-                        feedbacks=unprocessed_feedbacks,
-                        static_info_content=presentation.static_info_content,
-                        existing_feedback_content=presentation.feedback_content
-                    )
-                    
-                    # Nur bei erfolgreichem KI-Aufruf aktualisieren
-                    if feedback_response is not None:
-                        for feedback in unprocessed_feedbacks:
-                            feedback.is_processed = True
-                        
-                        # Feedback-Bereich aktualisieren und Fehlerkontext löschen
-                        presentation.feedback_content = feedback_response
-                        presentation.last_updated = datetime.utcnow()
-                        presentation.processing_scheduled = False
-                        presentation.next_processing_time = None
-                        presentation.last_error_message = None
-                        presentation.last_error_time = None
-                        presentation.failed_context = None
-                        presentation.retry_after = None  # Retry-Verzögerung zurücksetzen
-                        
-                        db.session.commit()
-                        
-                        # Aus der Warteschlange entfernen
-                        with processing_lock:
-                            if presentation_id in feedback_processing_queue:
-                                del feedback_processing_queue[presentation_id]
-                    else:
-                        # Bei Fehler: Feedbacks nicht als verarbeitet markieren
-                        # Warteschlange nicht entfernen, damit später erneut versucht wird
-                        print(f"Feedback-Generierung für Präsentation {presentation_id} fehlgeschlagen - wird später erneut versucht")
-                        db.session.commit()  # Fehlerkontext speichern
-            
-            except Exception as e:
-                print(f"Fehler bei der Verarbeitung von Präsentation {presentation_id}: {e}")
-                # Bei schwerwiegenden Fehlern aus der Warteschlange entfernen
-                # API-Fehler werden bereits oben behandelt
-                with processing_lock:
-                    if presentation_id in feedback_processing_queue:
-                        del feedback_processing_queue[presentation_id]
+        if app.config['FEEDBACK_ADAPTIVE_BATCHING']:
+            state = dict(_batching_state_locked(presentation_id))
+            _record_arrivals_locked(state, now, count)
+            due = adaptive_due_time(state, now)
+        else:
+            due = next_processing_slot(now, presentation_id)
+        queued = feedback_processing_queue.get(presentation_id)
+        if queued and presentation_id not in presentations_in_flight:
+            due = min(due, queued['next_processing_time'])
+        return due
+
+def upsert_insert(model):
+    """INSERT mit on_conflict_do_update für die konfigurierte Datenbank (SQLite oder PostgreSQL)"""
+    if db.engine.dialect.name == 'postgresql':
+        return postgresql.insert(model)
+    return sqlite.insert(model)
+
+def upsert_processing_queue(due_times):
+    """Trägt Fälligkeiten {presentation_id: due_at} in die dauerhafte Warteschlange ein.
+    
+    Eine bereits frühere Fälligkeit bleibt erhalten. Läuft in der Transaktion des
+    Aufrufers, damit Feedback und Planung gemeinsam gespeichert werden.
+    """
+    if not due_times:
+        return
+    statement = upsert_insert(ProcessingQueueEntry).values([
+        {'presentation_id': presentation_id, 'due_at': due_at, 'attempts': 0}
+        for presentation_id, due_at in due_times.items()
+    ])
+    statement = statement.on_conflict_do_update(
+        index_elements=['presentation_id'],
+        set_={'due_at': db.case(
+            (statement.excluded.due_at < ProcessingQueueEntry.due_at, statement.excluded.due_at),
+            else_=ProcessingQueueEntry.due_at
+        )}
+    )
+    db.session.execute(statement)
+
+def persist_processing_retry(presentation_id, due_at):
+    """Hält einen fehlgeschlagenen Versuch und den nächsten Termin fest und gibt die Lease frei"""
+    ProcessingQueueEntry.query.filter_by(
+        presentation_id=presentation_id,
+        lease_owner=processing_worker_id()
+    ).update({
+        'due_at': due_at,
+        'attempts': ProcessingQueueEntry.attempts + 1,
+        'lease_owner': None,
+        'lease_expires_at': None
+    }, synchronize_session=False)
 
-def schedule_feedback_processing(presentation_id):
-    """Plant die Verarbeitung von Feedback für eine Präsentation"""
-    global feedback_processing_queue, processing_thread
+def complete_processing_queue(presentation_id):
+    """Entfernt den dauerhaften Eintrag, sofern kein unverarbeitetes Feedback mehr wartet.
     
-    # Verarbeitungsthread starten, falls noch nicht gestartet
-    if processing_thread is None or not processing_thread.is_alive():
-        processing_thread = threading.Thread(target=process_feedback_queue, daemon=True)
-        processing_thread.start()
+    Muss nach dem Markieren der verarbeiteten Feedbacks in derselben Transaktion laufen;
+    währenddessen eingegangenes Feedback hält den Eintrag am Leben.
+    """
+    db.session.flush()
+    pending = Feedback.query.filter(
+        Feedback.presentation_id == presentation_id,
+        Feedback.is_processed == False
+    ).exists()
+    ProcessingQueueEntry.query.filter(
+        ProcessingQueueEntry.presentation_id == presentation_id,
+        ~pending
+    ).delete(synchronize_session=False)
+
+def processing_worker_id():
+    """Kennung dieses Prozesses für Leases (bei jedem Aufruf neu, damit Forks eine eigene haben)"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+def claim_processing_lease(presentation_id):
+    """Beansprucht die Verarbeitung einer Präsentation prozessübergreifend und committet.
     
+    Gelingt nur, wenn kein anderer Prozess eine gültige Lease hält: ein einziges
+    INSERT ... ON CONFLICT DO UPDATE ... WHERE lease_expires_at < jetzt, das SQLite
+    und PostgreSQL atomar ausführen. So verarbeitet auch bei mehreren Gunicorn-Workern immer nur
+    einer die Feedbacks einer Präsentation.
+    """
     now = datetime.utcnow()
-    processing_interval = app.config['FEEDBACK_PROCESSING_INTERVAL']
+    worker_id = processing_worker_id()
+    statement = upsert_insert(ProcessingQueueEntry).values(
+        presentation_id=presentation_id,
+        due_at=now,
+        attempts=0,
+        lease_owner=worker_id,
+        lease_expires_at=now + timedelta(seconds=app.config['FEEDBACK_LEASE_SECONDS'])
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=['presentation_id'],
+        set_={
+            'lease_owner': statement.excluded.lease_owner,
+            'lease_expires_at': statement.excluded.lease_expires_at
+        },
+        where=db.or_(
+            ProcessingQueueEntry.lease_expires_at.is_(None),
+            ProcessingQueueEntry.lease_expires_at < now,
+            ProcessingQueueEntry.lease_owner == worker_id
+        )
+    )
+    claimed = db.session.execute(statement).rowcount == 1
+    db.session.commit()
+    return claimed
+
+def release_processing_lease(presentation_id):
+    """Gibt die eigene Lease in der Transaktion des Aufrufers frei.
     
+    Gibt False zurück, wenn die Lease abgelaufen und von einem anderen Prozess
+    übernommen wurde - dann darf das Ergebnis nicht gespeichert werden.
+    """
+    return ProcessingQueueEntry.query.filter_by(
+        presentation_id=presentation_id,
+        lease_owner=processing_worker_id()
+    ).update({'lease_owner': None, 'lease_expires_at': None}, synchronize_session=False) == 1
+
+def recover_processing_queue():
+    """Stellt die Warteschlange nach einem Neustart aus der Datenbank wieder her.
+    
+    Übernimmt alle dauerhaften Einträge und plant zusätzlich jede Präsentation mit
+    unverarbeitetem Feedback ein, die (z.B. nach einem Absturz vor dem Commit der
+    Planung) keinen Eintrag hat. Einträge gelöschter oder fertiger Präsentationen
+    werden entfernt. Gibt die Anzahl der eingeplanten Präsentationen zurück.
+    """
+    now = datetime.utcnow()
+    # Nutzt den Index ix_feedback_is_processed
+    pending_ids = {
+        presentation_id for (presentation_id,) in db.session.query(Feedback.presentation_id)
+        .join(Presentation, Presentation.id == Feedback.presentation_id)
+        .filter(Feedback.is_processed == False, Presentation.is_deleted == False)
+        .distinct()
+    }
+    entries = {entry.presentation_id: entry for entry in ProcessingQueueEntry.query.all()}
+    
+    stale_ids = set(entries) - pending_ids
+    if stale_ids:
+        ProcessingQueueEntry.query.filter(ProcessingQueueEntry.presentation_id.in_(stale_ids)).delete(synchronize_session=False)
+    # Versetzte Slots verteilen die nachgeholte Arbeit, statt alles gleichzeitig zu starten
+    upsert_processing_queue({
+        presentation_id: next_processing_slot(now, presentation_id)
+        for presentation_id in pending_ids - set(entries)
+    })
+    db.session.commit()
+    
+    due_times = {entry.presentation_id: entry.due_at for entry in ProcessingQueueEntry.query.all()}
     with processing_lock:
-        # Wenn die Präsentation noch nicht in der Warteschlange ist, hinzufügen
-        if presentation_id not in feedback_processing_queue:
-            # Berechne nächsten festen Zeitslot (alle X Sekunden ab Mitternacht)
-            # Beispiel: bei 30s Intervall → 00:00:00, 00:00:30, 00:01:00, etc.
-            seconds_since_midnight = (now.hour * 3600 + now.minute * 60 + now.second)
-            next_interval_seconds = ((seconds_since_midnight // processing_interval) + 1) * processing_interval
+        for presentation_id, due_at in due_times.items():
+            queued = feedback_processing_queue.get(presentation_id)
+            if queued is None or due_at < queued['next_processing_time']:
+                _enqueue_locked(presentation_id, due_at)
+            else:
+                queued['has_pending_feedback'] = True
+    if due_times:
+        start_processing_thread()
+    return len(due_times)
+
+def feedback_processing_inline():
+    """Verarbeiten die Web-Prozesse Feedback selbst? Im Worker-Modus planen sie nur ein"""
+    return app.config['FEEDBACK_PROCESSING_MODE'] != 'worker'
+
+def sync_processing_queue():
+    """Worker-Modus: übernimmt neues Feedback und offene Einträge aus der Datenbank.
+    
+    Neues Feedback (IDs über der zuletzt gesehenen) zählt wie im Web-Prozess als
+    Eingang für das adaptive Sammelfenster. Einträge in processing_queue ohne
+    Gegenstück im Speicher (z.B. nach "Verarbeitung zurücksetzen") werden zu ihrer
+    gespeicherten Fälligkeit eingeplant. Gibt die Anzahl neuer Feedbacks zurück.
+    """
+    global processing_seen_feedback_id
+    # Nutzt den Index ix_feedback_is_processed
+    arrivals = db.session.query(
+        Feedback.presentation_id, db.func.count(Feedback.id), db.func.max(Feedback.id)
+    ).filter(
+        Feedback.is_processed == False,
+        Feedback.id > processing_seen_feedback_id
+    ).group_by(Feedback.presentation_id).all()
+    for presentation_id, count, last_id in arrivals:
+        schedule_feedback_processing(presentation_id, count=count)
+        processing_seen_feedback_id = max(processing_seen_feedback_id, last_id)
+    
+    entries = db.session.query(ProcessingQueueEntry.presentation_id, ProcessingQueueEntry.due_at).all()
+    with processing_lock:
+        for presentation_id, due_at in entries:
+            if presentation_id not in feedback_processing_queue and presentation_id not in presentations_in_flight:
+                _enqueue_locked(presentation_id, due_at)
+    return sum(count for _, count, _ in arrivals)
+
+def ensure_processing_recovered():
+    """Führt die Wiederherstellung einmal pro Prozess aus (beim ersten Request)"""
+    global processing_recovered
+    if processing_recovered or not app.config['FEEDBACK_RECOVER_ON_STARTUP'] or not feedback_processing_inline():
+        return
+    with processing_recovery_lock:
+        if processing_recovered:
+            return
+        processing_recovered = True
+        try:
+            count = recover_processing_queue()
+            if count:
+                print(f"Feedback-Warteschlange wiederhergestellt: {count} Präsentationen eingeplant")
+        except Exception as e:
+            db.session.rollback()
+            print(f"Warnung: Feedback-Warteschlange konnte nicht wiederhergestellt werden: {e}")
+
+@app.before_request
+def recover_processing_queue_once():
+    ensure_processing_recovered()
+
+def _is_current_heap_entry(entry):
+    """Prüft, ob ein Heap-Eintrag noch dem aktuellen Warteschlangen-Eintrag entspricht"""
+    next_processing_time, presentation_id = entry
+    data = feedback_processing_queue.get(presentation_id)
+    return data is not None and data['next_processing_time'] == next_processing_time
+
+def _enqueue_locked(presentation_id, next_processing_time):
+    """Setzt die Fälligkeit einer Präsentation (processing_lock muss gehalten werden)"""
+    data = feedback_processing_queue.setdefault(presentation_id, {'has_pending_feedback': True})
+    data['next_processing_time'] = next_processing_time
+    heapq.heappush(feedback_processing_heap, (next_processing_time, presentation_id))
+
+    # Verarbeitungsthread wecken, falls dies jetzt der früheste Eintrag ist
+    if feedback_processing_heap[0] == (next_processing_time, presentation_id):
+        processing_condition.notify()
+
+def reschedule_feedback_processing(presentation_id, next_processing_time):
+    """Verschiebt die Verarbeitung einer Präsentation auf einen neuen Zeitpunkt"""
+    with processing_lock:
+        _enqueue_locked(presentation_id, next_processing_time)
+
+def remove_from_processing_queue(presentation_id):
+    with processing_lock:
+        feedback_processing_queue.pop(presentation_id, None)
+        feedback_batching_state.pop(presentation_id, None)
+
+def finish_feedback_processing(presentation_id):
+    """Entfernt eine verarbeitete Präsentation - außer es kam währenddessen neues Feedback"""
+    with processing_lock:
+        data = feedback_processing_queue.get(presentation_id)
+        if data is None:
+            return
+        if data['has_pending_feedback']:
+            _enqueue_locked(presentation_id, _next_due_locked(presentation_id, datetime.utcnow()))
+        else:
+            del feedback_processing_queue[presentation_id]
+
+def wait_for_due_presentations():
+    """Schläft bis zum nächsten fälligen Eintrag und gibt alle fälligen Präsentationen zurück"""
+    with processing_condition:
+        while True:
+            while feedback_processing_heap and not _is_current_heap_entry(feedback_processing_heap[0]):
+                heapq.heappop(feedback_processing_heap)
+
+            if not feedback_processing_heap:
+                processing_condition.wait()
+                continue
+
+            wait_seconds = (feedback_processing_heap[0][0] - datetime.utcnow()).total_seconds()
+            if wait_seconds <= 0:
+                break
+            processing_condition.wait(wait_seconds)
+
+        now = datetime.utcnow()
+        due_presentations = []
+        while feedback_processing_heap and feedback_processing_heap[0][0] <= now:
+            entry = heapq.heappop(feedback_processing_heap)
+            if _is_current_heap_entry(entry):
+                presentation_id = entry[1]
+                # Ab hier eingehendes Feedback führt zu einem neuen Durchlauf
+                feedback_processing_queue[presentation_id]['has_pending_feedback'] = False
+                state = _batching_state_locked(presentation_id)
+                state['pending'] = 0
+                state['first_pending'] = None
+                state['last_dispatch'] = now
+                due_presentations.append(presentation_id)
+        return due_presentations
+
+def process_feedback_queue():
+    """Hintergrundthread: verteilt fällige Präsentationen auf den Worker-Pool"""
+    global feedback_executor
+    
+    if feedback_executor is None:
+        feedback_executor = ThreadPoolExecutor(
+            max_workers=app.config['FEEDBACK_MAX_IN_FLIGHT'],
+            thread_name_prefix='feedback-worker'
+        )
+    
+    while True:
+        for presentation_id in wait_for_due_presentations():
+            with processing_lock:
+                if presentation_id in presentations_in_flight:
+                    # Läuft noch - nach Abschluss erneut einplanen, damit Merges nicht kollidieren
+                    if presentation_id in feedback_processing_queue:
+                        feedback_processing_queue[presentation_id]['has_pending_feedback'] = True
+                    continue
+                presentations_in_flight.add(presentation_id)
+            feedback_executor.submit(run_presentation_feedback_processing, presentation_id)
+
+def run_presentation_feedback_processing(presentation_id):
+    """Führt die Verarbeitung einer Präsentation im Worker-Pool aus"""
+    try:
+        process_presentation_feedback(presentation_id)
+    finally:
+        with processing_lock:
+            presentations_in_flight.discard(presentation_id)
+
+def process_presentation_feedback(presentation_id):
+    """Verarbeitet die unverarbeiteten Feedbacks einer Präsentation"""
+    now = datetime.utcnow()
+    try:
+        with app.app_context():
+            # Präsentation und alle zugehörigen Feedbacks abrufen
+            presentation = Presentation.query.get(presentation_id)
+            if not presentation or presentation.is_deleted:
+                ProcessingQueueEntry.query.filter_by(presentation_id=presentation_id).delete()
+                db.session.commit()
+                remove_from_processing_queue(presentation_id)
+                return
             
-            # Nächster Slot berechnen
-            midnight_today = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            next_slot = midnight_today + timedelta(seconds=next_interval_seconds)
+            # Prüfen, ob Retry-Verzögerung noch aktiv ist
+            if presentation.retry_after and now < presentation.retry_after:
+                print(f"Presentation {presentation_id}: Retry-Verzögerung noch aktiv bis {presentation.retry_after}")
+                reschedule_feedback_processing(presentation_id, presentation.retry_after)
+                return
             
-            # Falls das in der Vergangenheit liegt (sehr unwahrscheinlich), nimm nächsten Tag
-            if next_slot <= now:
-                next_slot += timedelta(days=1)
+            # Prozessübergreifend exklusiv verarbeiten (mehrere Gunicorn-Worker)
+            if not claim_processing_lease(presentation_id):
+                retry_at = datetime.utcnow() + timedelta(seconds=app.config['FEEDBACK_LEASE_RETRY'])
+                print(f"Präsentation {presentation_id} wird von einem anderen Prozess verarbeitet - nächster Versuch um {retry_at}")
+                reschedule_feedback_processing(presentation_id, retry_at)
+                return
             
-            feedback_processing_queue[presentation_id] = {
-                'next_processing_time': next_slot,
-                'has_pending_feedback': True
+            # Unverarbeitete Feedbacks abrufen
+            unprocessed_feedbacks = Feedback.query.filter_by(
+                presentation_id=presentation_id, 
+                is_processed=False
+            ).all()
+
+            if not unprocessed_feedbacks:
+                if release_processing_lease(presentation_id):
+                    complete_processing_queue(presentation_id)
+                db.session.commit()
+                finish_feedback_processing(presentation_id)
+                return
+
+            # Nur unverarbeitete Feedbacks für KI verwenden
+            # (Bereits verarbeitete sind im strukturierten Feedback-Bereich enthalten)
+            
+            # Neuen Feedback-Bereich generieren (nur mit neuen Feedbacks)
+            errors = []
+            feedback_items = generate_feedback_items(
+                feedbacks=unprocessed_feedbacks,
+                static_info_digest=presentation.get_static_info_digest(),
+                existing_items=presentation.get_feedback_items(),
+                errors=errors
+            )
+            
+            # Nur bei erfolgreichem KI-Aufruf aktualisieren
+            if feedback_items is not None:
+                for feedback in unprocessed_feedbacks:
+                    feedback.is_processed = True
+                
+                # Feedback-Bereich aktualisieren und Fehlerkontext löschen
+                presentation.set_feedback_items(feedback_items)
+                presentation.last_updated = datetime.utcnow()
+                presentation.processing_scheduled = False
+                presentation.next_processing_time = None
+                presentation.last_error_message = None
+                presentation.last_error_time = None
+                presentation.failed_context = None
+                presentation.retry_after = None  # Retry-Verzögerung zurücksetzen
+                
+                # Nur speichern, wenn kein anderer Prozess die Lease inzwischen übernommen hat
+                if not release_processing_lease(presentation_id):
+                    db.session.rollback()
+                    print(f"Lease für Präsentation {presentation_id} abgelaufen - Ergebnis verworfen")
+                    reschedule_feedback_processing(
+                        presentation_id,
+                        datetime.utcnow() + timedelta(seconds=app.config['FEEDBACK_LEASE_RETRY'])
+                    )
+                    return
+                complete_processing_queue(presentation_id)
+                
+                db.session.commit()
+                notify_content_changed(presentation_id)
+                
+                # Aus der Warteschlange entfernen
+                finish_feedback_processing(presentation_id)
+            else:
+                # Bei Fehler: Feedbacks nicht als verarbeitet markieren
+                # In der Warteschlange belassen, damit später erneut versucht wird
+                entry = db.session.get(ProcessingQueueEntry, presentation_id)
+                retry_at = store_error_context(presentation, errors[-1] if errors else None, entry.attempts if entry else 0)
+                print(f"Feedback-Generierung für Präsentation {presentation_id} fehlgeschlagen - nächster Versuch um {retry_at}")
+                persist_processing_retry(presentation_id, retry_at)
+                db.session.commit()  # Fehlerkontext und nächsten Versuch speichern
+                reschedule_feedback_processing(presentation_id, retry_at)
+    
+    except Exception as e:
+        print(f"Fehler bei der Verarbeitung von Präsentation {presentation_id}: {e}")
+        # Unerwartete Fehler (Datenbank, Zusammenführen ...): wie ein fehlgeschlagener
+        # KI-Aufruf mit Backoff erneut versuchen, statt bis zum Ablauf der Lease zu hängen
+        retry_at = datetime.utcnow() + timedelta(seconds=feedback_retry_delay(0))
+        try:
+            with app.app_context():
+                db.session.rollback()
+                entry = db.session.get(ProcessingQueueEntry, presentation_id)
+                if entry is not None:
+                    retry_at = datetime.utcnow() + timedelta(seconds=feedback_retry_delay(entry.attempts))
+                persist_processing_retry(presentation_id, retry_at)  # Gibt auch die eigene Lease frei
+                db.session.commit()
+        except Exception as retry_error:
+            print(f"Warnung: Nächster Versuch für Präsentation {presentation_id} konnte nicht gespeichert werden: {retry_error}")
+        reschedule_feedback_processing(presentation_id, retry_at)
+
+def feedback_processing_stats():
+    with processing_lock:
+        now = datetime.utcnow()
+        batching = {}
+        for presentation_id, state in feedback_batching_state.items():
+            rate = state['rate']
+            if state['last_arrival'] is not None:
+                rate *= 0.5 ** ((now - state['last_arrival']).total_seconds() / app.config['FEEDBACK_RATE_HALF_LIFE'])
+            queued = feedback_processing_queue.get(presentation_id)
+            batching[presentation_id] = {
+                'rate_per_minute': round(rate * 60, 2),
+                'window_seconds': round(batching_window(rate), 1),
+                'pending': state['pending'],
+                'next_processing_time': queued['next_processing_time'].isoformat() if queued else None
             }
+        stats = {
+            'queued': len(feedback_processing_queue),
+            'in_flight': len(presentations_in_flight),
+            'max_in_flight': app.config['FEEDBACK_MAX_IN_FLIGHT'],
+            'mode': app.config['FEEDBACK_PROCESSING_MODE'],
+            'batching_policy': {
+                'adaptive': app.config['FEEDBACK_ADAPTIVE_BATCHING'],
+                'window_min': app.config['FEEDBACK_WINDOW_MIN'],
+                'window_max': app.config['FEEDBACK_WINDOW_MAX'],
+                'batch_threshold': app.config['FEEDBACK_BATCH_THRESHOLD'],
+                'min_spacing': app.config['FEEDBACK_MIN_SPACING'],
+                'rate_half_life': app.config['FEEDBACK_RATE_HALF_LIFE']
+            },
+            'batching': batching
+        }
+    # Dauerhafte Warteschlange (auch von anderen Prozessen geplante Präsentationen)
+    stats['durable'] = {
+        'queued': ProcessingQueueEntry.query.count(),
+        'overdue': ProcessingQueueEntry.query.filter(ProcessingQueueEntry.due_at < now).count(),
+        'failing': ProcessingQueueEntry.query.filter(ProcessingQueueEntry.attempts > 0).count()
+    }
+    return stats
+
+def start_processing_thread():
+    """Startet den Verarbeitungsthread, falls er noch nicht läuft"""
+    global processing_thread
+    with processing_thread_lock:
+        if processing_thread is None or not processing_thread.is_alive():
+            processing_thread = threading.Thread(target=process_feedback_queue, daemon=True)
+            processing_thread.start()
+
+def schedule_feedback_processing(presentation_id, count=1):
+    """Plant die Verarbeitung von Feedback für eine Präsentation (count = Anzahl neuer Feedbacks)"""
+    start_processing_thread()
+    
+    with processing_lock:
+        now = datetime.utcnow()
+        if app.config['FEEDBACK_ADAPTIVE_BATCHING']:
+            _record_arrivals_locked(_batching_state_locked(presentation_id), now, count)
+        
+        # Wenn die Präsentation noch nicht in der Warteschlange ist, hinzufügen
+        if presentation_id not in feedback_processing_queue:
+            next_slot = _next_due_locked(presentation_id, now)
+            _enqueue_locked(presentation_id, next_slot)
             print(f"Feedback-Verarbeitung für Präsentation {presentation_id} geplant um {next_slot}")
         else:
-            # Nur markieren, dass neues Feedback da ist (Zeit nicht verschieben!)
-            feedback_processing_queue[presentation_id]['has_pending_feedback'] = True
-            print(f"Feedback für Präsentation {presentation_id} markiert (nächste Verarbeitung: {feedback_processing_queue[presentation_id]['next_processing_time']})")
+            # Markieren, dass neues Feedback da ist - die Zeit wird nie nach hinten verschoben,
+            # bei erreichter Schwelle aber ggf. vorgezogen
+            data = feedback_processing_queue[presentation_id]
+            data['has_pending_feedback'] = True
+            if app.config['FEEDBACK_ADAPTIVE_BATCHING'] and presentation_id not in presentations_in_flight:
+                due = _next_due_locked(presentation_id, now)
+                if due < data['next_processing_time']:
+                    _enqueue_locked(presentation_id, due)
+            print(f"Feedback für Präsentation {presentation_id} markiert (nächste Verarbeitung: {data['next_processing_time']})")
+
+
+class PendingFeedback:
+    """Ein Feedback im Ingest-Puffer, das auf seinen Batch-Commit wartet"""
+
+    def __init__(self, presentation_id, content, participant_name):
+        self.presentation_id = presentation_id
+        self.content = content
+        self.participant_name = participant_name
+        self.created_at = datetime.utcnow()
+        self.error = None
+        self._committed = threading.Event()
+
+    def wait(self, timeout):
+        """True, wenn der Batch erfolgreich committet wurde"""
+        return self._committed.wait(timeout) and self.error is None
+
+    @property
+    def done(self):
+        """Schreibversuch abgeschlossen (erfolgreich oder mit error)"""
+        return self._committed.is_set()
+
+class FeedbackIngestBuffer:
+    """Sammelt Feedback-Inserts und schreibt sie gebündelt in einer Transaktion.
+
+    Ein Flusher-Thread pro Prozess schreibt alle FEEDBACK_INGEST_FLUSH_INTERVAL
+    Sekunden oder sobald FEEDBACK_INGEST_BATCH_SIZE Feedbacks vorliegen. Jede
+    betroffene Präsentation wird pro Batch nur einmal aktualisiert.
+
+    Haltbarkeit: Mit FEEDBACK_INGEST_WAIT_FOR_COMMIT=True (Standard) antwortet
+    submit_feedback erst nach dem Commit des Batches - ein bestätigtes Feedback
+    ist also genauso sicher gespeichert wie bisher, ein Absturz trifft nur noch
+    nicht bestätigte Requests. Ohne Warten wird sofort bestätigt; bei einem
+    Absturz gehen dann höchstens die Feedbacks des laufenden Sammelfensters verloren.
+
+    Schlägt ein Batch fehl, wird er einmal wiederholt und danach Feedback für
+    Feedback geschrieben, damit eine fehlerhafte Zeile nicht den ganzen Batch verwirft.
+    """
+
+    def __init__(self, flush_interval, batch_size):
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._pending = []
+        self._condition = threading.Condition()
+        self._thread = None
+        self.batches = 0
+        self.flushed = 0
+        self.failed = 0
+
+    def submit(self, presentation_id, content, participant_name=None):
+        item = PendingFeedback(presentation_id, content, participant_name)
+        with self._condition:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+            self._pending.append(item)
+            if len(self._pending) == 1 or len(self._pending) >= self.batch_size:
+                self._condition.notify()
+        return item
+
+    def cancel(self, item):
+        """Nimmt ein noch nicht geschriebenes Feedback aus dem Puffer.
+
+        False, wenn der Flusher es bereits übernommen hat - dann wird es eventuell
+        noch gespeichert und darf dem Client nicht als verloren gemeldet werden.
+        """
+        with self._condition:
+            for index, pending in enumerate(self._pending):
+                if pending is item:
+                    del self._pending[index]
+                    return True
+        return False
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending)
+
+                # Sammelfenster: weitere Feedbacks abwarten, bis der Batch voll ist
+                deadline = time.monotonic() + self.flush_interval
+                while len(self._pending) < self.batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+
+                batch = self._pending[:self.batch_size]
+                del self._pending[:self.batch_size]
+
+            self._flush(batch)
+
+    def _flush(self, batch):
+        with app.app_context():
+            error = self._write(batch)
+            if error is not None:
+                print(f"Fehler beim Schreiben von {len(batch)} Feedbacks, neuer Versuch: {error}")
+                error = self._write(batch)
+            if error is not None and len(batch) > 1:
+                print(f"Batch erneut fehlgeschlagen ({error}), Feedbacks werden einzeln geschrieben")
+                for item in batch:
+                    item.error = self._write([item])
+            else:
+                for item in batch:
+                    item.error = error
+
+        written = [item for item in batch if item.error is None]
+        if written:
+            self.batches += 1
+            self.flushed += len(written)
+        self.failed += len(batch) - len(written)
+        for item in batch:
+            if item.error is not None:
+                print(f"Feedback für Präsentation {item.presentation_id} nicht gespeichert: {item.error}")
+            item._committed.set()
+
+        counts = defaultdict(int)
+        for item in written:
+            counts[item.presentation_id] += 1
+        for presentation_id, count in counts.items():
+            content_change_notifier.notify(presentation_id)
+            # Im Worker-Modus genügt der Eintrag in processing_queue
+            if not feedback_processing_inline():
+                continue
+            # Feedback-Verarbeitung im Hintergrund planen
+            try:
+                schedule_feedback_processing(presentation_id, count=count)
+            except Exception as e:
+                print(f"Warnung: Feedback-Verarbeitung konnte nicht geplant werden: {e}")
+                # Feedback wurde trotzdem gespeichert
+
+    def _write(self, items):
+        """Schreibt Feedbacks in einer Transaktion und plant ihre Verarbeitung.
+        Gibt None oder die aufgetretene Exception zurück (die Transaktion ist dann zurückgerollt).
+        """
+        counts = defaultdict(int)
+        for item in items:
+            counts[item.presentation_id] += 1
+
+        try:
+            db.session.add_all([
+                Feedback(
+                    content=item.content,
+                    presentation_id=item.presentation_id,
+                    participant_name=item.participant_name,
+                    created_at=item.created_at
+                )
+                for item in items
+            ])
+
+            # Verarbeitung planen - ein UPDATE pro Batch statt pro Feedback
+            planned = {
+                presentation_id: planned_processing_time(presentation_id, count)
+                for presentation_id, count in counts.items()
+            }
+            Presentation.query.filter(Presentation.id.in_(set(counts))).update({
+                'processing_scheduled': True,
+                'next_processing_time': db.case(planned, value=Presentation.id)
+            }, synchronize_session=False)
+            upsert_processing_queue(planned)
+
+            db.session.commit()
+            return None
+        except Exception as e:
+            db.session.rollback()
+            return e
+
+    def stats(self):
+        with self._condition:
+            pending = len(self._pending)
+        return {
+            'pending': pending,
+            'batches': self.batches,
+            'flushed': self.flushed,
+            'failed': self.failed,
+            'avg_batch_size': round(self.flushed / self.batches, 2) if self.batches else None
+        }
+
+feedback_ingest_buffer = FeedbackIngestBuffer(
+    flush_interval=app.config['FEEDBACK_INGEST_FLUSH_INTERVAL'],
+    batch_size=app.config['FEEDBACK_INGEST_BATCH_SIZE']
+)
 
 @app.route('/p/<access_code>/feedback', methods=['POST'])
 def submit_feedback(access_code):
     try:
-        presentation = Presentation.get_by_access_code(access_code)
+        presentation = Presentation.lookup_access_code(access_code)
         if not presentation:
             from flask import abort
             abort(404)
@@ -1031,26 +2917,29 @@ def submit_feedback(access_code):
                 'error': 'Name ist zu lang (maximum 100 Zeichen)'
             }), 400
         
-        feedback = Feedback(
-            content=feedback_content.strip(),
-            presentation_id=presentation.id,
-            participant_name=participant_name.strip() if participant_name else None
+        # Feedback gebündelt speichern (Group Commit), Verarbeitung wird dabei geplant
+        pending = feedback_ingest_buffer.submit(
+            presentation.id,
+            feedback_content.strip(),
+            participant_name.strip() if participant_name else None
         )
         
-        db.session.add(feedback)
-        
-        # Verarbeitung planen
-        presentation.processing_scheduled = True
-        presentation.next_processing_time = datetime.utcnow() + timedelta(seconds=app.config['FEEDBACK_PROCESSING_INTERVAL'])
-        
-        db.session.commit()
-        
-        # Feedback-Verarbeitung im Hintergrund planen
-        try:
-            schedule_feedback_processing(presentation.id)
-        except Exception as e:
-            print(f"Warnung: Feedback-Verarbeitung konnte nicht geplant werden: {e}")
-            # Feedback wurde trotzdem gespeichert
+        # Ein Commit, der erst kurz nach dem Timeout fertig wurde, zählt als Erfolg
+        if (app.config['FEEDBACK_INGEST_WAIT_FOR_COMMIT'] and not pending.wait(app.config['FEEDBACK_INGEST_TIMEOUT'])
+                and not (pending.done and pending.error is None)):
+            if (pending.done and pending.error is not None) or feedback_ingest_buffer.cancel(pending):
+                # Sicher nicht gespeichert - erneutes Senden erzeugt kein Duplikat
+                return jsonify({
+                    'success': False,
+                    'error': 'Feedback konnte nicht gespeichert werden. Bitte versuchen Sie es erneut.'
+                }), 503
+            # Wird gerade geschrieben - nicht als Fehler melden, sonst sendet der Client doppelt
+            return jsonify({
+                'success': True,
+                'pending': True,
+                'ai_response': 'Ihr Feedback wird gespeichert und in Kürze verarbeitet.',
+                'processing': True
+            }), 202
         
         # Temporäre Antwort zurückgeben
         temp_response = "Ihre Anfrage wurde entgegengenommen und wird verarbeitet. Die Seite wird in Kürze aktualisiert."
@@ -1079,27 +2968,13 @@ def api_get_ai_content_public(id):
     if not presentation.live_info_visible:
         return jsonify({'success': False, 'error': 'Live-Info ist nicht freigegeben'}), 403
 
-    # Statische Info-Seite und Feedback-Bereich kombinieren
-    static_content = presentation.static_info_content or ""
-    feedback_content = presentation.feedback_content or ""
-    
-    # Inhalte kombinieren
-    if static_content and feedback_content:
-        combined_content = f"{static_content}\n\n{feedback_content}"
-    elif static_content:
-        combined_content = static_content
-    elif feedback_content:
-        combined_content = feedback_content
-    else:
-        combined_content = "Noch keine Inhalte verfügbar."
-    
-    # Zu HTML konvertieren
-    content_html = markdown_to_html(combined_content)
-    
-    return jsonify({
-        'success': True,
-        'html': str(content_html)
-    })
+    return conditional_json_response(
+        make_etag('public', presentation.id, presentation.content_version),
+        lambda: {
+            'success': True,
+            'html': render_public_live_info(presentation)
+        }
+    )
 
 @app.route('/api/presentation/<int:id>/ai_content', methods=['GET'])
 @login_required
@@ -1110,22 +2985,30 @@ def api_get_ai_content(id):
     if presentation.user_id != current_user.id and not current_user.is_admin:
         return jsonify({'success': False, 'error': 'Unauthorized'}), 403
 
-    # Statische Info-Seite und Feedback-Bereich kombinieren
-    combined_content = ""
+    resume_stale_static_info_job(presentation)
     
-    # Statische Info-Seite hinzufügen
-    if presentation.static_info_content:
-        combined_content += presentation.static_info_content
-    
-    # Feedback-Bereich hinzufügen (falls vorhanden)
-    if presentation.feedback_content:
-        combined_content += "\n\n---\n\n# Feedback der Zuhörer\n\n" + presentation.feedback_content
-
-    # Markdown zu HTML konvertieren
-    combined_html = markdown_to_html(combined_content)
+    return conditional_json_response(
+        make_etag('presenter', presentation.id, presentation.content_version),
+        lambda: {
+            'success': True,
+            'html': render_presenter_ai_content(presentation),
+            'static_info_job': {
+                'status': presentation.static_info_job_status,
+                'error': presentation.static_info_job_error
+            }
+        },
+        private=True
+    )
 
-    return jsonify({'success': True, 'html': combined_html})
 
+def feedback_list_validator(presentation_id):
+    """Günstige Aggregat-Abfrage, die sich bei neuen, gelöschten und verarbeiteten Feedbacks ändert"""
+    count, max_id, processed = db.session.query(
+        db.func.count(Feedback.id),
+        db.func.max(Feedback.id),
+        db.func.sum(db.cast(Feedback.is_processed, db.Integer))
+    ).filter(Feedback.presentation_id == presentation_id).one()
+    return count, max_id or 0, processed or 0
 
 @app.route('/api/feedbacks/<int:presentation_id>', methods=['GET'])
 @login_required
@@ -1136,20 +3019,146 @@ def api_get_feedbacks(presentation_id):
     if presentation.user_id != current_user.id and not current_user.is_admin:
         return jsonify({'success': False, 'error': 'Unauthorized access to feedbacks'}), 403
     
-    feedbacks = Feedback.query.filter_by(presentation_id=presentation_id).order_by(Feedback.created_at.desc()).all()
+    etag = make_etag('feedbacks', presentation_id, *feedback_list_validator(presentation_id))
     
-    result = []
-    for feedback in feedbacks:
-        result.append({
-            'id': feedback.id,
-            'content': feedback.content,
-            'created_at': feedback.created_at.isoformat(),
-            'is_processed': feedback.is_processed,
-            'ai_response': feedback.ai_response,
-            'participant_name': feedback.participant_name
-        })
+    def build_payload():
+        feedbacks = Feedback.query.filter_by(presentation_id=presentation_id).order_by(Feedback.created_at.desc()).all()
+        
+        result = []
+        for feedback in feedbacks:
+            result.append({
+                'id': feedback.id,
+                'content': feedback.content,
+                'created_at': feedback.created_at.isoformat(),
+                'is_processed': feedback.is_processed,
+                'ai_response': feedback.ai_response,
+                'participant_name': feedback.participant_name
+            })
+        return result
+    
+    return conditional_json_response(etag, build_payload, private=True)
+
+@app.route('/api/admin/stats', methods=['GET'])
+@login_required
+def api_admin_stats():
+    """Laufzeit-Statistiken dieses Worker-Prozesses (nur für Admins)"""
+    if not current_user.is_admin:
+        return jsonify({'success': False, 'error': 'Unauthorized'}), 403
+    
+    return jsonify({
+        'success': True,
+        'pid': os.getpid(),
+        'access_code_cache': access_code_cache.stats(),
+        'feedback_clustering': feedback_clustering_stats,
+        'feedback_compaction': feedback_compaction_stats,
+        'feedback_map_results_cached': len(feedback_map_results),
+        'feedback_ingest': feedback_ingest_buffer.stats(),
+        'feedback_processing': feedback_processing_stats(),
+        'llm': llm_client.stats(),
+        'sse_streams': dict(content_change_notifier.stats(), state_cache=len(stream_state_cache)),
+        'static_info_cache': static_info_result_cache.stats(),
+        'static_info_jobs': static_info_job_stats()
+    })
+
+# Server-Sent Events
+def format_sse(event, data):
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+# Letzter DB-Stand pro Präsentation, geteilt von allen Streams eines Prozesses:
+# (presentation_id, include_feedbacks) -> (checked_at, counter, (version, feedbacks))
+stream_state_cache = {}
+
+def current_stream_state(presentation_id, include_feedbacks, counter):
+    """Liefert (content_version, feedback_validator) - höchstens eine DB-Abfrage pro Intervall"""
+    key = (presentation_id, include_feedbacks)
+    now = time.monotonic()
+    cached = stream_state_cache.get(key)
+    if cached and cached[1] == counter and now - cached[0] < app.config['SSE_CHECK_INTERVAL']:
+        return cached[2]
+
+    with app.app_context():
+        version = db.session.query(Presentation.content_version).filter_by(
+            id=presentation_id, is_deleted=False
+        ).scalar()
+        feedbacks = feedback_list_validator(presentation_id) if include_feedbacks else None
+
+    state = (version, feedbacks)
+    stream_state_cache[key] = (now, counter, state)
+    return state
+
+def content_event_stream(presentation_id, include_feedbacks=False):
+    """Generator für den Event-Stream einer Präsentation.
+
+    Wartet auf prozesslokale Benachrichtigungen und prüft zusätzlich alle
+    SSE_CHECK_INTERVAL Sekunden die Inhaltsversion in der Datenbank, damit auch
+    Änderungen aus anderen Workern ankommen. Zwischen den Prüfungen wird keine
+    DB-Verbindung gehalten.
+    """
+    check_interval = app.config['SSE_CHECK_INTERVAL']
+    deadline = time.monotonic() + app.config['SSE_STREAM_MAX_DURATION']
+    last_version = None
+    last_feedbacks = None
+    counter = content_change_notifier.subscribe(presentation_id)
+
+    try:
+        yield f"retry: {check_interval * 1000}\n\n"
+
+        while time.monotonic() < deadline:
+            version, feedbacks = current_stream_state(presentation_id, include_feedbacks, counter)
+            if version is None:
+                yield format_sse('deleted', {})
+                return
+
+            sent = False
+            if version != last_version:
+                if last_version is not None:
+                    yield format_sse('content', {'version': version})
+                    sent = True
+                last_version = version
+            if feedbacks != last_feedbacks:
+                if last_feedbacks is not None:
+                    yield format_sse('feedbacks', {'count': feedbacks[0]})
+                    sent = True
+                last_feedbacks = feedbacks
+            if not sent:
+                # Keep-Alive, damit abgebrochene Verbindungen erkannt werden
+                yield ": keep-alive\n\n"
+
+            counter = content_change_notifier.wait(presentation_id, counter, check_interval)
+    finally:
+        # Auch bei Verbindungsabbruch: Einträge ohne Stream nicht aufbewahren
+        if content_change_notifier.unsubscribe(presentation_id):
+            for include in (False, True):
+                stream_state_cache.pop((presentation_id, include), None)
+
+def event_stream_response(presentation_id, include_feedbacks=False):
+    if not app.config['SSE_ENABLED']:
+        # 204 beendet die automatische Wiederverbindung von EventSource
+        return Response(status=204)
+    response = Response(content_event_stream(presentation_id, include_feedbacks), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'  # Nginx-Pufferung deaktivieren
+    return response
+
+@app.route('/p/<access_code>/events')
+def public_events(access_code):
+    presentation = Presentation.lookup_access_code(access_code)
+    if not presentation:
+        from flask import abort
+        abort(404)
+    if not presentation.live_info_visible:
+        return Response(status=204)
+    return event_stream_response(presentation.id)
+
+@app.route('/presentation/<int:id>/events')
+@login_required
+def presentation_events(id):
+    presentation = Presentation.get_active_or_404(id)
     
-    return jsonify(result)
+    # Überprüfen, ob der Benutzer der Ersteller ist
+    if presentation.user_id != current_user.id and not current_user.is_admin:
+        return Response(status=403)
+    return event_stream_response(presentation.id, include_feedbacks=True)
 
 @app.route('/api/generate_preview', methods=['POST'])
 @login_required
@@ -1197,6 +3206,128 @@ def api_generate_preview():
             'error': str(e)
         })
 
+@app.route('/api/generate_preview/stream', methods=['POST'])
+@login_required
+def api_generate_preview_stream():
+    """Wie /api/generate_preview, liefert die Vorschau aber schrittweise als Server-Sent Events.
+    
+    Events: 'partial' (gerenderter Zwischenstand), 'done' (fertige Vorschau), 'error'.
+    """
+    # Rate-Limiting überprüfen
+    if not check_ai_rate_limit(current_user.id):
+        return jsonify({
+            'success': False,
+            'error': f'Rate-Limit erreicht. Maximal {AI_CALLS_PER_HOUR} AI-Aufrufe pro Stunde erlaubt.'
+        }), 429
+    
+    data = request.json or {}
+    context = data.get('context', '')
+    content = data.get('content', '')
+    additional_info = data.get('additional_info', '') or None
+    
+    if not context or not content:
+        return jsonify({
+            'success': False,
+            'error': 'Kontext und Inhalt sind erforderlich'
+        })
+    
+    # Gleiche Eingaben wie /api/generate_preview, damit beide denselben Cache nutzen
+    inputs = dict(
+        title="Präsentationsvorschau",
+        description="Generierte Vorschau",
+        context=context,
+        content=content,
+        additional_info=additional_info
+    )
+    key = static_info_cache_key(**inputs)
+    messages = build_static_info_messages(**inputs)
+    render_interval = app.config['PREVIEW_STREAM_RENDER_INTERVAL']
+    cached = static_info_result_cache.lookup(key)
+    
+    def stream():
+        if cached is not None:
+            yield format_sse('done', {'preview': cached, 'preview_html': render_markdown_html(cached)})
+            return
+        
+        parts = []
+        last_render = 0
+        # Gesamt-Deadline: ein hängender Upstream belegt Verbindung und KI-Platz nicht unbegrenzt
+        deadline = time.monotonic() + app.config['PREVIEW_STREAM_DEADLINE']
+        chunks = llm_client.stream_chat_completion(
+            model=STATIC_INFO_MODEL, messages=messages, max_tokens=5000, deadline=deadline
+        )
+        try:
+            for delta in chunks:
+                parts.append(delta)
+                now = time.monotonic()
+                # Markdown nicht bei jedem Token neu rendern
+                if now - last_render >= render_interval:
+                    last_render = now
+                    yield format_sse('partial', {'preview_html': render_markdown_html(''.join(parts))})
+        except DeadlineExceededError as e:
+            print(f"Gestreamte Vorschau abgebrochen: {str(e)}")
+            yield format_sse('error', {'error': 'Die KI-Vorschau hat zu lange gedauert. Bitte versuchen Sie es erneut.'})
+            return
+        except LLMError as e:
+            print(f"Fehler bei der gestreamten Vorschau: {str(e)}")
+            yield format_sse('error', {'error': 'Die KI-Vorschau konnte nicht generiert werden.'})
+            return
+        finally:
+            # Bei Verbindungsabbruch des Browsers den Upstream-Stream sofort schließen
+            chunks.close()
+        
+        preview = clean_markdown_response(''.join(parts))
+        if preview:
+            with app.app_context():
+                static_info_result_cache.store(key, preview)
+        yield format_sse('done', {'preview': preview, 'preview_html': render_markdown_html(preview)})
+    
+    response = Response(stream(), mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'  # Nginx-Pufferung deaktivieren
+    return response
+
+@app.cli.command('backfill-html')
+def backfill_html_command():
+    """Füllt static_info_html und feedback_html für bestehende Präsentationen."""
+    presentations = Presentation.query.filter(
+        db.or_(
+            db.and_(Presentation.static_info_content.isnot(None), Presentation.static_info_html.is_(None)),
+            db.and_(Presentation.feedback_content.isnot(None), Presentation.feedback_html.is_(None))
+        )
+    ).all()
+    
+    for presentation in presentations:
+        # Sichtbarer Inhalt bleibt gleich - daher keine neue Inhaltsversion
+        presentation.static_info_html = render_markdown_html(presentation.static_info_content)
+        presentation.feedback_html = render_markdown_html(presentation.feedback_content)
+    
+    db.session.commit()
+    print(f"HTML für {len(presentations)} Präsentationen vorgerendert")
+
+@app.cli.command('feedback-worker')
+def feedback_worker_command():
+    """Verarbeitet Feedback in einem eigenen Prozess (für FEEDBACK_PROCESSING_MODE=worker)."""
+    global processing_seen_feedback_id
+    processing_seen_feedback_id = db.session.query(db.func.max(Feedback.id)).scalar() or 0
+    count = recover_processing_queue()
+    start_processing_thread()
+    print(f"Feedback-Worker {processing_worker_id()} gestartet: {count} Präsentationen eingeplant, "
+          f"bis zu {app.config['FEEDBACK_MAX_IN_FLIGHT']} parallel")
+    
+    try:
+        while True:
+            try:
+                sync_processing_queue()
+            except Exception as e:
+                print(f"Warnung: Warteschlange konnte nicht gelesen werden: {e}")
+            finally:
+                db.session.remove()
+            time.sleep(app.config['FEEDBACK_WORKER_POLL_INTERVAL'])
+    except KeyboardInterrupt:
+        # Laufende Verarbeitungen übernimmt nach Ablauf der Lease ein anderer Worker
+        print("Feedback-Worker beendet")
+
 # Hilfsfunktion für Datenbankmigrationen
 def add_columns_if_not_exist():
     with app.app_context():
@@ -1241,10 +3372,59 @@ def add_columns_if_not_exist():
             with db.engine.begin() as conn:
                 conn.execute(db.text('ALTER TABLE presentation ADD COLUMN live_info_visible BOOLEAN DEFAULT FALSE'))
         
+        # Pre-rendered HTML columns
+        if 'static_info_html' not in presentation_columns:
+            with db.engine.begin() as conn:
+                conn.execute(db.text('ALTER TABLE presentation ADD COLUMN static_info_html TEXT'))
+        
+        if 'feedback_html' not in presentation_columns:
+            with db.engine.begin() as conn:
+                conn.execute(db.text('ALTER TABLE presentation ADD COLUMN feedback_html TEXT'))
+        
+        # Background job columns for the info page
+        if 'static_info_job_status' not in presentation_columns:
+            with db.engine.begin() as conn:
+                conn.execute(db.text('ALTER TABLE presentation ADD COLUMN static_info_job_status VARCHAR(20)'))
+        
+        if 'static_info_job_generation' not in presentation_columns:
+            with db.engine.begin() as conn:
+                conn.execute(db.text('ALTER TABLE presentation ADD COLUMN static_info_job_generation INTEGER DEFAULT 0 NOT NULL'))
+        
+        if 'static_info_job_error' not in presentation_columns:
+            with db.engine.begin() as conn:
+                conn.execute(db.text('ALTER TABLE presentation ADD COLUMN static_info_job_error TEXT'))
+        
+        if 'static_info_job_requested_at' not in presentation_columns:
+            with db.engine.begin() as conn:
+                conn.execute(db.text('ALTER TABLE presentation ADD COLUMN static_info_job_requested_at TIMESTAMP'))
+        
+        # Digest of the info page for feedback prompts
+        if 'static_info_digest' not in presentation_columns:
+            with db.engine.begin() as conn:
+                conn.execute(db.text('ALTER TABLE presentation ADD COLUMN static_info_digest TEXT'))
+        
+        if 'static_info_digest_hash' not in presentation_columns:
+            with db.engine.begin() as conn:
+                conn.execute(db.text('ALTER TABLE presentation ADD COLUMN static_info_digest_hash VARCHAR(64)'))
+        
+        # Structured feedback area (JSON)
+        if 'feedback_items' not in presentation_columns:
+            with db.engine.begin() as conn:
+                conn.execute(db.text('ALTER TABLE presentation ADD COLUMN feedback_items TEXT'))
+        
+        # Content version column (ETags / HTML-Cache)
+        if 'content_version' not in presentation_columns:
+            with db.engine.begin() as conn:
+                conn.execute(db.text('ALTER TABLE presentation ADD COLUMN content_version INTEGER DEFAULT 0 NOT NULL'))
+        
         # Feedback table columns
         if 'participant_name' not in feedback_columns:
             with db.engine.begin() as conn:
                 conn.execute(db.text('ALTER TABLE feedback ADD COLUMN participant_name VARCHAR(100)'))
+        
+        # Index for pending feedback (processing and queue recovery)
+        with db.engine.begin() as conn:
+            conn.execute(db.text('CREATE INDEX IF NOT EXISTS ix_feedback_is_processed ON feedback (is_processed, presentation_id)'))
 
 if __name__ == '__main__':
     with app.app_context():
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark: near-duplicate grouping and topic clustering of feedback
+
+Generates a synthetic session in which popular questions are repeated many
+times with small variations (case, punctuation, extra words, typos), mixed
+with unique comments, and reports grouping time and compression. A second
+run clusters a batch of long (~500 character) feedbacks by topic.
+
+Usage: python bench_feedback_grouping.py [messages] [long_feedbacks]
+"""
+
+import random
+import sys
+import time
+from feedback_grouping import group_near_duplicates, cluster_by_topic
+
+POPULAR = [
+    "Gibt es die Folien?",
+    "Können Sie die Folien teilen?",
+    "Wie skaliert das System bei vielen Nutzern?",
+    "Welche Datenbank wird verwendet?",
+    "Ist der Code Open Source?",
+    "Wie hoch sind die Kosten pro Monat?",
+    "Toller Vortrag, vielen Dank!",
+    "Kann man das auch lokal betreiben?",
+]
+SUFFIXES = ["", "?", "??", " bitte", " :)", " danke", "!"]
+WORDS = ("daten modell server latenz cache thread speicher anfrage antwort nutzer "
+         "fehler sicherheit prompt token budget schnittstelle vortrag beispiel").split()
+
+def vary(text, rng):
+    text = text + rng.choice(SUFFIXES)
+    if rng.random() < 0.3:
+        text = text.lower()
+    if rng.random() < 0.2:
+        position = rng.randrange(len(text))
+        text = text[:position] + text[position + 1:]  # Tippfehler
+    return text
+
+def make_session(count, seed=42):
+    rng = random.Random(seed)
+    messages = []
+    for _ in range(count):
+        if rng.random() < 0.7:
+            messages.append(vary(rng.choice(POPULAR), rng))
+        else:
+            messages.append("Frage zu " + " ".join(rng.sample(WORDS, 5)) + "?")
+    return messages
+
+TOPICS = [
+    "datenbank sqlite postgres index abfrage transaktion sperre".split(),
+    "folien slides download pdf link teilen aufzeichnung".split(),
+    "kosten preis lizenz budget monat abo rechnung".split(),
+    "skalierung nutzer last server performance latenz durchsatz".split(),
+    "datenschutz dsgvo einwilligung speicherung loeschung anonym".split(),
+]
+
+def make_long_feedbacks(count, seed=7):
+    """Längere Feedbacks (~500 Zeichen), jeweils überwiegend zu einem Thema"""
+    rng = random.Random(seed)
+    feedbacks = []
+    for _ in range(count):
+        topic = rng.choice(TOPICS)
+        words = [rng.choice(topic) if rng.random() < 0.4 else rng.choice(WORDS) for _ in range(80)]
+        feedbacks.append(" ".join(words)[:500])
+    return feedbacks
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    long_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    messages = make_session(count)
+
+    start = time.perf_counter()
+    groups = group_near_duplicates(messages)
+    elapsed = time.perf_counter() - start
+
+    largest = sorted(groups, key=len, reverse=True)[:5]
+    print(f"Near-duplicate grouping: {count} messages")
+    print(f"  {elapsed:.2f}s total, {elapsed / count * 1e6:.0f}µs per message")
+    print(f"  {len(groups)} prompt lines ({count / len(groups):.1f}x fewer)")
+    print("  Largest groups:")
+    for group in largest:
+        print(f"    {len(group):5d}x {group[0]}")
+
+    feedbacks = make_long_feedbacks(long_count)
+    cluster_by_topic(feedbacks[:10])  # NumPy aufwärmen
+    start = time.perf_counter()
+    clusters = cluster_by_topic(feedbacks)
+    elapsed = time.perf_counter() - start
+    print(f"\nTopic clustering: {long_count} feedbacks of ~500 characters")
+    print(f"  {elapsed * 1000:.0f}ms total")
+    print(f"  {len(clusters)} prompt lines ({long_count / len(clusters):.1f}x fewer)")
+    return True
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark: feedback ingest with one commit per request vs. group commit
+
+Simulates a burst of concurrent feedback submissions for one presentation
+against a temporary SQLite database and reports commits per second and
+feedbacks per second for both strategies.
+
+Usage: python bench_feedback_ingest.py [threads] [feedbacks_per_thread]
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+# Eigene Datenbank, damit die Messung nicht die echte Instanz berührt
+os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(tempfile.mkdtemp(), 'bench.db')
+
+from sqlalchemy import event
+from app import app, db, User, Presentation, Feedback, FeedbackIngestBuffer
+
+commit_count = 0
+
+def count_commit(conn):
+    global commit_count
+    commit_count += 1
+
+def submit_per_request(presentation_id, content):
+    """Bisheriges Verhalten: Insert + Präsentations-Update + Commit pro Request"""
+    with app.app_context():
+        presentation = db.session.get(Presentation, presentation_id)
+        db.session.add(Feedback(content=content, presentation_id=presentation_id))
+        presentation.processing_scheduled = True
+        presentation.next_processing_time = datetime.utcnow() + timedelta(seconds=60)
+        db.session.commit()
+
+def run_burst(submit, threads, per_thread):
+    global commit_count
+    commit_count = 0
+    errors = []
+
+    def worker(n):
+        for i in range(per_thread):
+            try:
+                submit(f"Frage {n}-{i}: Gibt es die Folien?")
+            except Exception as e:
+                errors.append(e)
+
+    workers = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    start = time.perf_counter()
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return elapsed, commit_count, len(errors)
+
+def main():
+    threads = int(sys.argv[1]) if len(sys.argv) > 1 else 32
+    per_thread = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    total = threads * per_thread
+
+    with app.app_context():
+        db.create_all()
+        user = User(username='bench')
+        user.set_password('bench')
+        db.session.add(user)
+        db.session.commit()
+        presentation = Presentation(title='Benchmark', access_code='bench001', user_id=user.id)
+        db.session.add(presentation)
+        db.session.commit()
+        presentation_id = presentation.id
+        event.listen(db.engine, 'commit', count_commit)
+
+    print(f"Feedback ingest benchmark: {threads} threads x {per_thread} feedbacks = {total}\n")
+
+    elapsed, commits, errors = run_burst(
+        lambda content: submit_per_request(presentation_id, content), threads, per_thread)
+    print("Per-request commit:")
+    print(f"  {elapsed:.2f}s, {commits} commits, {errors} errors")
+    print(f"  {commits / elapsed:.0f} commits/s, {total / elapsed:.0f} feedbacks/s")
+
+    buffer = FeedbackIngestBuffer(
+        flush_interval=app.config['FEEDBACK_INGEST_FLUSH_INTERVAL'],
+        batch_size=app.config['FEEDBACK_INGEST_BATCH_SIZE']
+    )
+
+    def submit_buffered(content):
+        if not buffer.submit(presentation_id, content).wait(30):
+            raise RuntimeError("Feedback wurde nicht committet")
+
+    elapsed, commits, errors = run_burst(submit_buffered, threads, per_thread)
+    stats = buffer.stats()
+    print("\nGroup commit (waiting for commit):")
+    print(f"  {elapsed:.2f}s, {commits} commits, {errors} errors, avg batch {stats['avg_batch_size']}")
+    print(f"  {commits / elapsed:.0f} commits/s, {total / elapsed:.0f} feedbacks/s")
+
+    with app.app_context():
+        stored = Feedback.query.filter_by(presentation_id=presentation_id).count()
+    print(f"\nStored feedbacks: {stored} (expected {2 * total})")
+    return stored == 2 * total
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
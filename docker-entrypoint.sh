@@ -6,16 +6,16 @@ echo "Starting PresentAI..."
 # Ensure instance directory exists
 mkdir -p instance
 
-# Initialize database if it doesn't exist
-if [ ! -f "instance/presentations.db" ]; then
-    echo "Initializing database..."
-    python -c "
-from app import app, db
+# Create missing tables and columns on every start - existing databases also
+# need the tables added later (e.g. processing_queue, static_info_cache)
+echo "Migrating database..."
+python -c "
+from app import app, db, add_columns_if_not_exist
 with app.app_context():
     db.create_all()
-    print('Database tables created successfully')
+add_columns_if_not_exist()
+print('Database schema up to date')
 "
-fi
 
 echo "Starting Gunicorn..."
 exec python -m gunicorn \
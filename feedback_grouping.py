@@ -0,0 +1,222 @@
+# feedback_grouping.py
+"""
+Erkennung von (Beinahe-)Duplikaten im Zuhörer-Feedback.
+
+Gleiche Fragen kommen in Fragerunden oft dutzendfach ("Folien?", "folien??",
+"Gibt es die Folien?"). Vor dem KI-Aufruf werden solche Feedbacks zu einer
+Gruppe zusammengefasst, damit jede Frage nur einmal (mit Anzahl) im Prompt steht.
+
+Verfahren: Normalisierung (Kleinschreibung, Umlaute, Satzzeichen), danach
+Zeichen-Trigramme mit MinHash-Signaturen und LSH-Bändern zur Kandidatensuche.
+Kandidaten werden über die exakte Jaccard-Ähnlichkeit der Trigramme bestätigt.
+Identische normalisierte Texte werden ohne MinHash direkt zugeordnet. Texte mit
+unterschiedlichen URLs oder Zahlen ("Raum A um 14 Uhr" / "Raum B um 16 Uhr") werden
+nie zusammengefasst, da im Prompt nur der Repräsentant einer Gruppe steht.
+
+Für große Batches fasst cluster_by_topic zusätzlich thematisch ähnliche
+Feedbacks zusammen (TF-IDF mit NumPy, Kosinus-Ähnlichkeit, gierige Gruppierung).
+"""
+
+import hashlib
+import math
+import re
+import struct
+from collections import Counter, defaultdict
+
+import numpy as np
+
+NUM_PERM = 32  # Länge der MinHash-Signatur (16-Bit-Werte aus einem BLAKE2b-Digest)
+BANDS = 8      # LSH-Bänder à NUM_PERM / BANDS Zeilen -> Kandidatenschwelle ca. 0.6
+
+_UMLAUTS = str.maketrans({'ä': 'ae', 'ö': 'oe', 'ü': 'ue', 'ß': 'ss'})
+_NON_ALNUM = re.compile(r'[^0-9a-z]+')
+_TERM = re.compile(r'[0-9a-z]{3,}')
+_URL = re.compile(r'https?://[^\s<>()\[\]"\']+')
+_NUMBER = re.compile(r'\d+')
+
+
+def normalize(text):
+    """Vereinheitlicht Schreibweisen: Kleinschreibung, Umlaute, ohne Satzzeichen"""
+    text = (text or '').casefold().translate(_UMLAUTS)
+    return _NON_ALNUM.sub(' ', text).strip()
+
+
+def anchors(text):
+    """URLs und Zahlen eines Textes - Texte einer Gruppe müssen darin übereinstimmen"""
+    text = text or ''
+    urls = {url.rstrip('.,;:!?') for url in _URL.findall(text)}
+    return frozenset(urls) | frozenset(_NUMBER.findall(_URL.sub(' ', text)))
+
+
+def shingles(normalized, size=3):
+    """Zeichen-Trigramme eines normalisierten Textes"""
+    if len(normalized) <= size:
+        return {normalized}
+    return {normalized[i:i + size] for i in range(len(normalized) - size + 1)}
+
+
+def minhash(shingle_set):
+    """MinHash-Signatur: ein BLAKE2b-Digest pro Trigramm liefert NUM_PERM Hashwerte"""
+    hashes = [
+        struct.unpack(f'<{NUM_PERM}H', hashlib.blake2b(shingle.encode('utf-8'), digest_size=NUM_PERM * 2).digest())
+        for shingle in shingle_set
+    ]
+    return tuple(min(column) for column in zip(*hashes))
+
+
+def jaccard(a, b):
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class NearDuplicateIndex:
+    """Index über Feedback-Texte, der ähnliche Texte derselben Gruppe zuordnet.
+
+    Jede Gruppe wird durch ihren ersten Text repräsentiert; neue Texte werden nur
+    mit den Repräsentanten verglichen, die in einem LSH-Band kollidieren und
+    dieselben URLs und Zahlen enthalten.
+    """
+
+    def __init__(self, threshold=0.6):
+        self.threshold = threshold
+        self.rows = NUM_PERM // BANDS
+        self.groups = []                     # [[key, ...], ...] in Reihenfolge des ersten Auftretens
+        self._exact = {}                     # (normalisierter Text, Anker) -> Gruppenindex
+        self._shingles = []                  # Gruppenindex -> Trigramme des Repräsentanten
+        self._anchors = []                   # Gruppenindex -> URLs und Zahlen des Repräsentanten
+        self._buckets = defaultdict(list)    # (Band, Bandwerte) -> [Gruppenindex]
+
+    def add(self, key, text):
+        """Fügt einen Text hinzu und gibt den Index seiner Gruppe zurück"""
+        normalized = normalize(text)
+        text_anchors = anchors(text)
+        group = self._exact.get((normalized, text_anchors))
+        if group is not None:
+            self.groups[group].append(key)
+            return group
+
+        shingle_set = shingles(normalized)
+        signature = minhash(shingle_set)
+        bands = [(band, signature[band * self.rows:(band + 1) * self.rows]) for band in range(BANDS)]
+
+        best_group, best_score = None, self.threshold
+        seen = set()
+        for band in bands:
+            for candidate in self._buckets.get(band, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                if self._anchors[candidate] != text_anchors:
+                    continue
+                score = jaccard(shingle_set, self._shingles[candidate])
+                if score >= best_score:
+                    best_group, best_score = candidate, score
+
+        if best_group is None:
+            best_group = len(self.groups)
+            self.groups.append([])
+            self._shingles.append(shingle_set)
+            self._anchors.append(text_anchors)
+            for band in bands:
+                self._buckets[band].append(best_group)
+
+        self._exact[(normalized, text_anchors)] = best_group
+        self.groups[best_group].append(key)
+        return best_group
+
+
+def group_near_duplicates(items, text=lambda item: item, threshold=0.6):
+    """Gruppiert Elemente mit (beinahe) gleichem Text.
+
+    Gibt eine Liste von Gruppen (Listen der Elemente) in Reihenfolge des ersten
+    Auftretens zurück; das erste Element jeder Gruppe ist ihr Repräsentant.
+    """
+    items = list(items)
+    index = NearDuplicateIndex(threshold)
+    for position, item in enumerate(items):
+        index.add(position, text(item))
+    return [[items[position] for position in group] for group in index.groups]
+
+
+# Füllwörter ohne thematische Aussage (nach normalize, also ohne Umlaute)
+TOPIC_STOPWORDS = set("""
+aber alle als also auch auf aus bei bin bis bitte dann das dass dem den der des die dies diese
+dieser dieses doch durch ein eine einem einen einer eines fuer gibt hat hier ich ihr ihre ist
+jetzt kann koennen man mit nach nicht noch nur oder sehr sich sie sind und uns vom von war was
+welche wenn wer wie wir wird wurde zum zur ueber the and for you are this that with what how
+""".split())
+
+
+def topic_terms(text):
+    """Begriffe ab drei Zeichen (normalisiert wie normalize), ohne Füllwörter"""
+    words = _TERM.findall((text or '').casefold().translate(_UMLAUTS))
+    return [word for word in words if word not in TOPIC_STOPWORDS]
+
+
+def tfidf_matrix(texts, max_features=2048):
+    """L2-normierte TF-IDF-Matrix (Texte x Begriffe) als float32.
+
+    Begriffe, die nur in einem Text vorkommen, tragen nichts zur Ähnlichkeit
+    zwischen Texten bei und werden weggelassen; übrig bleiben die max_features
+    Begriffe mit der höchsten Dokumenthäufigkeit.
+    """
+    documents = [Counter(topic_terms(text)) for text in texts]
+    document_frequency = Counter(term for document in documents for term in document)
+    vocabulary = [term for term, df in document_frequency.most_common(max_features) if df > 1]
+    column = {term: index for index, term in enumerate(vocabulary)}
+
+    rows, columns, counts = [], [], []
+    for row, document in enumerate(documents):
+        for term, count in document.items():
+            index = column.get(term)
+            if index is not None:
+                rows.append(row)
+                columns.append(index)
+                counts.append(count)
+    matrix = np.zeros((len(texts), len(vocabulary)), dtype=np.float32)
+    matrix[rows, columns] = counts
+
+    if vocabulary:
+        idf = np.array([math.log(len(texts) / document_frequency[term]) + 1.0 for term in vocabulary], dtype=np.float32)
+        matrix *= idf
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix /= np.where(norms > 0, norms, 1.0)
+    return matrix
+
+
+def cluster_by_topic(items, text=lambda item: item, threshold=0.5, max_features=2048):
+    """Gruppiert Elemente nach thematischer Ähnlichkeit (Kosinus über TF-IDF).
+
+    Gierig: Das Element mit den meisten noch freien ähnlichen Nachbarn wird
+    Repräsentant und übernimmt diese Nachbarn, bis alle Elemente verteilt sind.
+    Gibt Gruppen (Listen der Elemente) zurück, der Repräsentant steht vorne.
+    """
+    items = list(items)
+    if len(items) < 2:
+        return [items] if items else []
+
+    matrix = tfidf_matrix([text(item) for item in items], max_features)
+    neighbors = (matrix @ matrix.T) >= threshold
+    np.fill_diagonal(neighbors, True)
+    # Texte ohne gemeinsame Begriffe (Nullvektor) bleiben für sich
+    neighbors &= matrix.any(axis=1)[:, None] | np.eye(len(items), dtype=bool)
+
+    unassigned = np.ones(len(items), dtype=bool)
+    counts = neighbors.sum(axis=1)  # freie Nachbarn je Element (inkl. sich selbst)
+    groups = []
+    while unassigned.any():
+        representative = int(np.where(unassigned, counts, -1).argmax())
+        if counts[representative] <= 1:
+            # Nur noch Einzelgänger übrig
+            groups.extend([items[index]] for index in np.flatnonzero(unassigned))
+            break
+        members = np.flatnonzero(neighbors[representative] & unassigned)
+        unassigned[members] = False
+        counts -= neighbors[:, members].sum(axis=1)
+        groups.append([items[representative]] + [items[m] for m in members if m != representative])
+
+    # Reihenfolge des ersten Auftretens beibehalten
+    position = {id(item): index for index, item in enumerate(items)}
+    groups.sort(key=lambda group: min(position[id(item)] for item in group))
+    return groups
@@ -0,0 +1,563 @@
+# llm_client.py
+"""
+Gemeinsamer HTTP-Client für alle OpenAI-Aufrufe.
+
+Alle KI-Aufrufe der Anwendung laufen über eine gemeinsame requests.Session mit
+Connection-Pool (Keep-Alive), Connect-/Read-Timeouts und Latenz-Statistiken.
+Optional begrenzt max_concurrent die gleichzeitigen Aufrufe über alle Threads
+(Scheduler, Map-Reduce, Info-Seiten, Vorschau) - weitere Aufrufe warten.
+Ein gemeinsamer Circuit Breaker schützt den Upstream, wenn er ausfällt.
+Latenzkritische Aufrufe können eine Deadline mitgeben und gesichert (hedged) laufen:
+Kommt bis zum hedge_percentile-Perzentil der beobachteten Latenz keine Antwort, geht
+eine zweite, identische Anfrage raus - die erste Antwort gewinnt.
+"""
+
+import json
+import queue
+import random
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
+
+
+class LLMError(Exception):
+    """Fehler bei einem LLM-Aufruf (Netzwerk, Timeout oder ungültige Antwort).
+
+    upstream_failure: Der Upstream ist gestört (Netzwerk, Timeout, 5xx, 429) - im
+    Gegensatz zu Fehlern der Anfrage selbst (z.B. 400), die der Breaker ignoriert.
+    """
+
+    def __init__(self, message, upstream_failure=True, retry_after=None):
+        super().__init__(message)
+        self.upstream_failure = upstream_failure
+        self.retry_after = retry_after  # Sekunden, falls vom Upstream vorgegeben (Retry-After)
+
+
+class CircuitOpenError(LLMError):
+    """Aufruf wurde nicht ausgeführt, weil der Circuit Breaker offen ist"""
+
+
+class DeadlineExceededError(LLMError):
+    """Die Deadline des Aufrufs ist abgelaufen.
+
+    upstream_failure: Die Anfrage wurde gesendet, aber bis zur Deadline kam keine
+    Antwort - das zählt für den Breaker wie ein Timeout. Ein Aufruf, der wegen der
+    Deadline gar nicht mehr gestartet wurde, sagt nichts über den Upstream aus.
+    """
+
+    def __init__(self, message, upstream_failure=False):
+        super().__init__(message, upstream_failure=upstream_failure)
+
+
+def status_error(response, detail):
+    """LLMError für eine Antwort mit Fehlerstatus (5xx und 429 zählen als Upstream-Störung)"""
+    retry_after = response.headers.get('Retry-After')
+    try:
+        retry_after = float(retry_after) if retry_after else None
+    except ValueError:
+        retry_after = None
+    return LLMError(
+        f"Ungültige Antwort ({response.status_code}): {detail}",
+        upstream_failure=response.status_code >= 500 or response.status_code == 429,
+        retry_after=retry_after
+    )
+
+
+class CircuitBreaker:
+    """Gemeinsamer Circuit Breaker für alle Aufrufe an einen Upstream.
+
+    closed: Aufrufe laufen normal. Nach failure_threshold Störungen in Folge -> open.
+    open: Aufrufe schlagen sofort mit CircuitOpenError fehl. Die Wartezeit verdoppelt
+          sich mit jeder erneuten Öffnung (base_delay bis max_delay) und wird zufällig
+          um bis zu jitter (Anteil) verkürzt, damit Prozesse nicht im Gleichtakt testen.
+    half_open: Nach Ablauf der Wartezeit darf genau ein Probe-Aufruf durch. Erfolg
+          schließt den Breaker, eine Störung öffnet ihn mit längerer Wartezeit.
+    """
+
+    def __init__(self, failure_threshold=5, base_delay=2.0, max_delay=120.0, jitter=0.5):
+        self.failure_threshold = failure_threshold
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+        self._lock = threading.Lock()
+        self._state = 'closed'
+        self._failures = 0         # Störungen in Folge
+        self._open_count = 0       # Öffnungen seit dem letzten Erfolg (für den Backoff)
+        self._open_until = 0.0
+        self._probe_in_flight = False
+        self._opened = 0
+        self._rejected = 0
+        self._last_error = None
+
+    def before_call(self):
+        """Prüft, ob ein Aufruf erlaubt ist. Gibt True zurück, wenn er der Probe-Aufruf ist"""
+        with self._lock:
+            if self._state == 'closed':
+                return False
+            now = time.monotonic()
+            if self._state == 'open' and now >= self._open_until:
+                self._state = 'half_open'
+            if self._state == 'half_open' and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            self._rejected += 1
+            retry_after = max(self._open_until - now, 0.0)
+        raise CircuitOpenError(
+            f"KI-Dienst gestört, Circuit Breaker offen (nächster Versuch in {retry_after:.0f}s): {self._last_error}",
+            retry_after=retry_after
+        )
+
+    def record_success(self, probe=False):
+        with self._lock:
+            if probe or self._state == 'closed':
+                self._state = 'closed'
+                self._failures = 0
+                self._open_count = 0
+                self._probe_in_flight = False
+
+    def record_failure(self, error, probe=False):
+        with self._lock:
+            self._last_error = str(error)[:200]
+            self._failures += 1
+            if probe or (self._state == 'closed' and self._failures >= self.failure_threshold):
+                self._open_count += 1
+                delay = min(self.max_delay, self.base_delay * 2 ** (self._open_count - 1))
+                delay *= 1 - self.jitter * random.random()
+                if getattr(error, 'retry_after', None):
+                    delay = max(delay, min(error.retry_after, self.max_delay))
+                self._state = 'open'
+                self._open_until = time.monotonic() + delay
+                self._probe_in_flight = False
+                self._opened += 1
+
+    def cancel_probe(self):
+        """Probe-Aufruf wurde ohne Ergebnis abgebrochen (z.B. Stream vom Client geschlossen)"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def retry_after(self):
+        """Sekunden bis zum nächsten erlaubten Aufruf (0, wenn Aufrufe erlaubt sind)"""
+        with self._lock:
+            if self._state != 'open':
+                return 0.0
+            return max(self._open_until - time.monotonic(), 0.0)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'state': self._state,
+                'consecutive_failures': self._failures,
+                'retry_after': round(max(self._open_until - time.monotonic(), 0.0), 1) if self._state == 'open' else 0.0,
+                'opened': self._opened,
+                'rejected': self._rejected,
+                'last_error': self._last_error
+            }
+
+
+def percentile(values, fraction):
+    """Einfaches Perzentil über eine sortierbare Liste (None bei leerer Liste)"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class LLMClient:
+    """Gepoolter Keep-Alive-Client für die Chat-Completions-API"""
+
+    def __init__(self, api_key, base_url='https://api.openai.com/v1', connect_timeout=5.0,
+                 read_timeout=45.0, pool_connections=4, pool_maxsize=16, latency_window=500,
+                 max_concurrent=None, queue_timeout=60.0, breaker=None,
+                 hedge_percentile=None, hedge_max_rate=0.1, hedge_min_samples=20):
+        self.api_key = api_key
+        self.base_url = base_url.rstrip('/')
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.pool_maxsize = pool_maxsize
+        self.max_concurrent = max_concurrent
+        self.queue_timeout = queue_timeout
+        self._slots = threading.BoundedSemaphore(max_concurrent) if max_concurrent else None
+        self.breaker = breaker
+        self.hedge_percentile = hedge_percentile  # None = keine gesicherten Aufrufe
+        self.hedge_max_rate = hedge_max_rate      # Höchstanteil zusätzlicher Anfragen
+        self.hedge_min_samples = hedge_min_samples
+
+        self._adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self.session = requests.Session()
+        self.session.mount('https://', self._adapter)
+        self.session.mount('http://', self._adapter)
+
+        self._lock = threading.Lock()
+        self._latencies = defaultdict(lambda: deque(maxlen=latency_window))  # model -> [Sekunden]
+        self._first_token = defaultdict(lambda: deque(maxlen=latency_window))  # model -> [Sekunden] (Streaming)
+        self._calls = defaultdict(int)
+        self._errors = defaultdict(int)
+        self._timeouts = defaultdict(int)
+        self._in_flight = 0
+        self._max_in_flight = 0
+        self._waiting = 0
+        self._max_waiting = 0
+        self._queue_waits = deque(maxlen=latency_window)  # Wartezeit auf einen freien Platz [Sekunden]
+        self._queue_timeouts = 0
+        self._hedge_eligible = 0
+        self._hedges_fired = 0
+        self._hedges_won = 0
+        self._hedges_skipped = 0
+        self._deadline_exceeded = 0
+
+    @contextmanager
+    def _call_slot(self, model, queue_timeout=None):
+        """Prüft den Circuit Breaker, belegt einen der max_concurrent Plätze und zählt
+        den Aufruf als laufend. Das Ergebnis des Aufrufs wird an den Breaker gemeldet;
+        ein Warte-Timeout auf einen freien Platz betrifft den Upstream nicht.
+        """
+        probe = self.breaker.before_call() if self.breaker is not None else False
+        try:
+            self._acquire_slot(model, queue_timeout)
+        except BaseException:
+            if probe:
+                self.breaker.cancel_probe()
+            raise
+        try:
+            yield
+        except LLMError as e:
+            if self.breaker is not None:
+                if e.upstream_failure:
+                    self.breaker.record_failure(e, probe)
+                elif isinstance(e, DeadlineExceededError):
+                    if probe:
+                        self.breaker.cancel_probe()  # Upstream liefert noch, nur zu langsam für die Deadline
+                else:
+                    self.breaker.record_success(probe)  # Upstream hat geantwortet
+            raise
+        except BaseException:
+            if probe:
+                self.breaker.cancel_probe()
+            raise
+        else:
+            if self.breaker is not None:
+                self.breaker.record_success(probe)
+        finally:
+            self._release_slot()
+
+    def _acquire_slot(self, model, queue_timeout=None):
+        """Belegt einen der max_concurrent Plätze (wartet höchstens queue_timeout Sekunden)"""
+        if queue_timeout is None:
+            queue_timeout = self.queue_timeout
+        if self._slots is not None:
+            with self._lock:
+                self._waiting += 1
+                self._max_waiting = max(self._max_waiting, self._waiting)
+            start = time.monotonic()
+            acquired = self._slots.acquire(timeout=max(queue_timeout, 0))
+            with self._lock:
+                self._waiting -= 1
+                if acquired:
+                    self._queue_waits.append(time.monotonic() - start)
+                else:
+                    self._queue_timeouts += 1
+            if not acquired:
+                raise LLMError(f"Kein freier KI-Aufruf nach {queue_timeout:.0f}s "
+                               f"(max. {self.max_concurrent} gleichzeitig)")
+
+        with self._lock:
+            self._calls[model] += 1
+            self._in_flight += 1
+            self._max_in_flight = max(self._max_in_flight, self._in_flight)
+
+    def _release_slot(self):
+        with self._lock:
+            self._in_flight -= 1
+        if self._slots is not None:
+            self._slots.release()
+
+    def _remaining(self, deadline):
+        """Verbleibende Sekunden bis zur Deadline (None ohne Deadline)"""
+        if deadline is None:
+            return None
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            with self._lock:
+                self._deadline_exceeded += 1
+            raise DeadlineExceededError("Deadline überschritten, Aufruf wird nicht mehr gestartet")
+        return remaining
+
+    def _request_timeout(self, timeout, deadline):
+        """(connect, read)-Timeout für requests - der Read-Timeout endet spätestens mit der
+        Deadline. Das zweite Element sagt, ob die Deadline den Timeout verkürzt hat.
+        """
+        timeout = timeout or (self.connect_timeout, self.read_timeout)
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        remaining = self._remaining(deadline)
+        if remaining is not None and remaining < read:
+            return (min(connect, remaining), remaining), True
+        return (connect, read), False
+
+    def chat_completion(self, model, messages, max_tokens, timeout=None, deadline=None, hedge=False, **extra):
+        """Führt einen Chat-Completion-Aufruf aus und gibt den Antworttext zurück.
+
+        deadline: Zeitpunkt (time.monotonic()), bis zu dem die Antwort vorliegen muss -
+        Wartezeit auf einen freien Platz und Read-Timeout werden darauf begrenzt.
+        hedge: Aufruf bei Bedarf durch eine zweite Anfrage absichern (siehe _hedged_completion).
+
+        Wirft LLMError bei Netzwerkfehlern, Timeouts oder Antworten ohne 'choices',
+        DeadlineExceededError, wenn die Deadline abgelaufen ist.
+        """
+        payload = {'model': model, 'messages': messages, 'max_tokens': max_tokens}
+        payload.update(extra)
+
+        if hedge and self.hedge_percentile:
+            return self._hedged_completion(model, payload, timeout, deadline)
+        return self._completion(model, payload, timeout, deadline)
+
+    def _completion(self, model, payload, timeout=None, deadline=None, queue_timeout=None):
+        """Eine einzelne Chat-Completion-Anfrage"""
+        remaining = self._remaining(deadline)
+        if remaining is not None:
+            queue_timeout = min(self.queue_timeout if queue_timeout is None else queue_timeout, remaining)
+
+        with self._call_slot(model, queue_timeout):
+            request_timeout, cut = self._request_timeout(timeout, deadline)
+            start = time.monotonic()
+            try:
+                response = self.session.post(
+                    f"{self.base_url}/chat/completions",
+                    headers={
+                        "Content-Type": "application/json",
+                        "Authorization": f"Bearer {self.api_key}"
+                    },
+                    json=payload,
+                    timeout=request_timeout
+                )
+                response_data = response.json()
+                if 'choices' not in response_data:
+                    raise status_error(response, response_data)
+                content = response_data['choices'][0]['message']['content']
+            except requests.Timeout as e:
+                raise self._timeout_error(model, start, cut, e) from e
+            except LLMError:
+                self._record_failure(model)
+                raise
+            except (requests.RequestException, ValueError, KeyError, IndexError) as e:
+                self._record_failure(model)
+                raise LLMError(str(e)) from e
+
+        with self._lock:
+            self._latencies[model].append(time.monotonic() - start)
+        return content
+
+    def hedge_delay(self, model):
+        """Wartezeit bis zur zweiten Anfrage: hedge_percentile der beobachteten Latenz
+        (None, solange zu wenige Messwerte vorliegen)
+        """
+        with self._lock:
+            latencies = list(self._latencies.get(model, ()))
+        if not self.hedge_percentile or len(latencies) < self.hedge_min_samples:
+            return None
+        return percentile(latencies, self.hedge_percentile)
+
+    def _reserve_hedge(self):
+        """Prüft die Obergrenze: höchstens hedge_max_rate zusätzliche Anfragen je gesichertem Aufruf"""
+        with self._lock:
+            if self._hedges_fired + 1 > self.hedge_max_rate * self._hedge_eligible:
+                self._hedges_skipped += 1
+                return False
+            self._hedges_fired += 1
+            return True
+
+    def _hedged_completion(self, model, payload, timeout, deadline):
+        """Gesicherter Aufruf: Liegt nach hedge_delay() keine Antwort vor, geht eine zweite
+        Anfrage raus (nur mit sofort freiem Platz und innerhalb von hedge_max_rate).
+        Die erste erfolgreiche Antwort gewinnt, die andere Anfrage läuft im Hintergrund
+        bis zu ihrem Timeout aus und wird verworfen. Fehler werden erst gemeldet, wenn
+        keine Anfrage mehr läuft.
+        """
+        delay = self.hedge_delay(model)
+        with self._lock:
+            self._hedge_eligible += 1
+        remaining = self._remaining(deadline)
+        if delay is None or (remaining is not None and remaining <= delay):
+            return self._completion(model, payload, timeout, deadline)
+
+        results = queue.Queue()
+
+        def attempt(hedge):
+            try:
+                # Die zweite Anfrage wartet nicht auf einen freien Platz
+                content = self._completion(model, payload, timeout, deadline, queue_timeout=0 if hedge else None)
+                results.put((hedge, content, None))
+            except Exception as e:
+                results.put((hedge, None, e))
+
+        threading.Thread(target=attempt, args=(False,), name='llm-request', daemon=True).start()
+        running = 1
+        wait = delay
+        error = None
+        while running:
+            try:
+                hedge, content, attempt_error = results.get(timeout=wait)
+            except queue.Empty:
+                wait = None
+                if self._reserve_hedge():
+                    threading.Thread(target=attempt, args=(True,), name='llm-hedge', daemon=True).start()
+                    running += 1
+                continue
+            running -= 1
+            if attempt_error is None:
+                if hedge:
+                    with self._lock:
+                        self._hedges_won += 1
+                return content
+            if error is None or not isinstance(attempt_error, (CircuitOpenError, DeadlineExceededError)):
+                error = attempt_error
+            wait = None
+        raise error
+
+    def stream_chat_completion(self, model, messages, max_tokens, timeout=None, deadline=None, **extra):
+        """Streamt einen Chat-Completion-Aufruf und liefert die Text-Fragmente einzeln.
+
+        Der Read-Timeout gilt zwischen zwei empfangenen Fragmenten. deadline
+        (time.monotonic()) begrenzt den gesamten Stream, auch wenn der Upstream
+        weiter langsam Fragmente liefert. Wirft LLMError wie chat_completion, auch
+        wenn der Stream mittendrin abbricht, und DeadlineExceededError nach der Deadline.
+        """
+        payload = {'model': model, 'messages': messages, 'max_tokens': max_tokens, 'stream': True}
+        payload.update(extra)
+
+        remaining = self._remaining(deadline)
+        queue_timeout = min(self.queue_timeout, remaining) if remaining is not None else None
+
+        with self._call_slot(model, queue_timeout):
+            request_timeout, cut = self._request_timeout(timeout, deadline)
+            start = time.monotonic()
+            first_token = None
+            try:
+                with self.session.post(
+                    f"{self.base_url}/chat/completions",
+                    headers={
+                        "Content-Type": "application/json",
+                        "Authorization": f"Bearer {self.api_key}"
+                    },
+                    json=payload,
+                    timeout=request_timeout,
+                    stream=True
+                ) as response:
+                    if response.status_code != 200:
+                        raise status_error(response, response.text[:500])
+                    for line in response.iter_lines(decode_unicode=True):
+                        if deadline is not None and time.monotonic() >= deadline:
+                            raise self._deadline_error(start)
+                        if not line or not line.startswith('data:'):
+                            continue
+                        data = line[5:].strip()
+                        if data == '[DONE]':
+                            break
+                        choices = json.loads(data).get('choices') or []
+                        delta = choices[0].get('delta', {}).get('content') if choices else None
+                        if delta:
+                            if first_token is None:
+                                first_token = time.monotonic() - start
+                            yield delta
+            except requests.Timeout as e:
+                raise self._timeout_error(model, start, cut, e) from e
+            except DeadlineExceededError:
+                raise
+            except LLMError:
+                self._record_failure(model)
+                raise
+            except (requests.RequestException, ValueError, KeyError, IndexError, AttributeError) as e:
+                if isinstance(e, requests.ConnectionError) and e.args and isinstance(e.args[0], ReadTimeoutError):
+                    # Beim Lesen des Streams meldet requests einen Read-Timeout als ConnectionError
+                    raise self._timeout_error(model, start, cut, e) from e
+                self._record_failure(model)
+                raise LLMError(str(e)) from e
+
+        with self._lock:
+            self._latencies[model].append(time.monotonic() - start)
+            if first_token is not None:
+                self._first_token[model].append(first_token)
+
+    def _deadline_error(self, start, upstream_failure=False):
+        with self._lock:
+            self._deadline_exceeded += 1
+        return DeadlineExceededError(f"Deadline überschritten nach {time.monotonic() - start:.1f}s",
+                                     upstream_failure=upstream_failure)
+
+    def _timeout_error(self, model, start, cut, error):
+        """Fehler für einen Timeout - DeadlineExceededError, wenn die Deadline den Timeout
+        verkürzt hat. Die Anfrage lief bereits, daher zählt beides als Störung des Upstreams.
+        """
+        self._record_failure(model, timeout=True)
+        if cut:
+            return self._deadline_error(start, upstream_failure=True)
+        return LLMError(f"Timeout nach {time.monotonic() - start:.1f}s: {error}")
+
+    def retry_after(self):
+        """Sekunden, bis der Circuit Breaker wieder Aufrufe erlaubt (0 ohne Breaker)"""
+        return self.breaker.retry_after() if self.breaker is not None else 0.0
+
+    def _record_failure(self, model, timeout=False):
+        with self._lock:
+            self._errors[model] += 1
+            if timeout:
+                self._timeouts[model] += 1
+
+    def stats(self):
+        """Latenz- und Pool-Statistiken zur Dimensionierung des Pools"""
+        container = self._adapter.poolmanager.pools
+        pools = [pool for pool in (container.get(key) for key in container.keys()) if pool is not None]
+        with self._lock:
+            queue_waits = list(self._queue_waits)
+            models = {}
+            for model in self._calls:
+                latencies = list(self._latencies[model])
+                first_token = list(self._first_token[model])
+                models[model] = {
+                    'calls': self._calls[model],
+                    'errors': self._errors[model],
+                    'timeouts': self._timeouts[model],
+                    'latency_p50': percentile(latencies, 0.5),
+                    'latency_p95': percentile(latencies, 0.95),
+                    'latency_max': max(latencies) if latencies else None,
+                    'first_token_p50': percentile(first_token, 0.5)
+                }
+            return {
+                'models': models,
+                'pool': {
+                    'in_flight': self._in_flight,
+                    'max_in_flight': self._max_in_flight,
+                    'pool_maxsize': self.pool_maxsize,
+                    'hosts': len(pools),
+                    # Die Pool-Queue enthält None-Platzhalter für noch nicht geöffnete Verbindungen
+                    'idle_connections': sum(
+                        1 for pool in pools if pool.pool
+                        for connection in list(pool.pool.queue) if connection is not None
+                    )
+                },
+                'concurrency': {
+                    'max_concurrent': self.max_concurrent,
+                    'waiting': self._waiting,
+                    'max_waiting': self._max_waiting,
+                    'queue_wait_p95': percentile(queue_waits, 0.95),
+                    'queue_timeouts': self._queue_timeouts
+                },
+                'breaker': self.breaker.stats() if self.breaker is not None else None,
+                'hedging': {
+                    'percentile': self.hedge_percentile,
+                    'max_rate': self.hedge_max_rate,
+                    'eligible': self._hedge_eligible,
+                    'fired': self._hedges_fired,
+                    'won': self._hedges_won,
+                    'skipped': self._hedges_skipped,
+                    'rate': round(self._hedges_fired / self._hedge_eligible, 3) if self._hedge_eligible else 0.0
+                },
+                'deadline_exceeded': self._deadline_exceeded,
+                'timeouts': {'connect': self.connect_timeout, 'read': self.read_timeout}
+            }
@@ -18,11 +18,39 @@ def migrate_database():
         conn = sqlite3.connect(db_path)
         cursor = conn.cursor()
         
+        # Cache table for generated info pages (content-addressed)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS static_info_cache (
+                key VARCHAR(64) PRIMARY KEY,
+                content TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                created_at DATETIME,
+                last_used_at DATETIME
+            )
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS ix_static_info_cache_last_used_at ON static_info_cache (last_used_at)")
+        
+        # Durable feedback processing queue (restored after restarts)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS processing_queue (
+                presentation_id INTEGER PRIMARY KEY REFERENCES presentation (id),
+                due_at DATETIME NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                lease_owner VARCHAR(64),
+                lease_expires_at DATETIME
+            )
+        """)
+        cursor.execute("CREATE INDEX IF NOT EXISTS ix_processing_queue_due_at ON processing_queue (due_at)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS ix_feedback_is_processed ON feedback (is_processed, presentation_id)")
+        conn.commit()
+        
         # Check if the new columns already exist
         cursor.execute("PRAGMA table_info(presentation)")
         columns = [column[1] for column in cursor.fetchall()]
         
-        new_columns = ['last_error_message', 'last_error_time', 'failed_context', 'retry_after', 'is_deleted', 'deleted_at', 'deleted_by_user_id', 'additional_info', 'live_info_visible', 'feedback_disabled']
+        new_columns = ['last_error_message', 'last_error_time', 'failed_context', 'retry_after', 'is_deleted', 'deleted_at', 'deleted_by_user_id', 'additional_info', 'live_info_visible', 'feedback_disabled', 'content_version', 'static_info_html', 'feedback_html',
+                       'static_info_job_status', 'static_info_job_generation', 'static_info_job_error', 'static_info_job_requested_at',
+                       'feedback_items', 'static_info_digest', 'static_info_digest_hash']
         columns_to_add = [col for col in new_columns if col not in columns]
         
         if not columns_to_add:
@@ -72,9 +100,52 @@ def migrate_database():
             cursor.execute("ALTER TABLE presentation ADD COLUMN feedback_disabled BOOLEAN DEFAULT 0 NOT NULL")
             print("Added feedback_disabled column")
         
+        if 'content_version' in columns_to_add:
+            cursor.execute("ALTER TABLE presentation ADD COLUMN content_version INTEGER DEFAULT 0 NOT NULL")
+            print("Added content_version column")
+        
+        if 'static_info_html' in columns_to_add:
+            cursor.execute("ALTER TABLE presentation ADD COLUMN static_info_html TEXT")
+            print("Added static_info_html column")
+        
+        if 'feedback_html' in columns_to_add:
+            cursor.execute("ALTER TABLE presentation ADD COLUMN feedback_html TEXT")
+            print("Added feedback_html column")
+        
+        if 'static_info_job_status' in columns_to_add:
+            cursor.execute("ALTER TABLE presentation ADD COLUMN static_info_job_status VARCHAR(20)")
+            print("Added static_info_job_status column")
+        
+        if 'static_info_job_generation' in columns_to_add:
+            cursor.execute("ALTER TABLE presentation ADD COLUMN static_info_job_generation INTEGER DEFAULT 0 NOT NULL")
+            print("Added static_info_job_generation column")
+        
+        if 'static_info_job_error' in columns_to_add:
+            cursor.execute("ALTER TABLE presentation ADD COLUMN static_info_job_error TEXT")
+            print("Added static_info_job_error column")
+        
+        if 'static_info_job_requested_at' in columns_to_add:
+            cursor.execute("ALTER TABLE presentation ADD COLUMN static_info_job_requested_at DATETIME")
+            print("Added static_info_job_requested_at column")
+        
+        if 'feedback_items' in columns_to_add:
+            cursor.execute("ALTER TABLE presentation ADD COLUMN feedback_items TEXT")
+            print("Added feedback_items column")
+        
+        if 'static_info_digest' in columns_to_add:
+            cursor.execute("ALTER TABLE presentation ADD COLUMN static_info_digest TEXT")
+            print("Added static_info_digest column")
+        
+        if 'static_info_digest_hash' in columns_to_add:
+            cursor.execute("ALTER TABLE presentation ADD COLUMN static_info_digest_hash VARCHAR(64)")
+            print("Added static_info_digest_hash column")
+        
         conn.commit()
         print("Database migration completed successfully!")
         
+        if 'static_info_html' in columns_to_add or 'feedback_html' in columns_to_add:
+            print("Run 'flask --app app backfill-html' to pre-render HTML for existing presentations")
+        
     except sqlite3.Error as e:
         print(f"Database migration failed: {e}")
         sys.exit(1)
@@ -0,0 +1,38 @@
+#!/bin/bash
+
+# PresentAI - Event-Server für Server-Sent Events (/events)
+# Hält tausende offene Verbindungen mit Gevent statt einem Thread pro Client
+
+echo "=== PresentAI Event-Server (SSE) ==="
+
+# Überprüfung ob Gunicorn und Gevent installiert sind
+if ! python -c "import gunicorn, gevent" &> /dev/null; then
+    echo "FEHLER: Gunicorn oder Gevent ist nicht installiert."
+    echo "Installieren Sie es mit: python -m pip install gunicorn gevent"
+    exit 1
+fi
+
+# Produktions-Konfiguration
+export FLASK_ENV=production
+export SSE_ENABLED=1
+# Der Event-Server liefert nur Events aus - Feedback verarbeiten die Web-Prozesse bzw.
+# der Feedback-Worker, nicht dieser Gevent-Prozess
+export FEEDBACK_PROCESSING_MODE=worker
+export FEEDBACK_RECOVER_ON_STARTUP=false
+
+EVENTS_PORT=${EVENTS_PORT:-5001}
+
+# Nur die /events-Pfade an diesen Server weiterleiten (siehe PRODUCTION_NOTES.md)
+echo "Starte Gunicorn mit 1 Gevent-Worker (2000 Verbindungen)..."
+echo "Zugriff über: http://0.0.0.0:${EVENTS_PORT}"
+echo "Zum Beenden: Ctrl+C"
+echo ""
+
+python -m gunicorn \
+    --worker-class gevent \
+    --workers 1 \
+    --worker-connections 2000 \
+    --bind 0.0.0.0:${EVENTS_PORT} \
+    --timeout 60 \
+    --log-level info \
+    app:app
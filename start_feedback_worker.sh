@@ -0,0 +1,23 @@
+#!/bin/bash
+
+# PresentAI - Feedback-Worker
+# Verarbeitet Feedback (KI-Aufrufe) getrennt von den Web-Prozessen
+
+echo "=== PresentAI Feedback-Worker ==="
+
+# Überprüfung der benötigten Umgebungsvariablen
+if [ -z "$OPENAI_API_KEY" ]; then
+    echo "WARNUNG: OPENAI_API_KEY ist nicht gesetzt."
+    echo "Setzen Sie die Variable oder die Anwendung wird nicht funktionieren."
+fi
+
+# Produktions-Konfiguration
+export FLASK_ENV=production
+export FEEDBACK_PROCESSING_MODE=worker
+
+# Die Web-Prozesse müssen ebenfalls mit FEEDBACK_PROCESSING_MODE=worker laufen (siehe PRODUCTION_NOTES.md)
+echo "Starte Feedback-Worker (bis zu ${FEEDBACK_MAX_IN_FLIGHT:-4} Präsentationen parallel)..."
+echo "Zum Beenden: Ctrl+C"
+echo ""
+
+python -m flask --app app feedback-worker
@@ -1,11 +1,13 @@
 #!/bin/bash
 
 # PresentAI - Erweiterte Produktions-Konfiguration
-# Für höhere Performance (mit kleinem Threading-Risiko)
+# Für höhere Performance: mehrere Worker, die Feedback-Verarbeitung wird über
+# Leases in der Datenbank pro Präsentation nur von einem Worker ausgeführt
+
+WEB_WORKERS=${WEB_WORKERS:-4}
+WEB_THREADS=${WEB_THREADS:-2}
 
 echo "=== PresentAI Erweiterte Produktions-Konfiguration ==="
-echo "WARNUNG: Verwendet 2 Worker - Background-Processing könnte doppelt ausgeführt werden"
-echo "Überwachen Sie die Logs auf doppelte Feedback-Verarbeitung!"
 
 # Überprüfung ob Gunicorn installiert ist
 if ! python -c "import gunicorn" &> /dev/null; then
@@ -23,15 +25,18 @@ fi
 # Produktions-Konfiguration
 export FLASK_ENV=production
 
+# Datenbank migrieren (Warteschlange und Leases für mehrere Worker)
+python migrate_db.py
+
 # Start mit mehr Workern für höhere Performance
-echo "Starte Gunicorn mit 2 Workern + 2 Threads pro Worker..."
+echo "Starte Gunicorn mit $WEB_WORKERS Workern + $WEB_THREADS Threads pro Worker..."
 echo "Zugriff über: http://0.0.0.0:5000"
 echo "Zum Beenden: Ctrl+C"
 echo ""
 
 python -m gunicorn \
-    --workers 2 \
-    --threads 2 \
+    --workers $WEB_WORKERS \
+    --threads $WEB_THREADS \
     --bind 0.0.0.0:5000 \
     --timeout 60 \
     --keep-alive 2 \
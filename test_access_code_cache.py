@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Test script for the access code LRU cache and its cross-process invalidation
+"""
+
+import os
+import sys
+import tempfile
+import uuid
+from app import app, db, User, Presentation, AccessCodeCache, access_code_cache
+
+def test_access_code_cache():
+    print("Testing access code cache...")
+
+    with app.app_context():
+        db.create_all()
+
+        user = User.query.filter_by(username='testuser_accesscode').first()
+        if not user:
+            user = User(username='testuser_accesscode')
+            user.set_password('testpass')
+            db.session.add(user)
+            db.session.commit()
+
+        access_code = str(uuid.uuid4())[:8]
+        presentation = Presentation(
+            title='Access Code Cache Test',
+            access_code=access_code,
+            user_id=user.id
+        )
+        db.session.add(presentation)
+        db.session.commit()
+
+        # Zwei Caches mit derselben Signaldatei simulieren zwei Worker-Prozesse
+        signal_file = os.path.join(tempfile.mkdtemp(), 'access_code_cache.signal')
+        worker_a = AccessCodeCache(max_size=2, ttl=300, signal_file=signal_file)
+        worker_b = AccessCodeCache(max_size=2, ttl=300, signal_file=signal_file)
+
+        # Test 1: Treffer nach dem ersten Lookup
+        print("\nTest 1: Hits and misses")
+        worker_a.get(access_code)
+        entry = worker_a.get(access_code)
+        stats = worker_a.stats()
+        if entry.id == presentation.id and stats['hits'] == 1 and stats['misses'] == 1:
+            print("✓ Second lookup is served from cache")
+        else:
+            print(f"✗ Unexpected stats: {stats}")
+            return False
+
+        # Test 2: Invalidierung in Worker A erreicht Worker B
+        print("\nTest 2: Cross-process invalidation")
+        worker_b.get(access_code)
+        presentation.feedback_disabled = True
+        db.session.commit()
+        worker_a.invalidate(access_code)
+        if worker_b.get(access_code).feedback_disabled:
+            print("✓ Worker B sees the change after invalidation in worker A")
+        else:
+            print("✗ Worker B still serves the stale entry")
+            return False
+
+        # Test 3: LRU-Begrenzung
+        print("\nTest 3: LRU eviction")
+        worker_a.get('unknown1')
+        worker_a.get('unknown2')
+        worker_a.get('unknown3')
+        if worker_a.stats()['size'] == 2:
+            print("✓ Cache size stays bounded")
+        else:
+            print(f"✗ Cache grew beyond max size: {worker_a.stats()['size']}")
+            return False
+
+        # Test 4: Veralteter Eintrag (Löschung ohne Invalidierung in diesem Prozess)
+        print("\nTest 4: Stale entry for a deleted presentation")
+        access_code_cache.get(access_code)
+        presentation.is_deleted = True
+        db.session.commit()
+        response = app.test_client().get(f'/p/{access_code}')
+        if response.status_code == 404 and access_code_cache.get(access_code).is_deleted:
+            print("✓ Public view answers 404 and drops the stale entry")
+        else:
+            print(f"✗ Status {response.status_code} for a deleted presentation")
+            return False
+
+        print("\nAll access code cache tests passed! ✓")
+        return True
+
+if __name__ == "__main__":
+    success = test_access_code_cache()
+    sys.exit(0 if success else 1)
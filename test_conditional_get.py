@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Test script for ETag / conditional GET support on the polling endpoints
+"""
+
+import sys
+import uuid
+from app import app, db, User, Presentation, Feedback
+
+def test_conditional_get():
+    print("Testing conditional GET support...")
+
+    with app.app_context():
+        db.create_all()
+
+        user = User.query.filter_by(username='testuser_etag').first()
+        if not user:
+            user = User(username='testuser_etag')
+            user.set_password('testpass')
+            db.session.add(user)
+            db.session.commit()
+
+        presentation = Presentation(
+            title='ETag Test Presentation',
+            description='Testing conditional GET',
+            context='Test context',
+            content='Test content',
+            access_code=str(uuid.uuid4())[:8],
+            user_id=user.id,
+            static_info_content='# Info\n\nStatischer Inhalt',
+            live_info_visible=True
+        )
+        db.session.add(presentation)
+        db.session.commit()
+        presentation_id = presentation.id
+
+        client = app.test_client()
+        with client.session_transaction() as sess:
+            sess['_user_id'] = str(user.id)
+
+        # Test 1: Öffentliche Live-Info liefert ETag und 304
+        print("\nTest 1: Public live info")
+        url = f'/api/presentation/{presentation_id}/ai_content_public'
+        response = client.get(url)
+        etag = response.headers.get('ETag')
+        if response.status_code != 200 or not etag:
+            print("✗ First request should return 200 with ETag")
+            return False
+        response = client.get(url, headers={'If-None-Match': etag})
+        if response.status_code == 304 and not response.data:
+            print("✓ Unchanged content returns 304 without body")
+        else:
+            print(f"✗ Expected 304, got {response.status_code}")
+            return False
+
+        # Test 2: Änderung am Feedback-Bereich erhöht die Version
+        print("\nTest 2: Content change invalidates ETag")
+        presentation = db.session.get(Presentation, presentation_id)
+        presentation.set_feedback_content('## Fragen\n\n- Neue Frage')
+        db.session.commit()
+        response = client.get(url, headers={'If-None-Match': etag})
+        if response.status_code == 200 and 'Neue Frage' in response.get_json()['html']:
+            print("✓ Changed content returns 200 with new HTML")
+        else:
+            print(f"✗ Expected 200 with new content, got {response.status_code}")
+            return False
+
+        # Test 3: Präsentator-Ansicht
+        print("\nTest 3: Presenter AI content")
+        url = f'/api/presentation/{presentation_id}/ai_content'
+        etag = client.get(url).headers.get('ETag')
+        if client.get(url, headers={'If-None-Match': etag}).status_code == 304:
+            print("✓ Presenter view returns 304 for unchanged content")
+        else:
+            print("✗ Presenter view should return 304")
+            return False
+
+        # Test 4: Feedback-Liste ändert ETag bei neuem Feedback
+        print("\nTest 4: Feedback list")
+        url = f'/api/feedbacks/{presentation_id}'
+        etag = client.get(url).headers.get('ETag')
+        if client.get(url, headers={'If-None-Match': etag}).status_code != 304:
+            print("✗ Unchanged feedback list should return 304")
+            return False
+        db.session.add(Feedback(content='Frage?', presentation_id=presentation_id))
+        db.session.commit()
+        response = client.get(url, headers={'If-None-Match': etag})
+        if response.status_code == 200 and len(response.get_json()) == 1:
+            print("✓ New feedback changes the ETag")
+        else:
+            print(f"✗ Expected 200 after new feedback, got {response.status_code}")
+            return False
+
+        print("\nAll conditional GET tests passed! ✓")
+        return True
+
+if __name__ == "__main__":
+    success = test_conditional_get()
+    sys.exit(0 if success else 1)
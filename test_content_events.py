@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Test script for the content event streams and the cleanup of their per-presentation state
+"""
+
+import sys
+import uuid
+from app import (app, db, User, Presentation, content_change_notifier, content_event_stream,
+                 stream_state_cache)
+
+def create_presentation():
+    user = User.query.filter_by(username='testuser_events').first()
+    if not user:
+        user = User(username='testuser_events')
+        user.set_password('testpass')
+        db.session.add(user)
+        db.session.commit()
+    presentation = Presentation(title='Events', access_code=uuid.uuid4().hex[:8], user_id=user.id)
+    db.session.add(presentation)
+    db.session.commit()
+    return presentation
+
+def test_content_events():
+    print("Testing content event streams...")
+
+    app.config['SSE_CHECK_INTERVAL'] = 0.05
+    with app.app_context():
+        db.create_all()
+        presentation = create_presentation()
+        presentation_id = presentation.id
+
+        # Test 1: Benachrichtigungen ohne offenen Stream legen keinen Zustand an
+        print("\nTest 1: Notifications without subscribers")
+        for _ in range(3):
+            content_change_notifier.notify(presentation_id)
+        if content_change_notifier.stats()['presentations'] == 0:
+            print("✓ No state kept for presentations without streams")
+        else:
+            print(f"✗ Unexpected state: {content_change_notifier.stats()}")
+            return False
+
+        # Test 2: Zustand wird beim Schließen des letzten Streams entfernt
+        print("\nTest 2: State is dropped when the last stream closes")
+        streams = [content_event_stream(presentation_id), content_event_stream(presentation_id, include_feedbacks=True)]
+        for stream in streams:
+            next(stream)  # retry
+            next(stream)  # erster Stand (keep-alive)
+        open_state = (content_change_notifier.stats()['streams'], len(stream_state_cache))
+        streams[0].close()
+        still_open = content_change_notifier.stats()['streams']
+        streams[1].close()
+        if (open_state == (2, 2) and still_open == 1 and content_change_notifier.stats()['presentations'] == 0
+                and not any(key[0] == presentation_id for key in stream_state_cache)):
+            print("✓ Notifier and stream state cache are empty after both streams closed")
+        else:
+            print(f"✗ Open: {open_state}, after first close: {still_open}, {content_change_notifier.stats()}")
+            return False
+
+        # Test 3: Löschen meldet 'deleted' und beendet den Stream
+        print("\nTest 3: Deleted presentation ends the stream")
+        stream = content_event_stream(presentation_id)
+        next(stream)
+        next(stream)
+        presentation.is_deleted = True
+        db.session.commit()
+        content_change_notifier.notify(presentation_id)
+        events = list(stream)
+        if any(event.startswith('event: deleted') for event in events) and content_change_notifier.stats()['streams'] == 0:
+            print("✓ 'deleted' event sent and stream unsubscribed")
+        else:
+            print(f"✗ Events: {events}")
+            return False
+
+    print("\nAll content event tests passed! ✓")
+    return True
+
+if __name__ == "__main__":
+    success = test_content_events()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Test script for the structured feedback merge and its rolling compaction
+"""
+
+import hashlib
+import json
+import re
+import sys
+from types import SimpleNamespace
+import app as app_module
+from app import (app, estimate_tokens, feedback_items_from_markdown, render_feedback_items,
+                 merge_feedback_items, empty_feedback_items, generate_feedback_items, Presentation)
+
+class FakeModel:
+    """Ersetzt llm_client.chat_completion: liefert neue Einträge als JSON, verdichtet auf Anfrage"""
+
+    def __init__(self):
+        self.prompt_tokens = []
+        self.compactions = 0
+
+    def chat_completion(self, model, messages, max_tokens, **kwargs):
+        prompt = messages[-1]['content']
+        if 'Verdichte die folgenden Feedback-Einträge' in prompt:
+            self.compactions += 1
+            return json.dumps({'items': [
+                {'category': 'questions', 'text': 'Mehrere Zuhörer fragten nach Details', 'count': 40}
+            ]})
+
+        self.prompt_tokens.append(estimate_tokens(prompt))
+        new_feedback = prompt.split('# NEUE unverarbeitete')[1]
+        items = [{'category': 'questions', 'text': text}
+                 for text in re.findall(r'NEUES FEEDBACK(?: \(\d+×\))?: (.*\?)', new_feedback)]
+        links = [{'url': url, 'description': 'Beispiel'} for url in re.findall(r'https?://\S+', new_feedback)]
+        return '```json\n' + json.dumps({'items': items, 'links': links}) + '\n```'
+
+def test_feedback_compaction():
+    print("Testing structured feedback merge and compaction...")
+
+    # Test 1: Bestehender Markdown-Bereich wird übernommen
+    print("\nTest 1: Legacy feedback section")
+    legacy = "## Fragen\n\n- Frage 1\n\n## ⚠️ Ungeprüfte Links\n\n- [A](https://a.example)"
+    items = feedback_items_from_markdown(legacy)
+    if items['preamble'] == "## Fragen\n\n- Frage 1" and items['links'] == [{'url': 'https://a.example', 'description': 'A'}]:
+        print("✓ Legacy text becomes preamble, links are parsed")
+    else:
+        print(f"✗ Unexpected items: {items}")
+        return False
+
+    # Test 2: Zusammenführung - Duplikate, erfundene Links, URLs im Text
+    print("\nTest 2: Server-side merge")
+    items = empty_feedback_items()
+    feedbacks = [SimpleNamespace(content="Gibt es Folien? Siehe https://b.example/folien.")]
+    items = merge_feedback_items(items, {
+        'items': [{'category': 'questions', 'text': 'Gibt es Folien? https://b.example/folien'}],
+        'links': [{'url': 'https://b.example/folien', 'description': 'Folien'},
+                  {'url': 'https://erfunden.example', 'description': 'Erfunden'}]
+    }, feedbacks)
+    items = merge_feedback_items(items, {'items': [{'duplicate_of': 1}, {'category': 'unbekannt', 'text': 'Toll'}]}, [])
+    markdown = render_feedback_items(items)
+    expected = ("## Fragen\n\n- Gibt es Folien? (2×)\n\n## Sonstige Kommentare\n\n- Toll\n\n"
+                "## ⚠️ Ungeprüfte Links\n\n- [Folien](https://b.example/folien)")
+    if markdown == expected:
+        print("✓ Duplicates are counted, links only appear in the link section")
+    else:
+        print(f"✗ Unexpected rendering:\n{markdown}")
+        return False
+
+    # Test 3: Prompt-Größe bleibt über viele Zyklen begrenzt
+    print("\nTest 3: Prompt size stays bounded")
+    fake = FakeModel()
+    original_client = app_module.llm_client
+    app_module.llm_client = SimpleNamespace(chat_completion=fake.chat_completion)
+    try:
+        with app.app_context():
+            items = None
+            for cycle in range(60):
+                # Unterschiedliche Texte, damit keine Beinahe-Duplikate zusammengefasst werden
+                feedbacks = [SimpleNamespace(content=f"Frage {hashlib.sha1(f'{cycle}-{i}'.encode()).hexdigest()[:32]}?")
+                             for i in range(5)]
+                feedbacks.append(SimpleNamespace(content=f"Siehe https://example.com/{cycle}"))
+                items = generate_feedback_items(feedbacks, "# Info", items)
+    finally:
+        app_module.llm_client = original_client
+
+    threshold = app.config['FEEDBACK_COMPACTION_THRESHOLD_TOKENS']
+    late_cycles = fake.prompt_tokens[-20:]
+    if fake.compactions > 0 and max(late_cycles) < threshold + 1000 and len(items['links']) == 60:
+        print(f"✓ {fake.compactions} compactions, max prompt {max(fake.prompt_tokens)} tokens, all 60 links kept")
+    else:
+        print(f"✗ Compactions: {fake.compactions}, prompt sizes: {late_cycles}, links: {len(items['links'])}")
+        return False
+
+    # Test 4: Kurzfassung der Info-Seite statt der ganzen Seite
+    print("\nTest 4: Static info digest")
+    static_info = "# Vortrag\n\n## Grundlagen\n" + "Die **Quantenkryptographie** schützt Schlüssel. " * 200
+    with app.app_context():
+        presentation = Presentation(title='Digest', access_code='digest01')
+        presentation.static_info_content = static_info
+        digest = presentation.get_static_info_digest()
+        digest_hash = presentation.static_info_digest_hash
+        presentation.get_static_info_digest()
+        unchanged = presentation.static_info_digest_hash == digest_hash
+        presentation.static_info_content = static_info + "\n## Ausblick\n"
+        regenerated = "Ausblick" in presentation.get_static_info_digest()
+    if ("- Grundlagen" in digest and "Quantenkryptographie" in digest and unchanged and regenerated
+            and estimate_tokens(digest) <= app.config['STATIC_INFO_DIGEST_MAX_TOKENS'] < estimate_tokens(static_info)):
+        print(f"✓ Digest has {estimate_tokens(digest)} instead of {estimate_tokens(static_info)} tokens, rebuilt only on change")
+    else:
+        print(f"✗ Unexpected digest: {digest!r}")
+        return False
+
+    print("\nAll structured feedback tests passed! ✓")
+    return True
+
+if __name__ == "__main__":
+    success = test_feedback_compaction()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Test script for near-duplicate feedback grouping and topic clustering
+"""
+
+import sys
+from types import SimpleNamespace
+from feedback_grouping import normalize, group_near_duplicates, cluster_by_topic
+
+def test_feedback_grouping():
+    print("Testing near-duplicate feedback grouping...")
+
+    # Test 1: Normalisierung
+    print("\nTest 1: Normalization")
+    if normalize("  Größe der FOLIEN?!  ") == "groesse der folien":
+        print("✓ Case, umlauts and punctuation are normalized")
+    else:
+        print(f"✗ Unexpected normalization: {normalize('  Größe der FOLIEN?!  ')!r}")
+        return False
+
+    # Test 2: Beinahe-Duplikate landen in einer Gruppe, Unterschiedliches nicht
+    print("\nTest 2: Grouping")
+    texts = [
+        "Gibt es die Folien?",
+        "Wie skaliert das System?",
+        "gibt es die folien??",
+        "Gibt es die Folien online?",
+        "Toller Vortrag!",
+        "Wie skaliert das System bei 1000 Nutzern?",
+    ]
+    groups = group_near_duplicates(texts)
+    expected = [
+        ["Gibt es die Folien?", "gibt es die folien??", "Gibt es die Folien online?"],
+        ["Wie skaliert das System?"],
+        ["Toller Vortrag!"],
+        ["Wie skaliert das System bei 1000 Nutzern?"],
+    ]
+    if groups == expected:
+        print("✓ 6 feedbacks grouped into 4 prompt lines")
+    else:
+        print(f"✗ Unexpected groups: {groups}")
+        return False
+
+    # Test 3: Originalobjekte bleiben unverändert erhalten
+    print("\nTest 3: Original rows are kept")
+    feedbacks = [SimpleNamespace(id=i, content="Folien bitte!") for i in range(3)]
+    groups = group_near_duplicates(feedbacks, text=lambda feedback: feedback.content)
+    if len(groups) == 1 and [feedback.id for feedback in groups[0]] == [0, 1, 2]:
+        print("✓ All original feedbacks are part of the group")
+    else:
+        print(f"✗ Unexpected groups: {groups}")
+        return False
+
+    # Test 4: Unterschiedliche URLs oder Zahlen werden nie zusammengefasst
+    print("\nTest 4: Different URLs or numbers stay apart")
+    pairs = [
+        ("Siehe https://github.com/example/confchat-slides", "Siehe https://github.com/example/confchat-demo"),
+        ("Folien: https://example.org/talks/2024/slides.pdf", "Folien: https://example.org/talks/2023/slides.pdf"),
+        ("Der Vortrag beginnt um 14 Uhr in Raum A", "Der Vortrag beginnt um 16 Uhr in Raum A"),
+    ]
+    merged = [pair for pair in pairs if len(group_near_duplicates(pair)) != 2]
+    same = group_near_duplicates(["Siehe https://github.com/example/confchat-slides",
+                                  "siehe: https://github.com/example/confchat-slides"])
+    if not merged and len(same) == 1:
+        print("✓ Feedbacks differing only in a URL or a number are kept as separate prompt lines")
+    else:
+        print(f"✗ Wrongly grouped: {merged}, same URL: {same}")
+        return False
+
+    # Test 5: Themen-Cluster über TF-IDF
+    print("\nTest 5: Topic clustering")
+    texts = [
+        "Welche Datenbank nutzt ihr, SQLite oder Postgres?",
+        "Die Folien bitte als PDF hochladen",
+        "Skaliert SQLite als Datenbank bei vielen Schreibzugriffen?",
+        "Wo kann ich die Folien als PDF herunterladen?",
+        "Grüße aus Berlin",
+    ]
+    clusters = cluster_by_topic(texts, threshold=0.3)
+    topics = sorted(sorted(cluster) for cluster in clusters)
+    expected = sorted(sorted(cluster) for cluster in [[texts[0], texts[2]], [texts[1], texts[3]], [texts[4]]])
+    if topics == expected:
+        print("✓ 5 feedbacks clustered into 3 topics")
+    else:
+        print(f"✗ Unexpected clusters: {clusters}")
+        return False
+
+    print("\nAll feedback grouping tests passed! ✓")
+    return True
+
+if __name__ == "__main__":
+    success = test_feedback_grouping()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Test script for map-reduce feedback processing of very large batches
+"""
+
+import hashlib
+import json
+import re
+import sys
+import threading
+from types import SimpleNamespace
+import app as app_module
+from app import app, generate_feedback_items, chunk_prompt_lines, estimate_tokens, feedback_map_key, LLMError
+
+class FlakyModel:
+    """Ordnet jede Zeile als eigenen Eintrag ein; ausgewählte Abschnitte schlagen beim ersten Mal fehl"""
+
+    def __init__(self, fail_first=()):
+        self.fail_first = set(fail_first)
+        self.map_calls = []
+        self.reduce_calls = 0
+        self.lock = threading.Lock()
+
+    def chat_completion(self, model, messages, max_tokens, **kwargs):
+        prompt = messages[-1]['content']
+        if 'abschnittsweise erstellt' in prompt:
+            self.reduce_calls += 1
+            entries = re.findall(r'- \((\w+), (\d+)×\) (.*)', prompt)
+            return json.dumps({'items': [{'category': c, 'text': t, 'count': int(n)} for c, n, t in entries]})
+
+        texts = re.findall(r'NEUES FEEDBACK(?: \(\d+×\))?: (.*)', prompt)
+        with self.lock:
+            self.map_calls.append(texts[0])
+            first_call = self.map_calls.count(texts[0]) == 1
+        if first_call and texts[0] in self.fail_first:
+            raise LLMError("Simulierter Fehler")
+        return json.dumps({'items': [{'category': 'questions', 'text': text} for text in texts]})
+
+def make_feedbacks(count):
+    return [SimpleNamespace(content=f"Frage {hashlib.sha1(str(i).encode()).hexdigest()}?") for i in range(count)]
+
+def run_with(model, feedbacks):
+    original_client = app_module.llm_client
+    app_module.llm_client = SimpleNamespace(chat_completion=model.chat_completion)
+    try:
+        with app.app_context():
+            return generate_feedback_items(feedbacks, "# Info", None)
+    finally:
+        app_module.llm_client = original_client
+
+def test_feedback_map_reduce():
+    print("Testing map-reduce feedback processing...")
+
+    original_config = {key: app.config[key] for key in ('FEEDBACK_MAP_CHUNK_TOKENS', 'FEEDBACK_MAP_RETRIES', 'FEEDBACK_CLUSTER_MIN_BATCH',
+                                                    'FEEDBACK_CLUSTER_THRESHOLD')}
+    app.config['FEEDBACK_MAP_CHUNK_TOKENS'] = 200
+    app.config['FEEDBACK_CLUSTER_MIN_BATCH'] = 10 ** 6  # Nur Map-Reduce testen, nicht das Clustering
+    try:
+        # Test 1: Abschnitte bleiben unter dem Token-Budget
+        print("\nTest 1: Token-bounded chunks")
+        lines = [(feedback.content, 1) for feedback in make_feedbacks(60)]
+        chunks = chunk_prompt_lines(lines, 200)
+        sizes = [sum(estimate_tokens(f"{i}. NEUES FEEDBACK: {text}") for i, (text, _) in enumerate(chunk, 1)) for chunk in chunks]
+        if len(chunks) > 1 and max(sizes) <= 200 and sum(len(chunk) for chunk in chunks) == 60:
+            print(f"✓ 60 lines split into {len(chunks)} chunks of at most {max(sizes)} tokens")
+        else:
+            print(f"✗ Unexpected chunk sizes: {sizes}")
+            return False
+
+        # Test 2: Nur fehlgeschlagene Abschnitte werden wiederholt
+        print("\nTest 2: Retry only failed chunks")
+        feedbacks = make_feedbacks(60)
+        first_lines = [chunk[0][0] for chunk in chunk_prompt_lines([(f.content, 1) for f in feedbacks], 200)]
+        model = FlakyModel(fail_first=first_lines[:2])
+        items = run_with(model, feedbacks)
+        if (items and len(items['items']) == 60 and len(model.map_calls) == len(first_lines) + 2
+                and model.reduce_calls == 1):
+            print(f"✓ {len(first_lines)} chunks, {len(model.map_calls)} map calls, all 60 feedbacks merged")
+        else:
+            print(f"✗ Map calls: {len(model.map_calls)}, items: {len(items['items']) if items else None}")
+            return False
+
+        # Test 3: Erfolgreiche Abschnitte überleben einen fehlgeschlagenen Zyklus
+        print("\nTest 3: Partial results survive a failed cycle")
+        app.config['FEEDBACK_MAP_RETRIES'] = 0
+        feedbacks = make_feedbacks(61)
+        first_lines = [chunk[0][0] for chunk in chunk_prompt_lines([(f.content, 1) for f in feedbacks], 200)]
+        model = FlakyModel(fail_first=first_lines[:1])
+        failed_cycle = run_with(model, feedbacks)
+        calls_after_failure = len(model.map_calls)
+        items = run_with(model, feedbacks)
+        if failed_cycle is None and items and len(model.map_calls) == calls_after_failure + 1:
+            print("✓ Second cycle only re-requests the failed chunk")
+        else:
+            print(f"✗ Map calls: {calls_after_failure} then {len(model.map_calls)}")
+            return False
+
+        # Test 4: Nach Verdichtung (gleiche next_id, andere Einträge) kein Cache-Treffer
+        print("\nTest 4: Cache key covers the existing items")
+        lines = [('Gibt es die Folien?', 1)]
+        before = {'next_id': 5, 'items': [{'id': 1, 'category': 'questions', 'text': 'Folien?', 'count': 1}]}
+        compacted = {'next_id': 5, 'items': [{'id': 4, 'category': 'other', 'text': 'Sammelpunkt', 'count': 4}]}
+        if (feedback_map_key(lines, before, 'Info') == feedback_map_key(lines, dict(before), 'Info')
+                and feedback_map_key(lines, before, 'Info') != feedback_map_key(lines, compacted, 'Info')
+                and feedback_map_key(lines, before, 'Info') != feedback_map_key(lines, before, 'Neue Info')):
+            print("✓ Different items or info digest give a different key")
+        else:
+            print("✗ Cache key ignores the existing items")
+            return False
+
+        # Test 5: Themen-Cluster behalten weitere Fragen (gekürzt) und deren Links
+        print("\nTest 5: Topic clusters keep member questions and links")
+        app.config['FEEDBACK_CLUSTER_MIN_BATCH'] = 2
+        app.config['FEEDBACK_CLUSTER_THRESHOLD'] = 0.3
+        feedbacks = [SimpleNamespace(content=text) for text in (
+            "Die Folien bitte als PDF hochladen",
+            "Wo kann ich die Folien als PDF herunterladen? Alte Version: https://example.org/talks/folien.pdf",
+            "Grüße aus Berlin",
+        )]
+        model = FlakyModel()
+        items = run_with(model, feedbacks)
+        if (items and len(items['items']) == 2 and 'herunterladen' in items['items'][0]['text']
+                and [link['url'] for link in items['links']] == ['https://example.org/talks/folien.pdf']):
+            print(f"✓ Cluster line: {items['items'][0]['text']!r}, member link kept")
+        else:
+            print(f"✗ Prompt: {model.map_calls}, items: {items}")
+            return False
+    finally:
+        app.config.update(original_config)
+
+    print("\nAll map-reduce tests passed! ✓")
+    return True
+
+if __name__ == "__main__":
+    success = test_feedback_map_reduce()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Test script for the heap-based feedback processing scheduler
+"""
+
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from app import (app, feedback_processing_queue, reschedule_feedback_processing,
+                 remove_from_processing_queue, wait_for_due_presentations,
+                 batching_window, adaptive_due_time, _record_arrivals_locked, next_processing_slot)
+
+def test_feedback_scheduler():
+    print("Testing feedback scheduler...")
+
+    now = datetime.utcnow()
+
+    # Test 1: Fällige Präsentationen kommen in Zeitreihenfolge
+    print("\nTest 1: Due order")
+    reschedule_feedback_processing(9001, now + timedelta(seconds=0.2))
+    reschedule_feedback_processing(9002, now + timedelta(seconds=0.1))
+    due = []
+    while len(due) < 2:
+        due.extend(wait_for_due_presentations())
+    if due == [9002, 9001]:
+        print("✓ Presentations are returned in due order")
+    else:
+        print(f"✗ Unexpected order: {due}")
+        return False
+
+    # Test 2: Früherer Eintrag weckt den wartenden Thread
+    print("\nTest 2: Early wakeup")
+    reschedule_feedback_processing(9003, datetime.utcnow() + timedelta(seconds=30))
+    result = {}
+
+    def waiter():
+        start = time.monotonic()
+        result['due'] = wait_for_due_presentations()
+        result['elapsed'] = time.monotonic() - start
+
+    thread = threading.Thread(target=waiter, daemon=True)
+    thread.start()
+    time.sleep(0.1)
+    reschedule_feedback_processing(9004, datetime.utcnow() + timedelta(seconds=0.1))
+    thread.join(5)
+
+    if result.get('due') == [9004] and result['elapsed'] < 2:
+        print(f"✓ Woken after {result['elapsed']:.2f}s for the earlier slot")
+    else:
+        print(f"✗ Scheduler did not wake up early: {result}")
+        return False
+
+    # Test 3: Verschobene und entfernte Einträge werden übersprungen
+    print("\nTest 3: Stale heap entries")
+    remove_from_processing_queue(9003)
+    reschedule_feedback_processing(9005, datetime.utcnow() + timedelta(seconds=0.05))
+    reschedule_feedback_processing(9005, datetime.utcnow() + timedelta(seconds=0.15))
+    due = wait_for_due_presentations()
+    if due == [9005] and 9003 not in feedback_processing_queue:
+        print("✓ Only the current entry is returned")
+    else:
+        print(f"✗ Unexpected due list: {due}")
+        return False
+
+    for presentation_id in (9001, 9002, 9004, 9005):
+        remove_from_processing_queue(presentation_id)
+
+    # Test 4: Adaptives Sammelfenster
+    print("\nTest 4: Adaptive batching window")
+    start = datetime.utcnow()
+    window_min = app.config['FEEDBACK_WINDOW_MIN']
+    window_max = app.config['FEEDBACK_WINDOW_MAX']
+    spacing = app.config['FEEDBACK_MIN_SPACING']
+
+    def fresh_state():
+        return {'rate': 0.0, 'last_arrival': None, 'pending': 0, 'first_pending': None, 'last_dispatch': None}
+
+    # Ruhiger Raum: eine einzelne Frage wird nach dem Mindestfenster verarbeitet
+    quiet = fresh_state()
+    _record_arrivals_locked(quiet, start, 1)
+    quiet_delay = (adaptive_due_time(quiet, start) - start).total_seconds()
+
+    # Burst: Schwelle erreicht -> sofort, aber mit Mindestabstand zum letzten Aufruf
+    burst = fresh_state()
+    burst['last_dispatch'] = start - timedelta(seconds=spacing / 3)
+    _record_arrivals_locked(burst, start, app.config['FEEDBACK_BATCH_THRESHOLD'])
+    burst_delay = (adaptive_due_time(burst, start) - start).total_seconds()
+
+    # Mittlere Rate: Fenster wächst über das Minimum, bleibt aber begrenzt
+    moderate_rate = 2 / window_min
+    if (abs(quiet_delay - window_min) < 0.01 and abs(burst_delay - spacing * 2 / 3) < 0.01
+            and window_min < batching_window(moderate_rate) <= window_max
+            and batching_window(0.001) == window_min):
+        print(f"✓ Quiet: {quiet_delay:.0f}s, burst: {burst_delay:.0f}s (spacing), "
+              f"moderate rate: {batching_window(moderate_rate):.0f}s window")
+    else:
+        print(f"✗ Unexpected delays: quiet {quiet_delay}, burst {burst_delay}, moderate {batching_window(moderate_rate)}")
+        return False
+
+    # Test 5: Feste Slots sind pro Präsentation versetzt, aber vorhersagbar
+    print("\nTest 5: Staggered slots")
+    now = datetime(2026, 3, 1, 10, 0, 0, 500000)
+    interval = app.config['FEEDBACK_PROCESSING_INTERVAL']
+    jitter = app.config['FEEDBACK_SLOT_JITTER']
+    slots = [next_processing_slot(now, presentation_id) for presentation_id in range(1, 201)]
+    delays = [(slot - now).total_seconds() for slot in slots]
+    busiest_second = max(sum(1 for delay in delays if int(delay) == second) for second in range(interval + jitter + 1))
+    if (slots == [next_processing_slot(now, presentation_id) for presentation_id in range(1, 201)]
+            and all(0 < delay <= interval + jitter for delay in delays)
+            and busiest_second <= 200 / interval * 3
+            and (next_processing_slot(now) - now).total_seconds() == interval - 0.5):
+        print(f"✓ 200 presentations spread over {interval}s, at most {busiest_second} per second")
+    else:
+        print(f"✗ Unexpected slots: {sorted(delays)[:10]}..., busiest second {busiest_second}")
+        return False
+
+    print("\nAll feedback scheduler tests passed! ✓")
+    return True
+
+if __name__ == "__main__":
+    success = test_feedback_scheduler()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Test script for the shared circuit breaker, run against a local fake OpenAI upstream
+that injects errors and latency
+"""
+
+import json
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from llm_client import LLMClient, LLMError, CircuitBreaker, CircuitOpenError
+
+class FakeUpstream(BaseHTTPRequestHandler):
+    """Chat-Completions-Attrappe: mode = 'ok', 'error' (500) oder 'bad_request' (400), jeweils nach delay Sekunden"""
+    protocol_version = 'HTTP/1.1'
+    mode = 'ok'
+    hits = 0
+    delay = 0.0
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers['Content-Length']))
+        FakeUpstream.hits += 1
+        time.sleep(FakeUpstream.delay)
+        if FakeUpstream.mode == 'error':
+            status, body = 500, {'error': {'message': 'upstream overloaded'}}
+        elif FakeUpstream.mode == 'bad_request':
+            status, body = 400, {'error': {'message': 'invalid request'}}
+        else:
+            status, body = 200, {'choices': [{'message': {'content': '{"items": []}'}}]}
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+class QuietServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        pass  # Abgebrochene Verbindungen (Client-Timeout) sind hier gewollt
+
+def call(client):
+    try:
+        client.chat_completion(model='gpt-4.1-mini', messages=[{'role': 'user', 'content': 'Hallo'}], max_tokens=10)
+        return 'ok'
+    except CircuitOpenError:
+        return 'rejected'
+    except LLMError:
+        return 'error'
+
+def wait_until_half_open(breaker):
+    time.sleep(breaker.retry_after() + 0.01)
+
+def test_llm_circuit_breaker():
+    print("Testing LLM circuit breaker against a fake upstream...")
+
+    server = QuietServer(('127.0.0.1', 0), FakeUpstream)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+    breaker = CircuitBreaker(failure_threshold=3, base_delay=0.2, max_delay=1.0, jitter=0.5)
+    client = LLMClient(api_key='test', base_url=base_url, read_timeout=0.3, breaker=breaker)
+
+    try:
+        # Test 1: Nach drei Störungen in Folge erreicht kein Aufruf mehr den Upstream
+        print("\nTest 1: Breaker opens after consecutive failures")
+        FakeUpstream.mode = 'error'
+        results = [call(client) for _ in range(10)]
+        if results == ['error'] * 3 + ['rejected'] * 7 and FakeUpstream.hits == 3 and breaker.stats()['state'] == 'open':
+            print(f"✓ 3 upstream calls, 7 rejected locally, retry in {breaker.retry_after():.2f}s")
+        else:
+            print(f"✗ Results {results}, upstream hits {FakeUpstream.hits}")
+            return False
+
+        # Test 2: Halboffen - nur ein Probe-Aufruf, danach längere Wartezeit
+        print("\nTest 2: Single half-open probe with growing backoff")
+        wait_until_half_open(breaker)
+        FakeUpstream.delay = 0.1
+        FakeUpstream.hits = 0
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(call(client))) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        second_delay = breaker.retry_after()
+        if (FakeUpstream.hits == 1 and sorted(results) == ['error'] + ['rejected'] * 4
+                and breaker.stats()['state'] == 'open' and breaker.stats()['opened'] == 2 and second_delay > 0.15):
+            print(f"✓ 1 of 5 concurrent calls probed, failed probe reopened the breaker for {second_delay:.2f}s")
+        else:
+            print(f"✗ Results {results}, upstream hits {FakeUpstream.hits}, {breaker.stats()}")
+            return False
+
+        # Erfolgreiche Probe schließt den Breaker
+        FakeUpstream.mode, FakeUpstream.delay = 'ok', 0.0
+        wait_until_half_open(breaker)
+        results = [call(client) for _ in range(3)]
+        if results != ['ok'] * 3 or breaker.stats()['state'] != 'closed':
+            print(f"✗ Breaker did not close: {results}, {breaker.stats()}")
+            return False
+
+        # Test 3: Latenz - Timeouts zählen als Störung, Fehler der Anfrage nicht
+        print("\nTest 3: Timeouts trip the breaker, client errors do not")
+        FakeUpstream.mode = 'bad_request'
+        client_errors = [call(client) for _ in range(5)]
+        state_after_400 = breaker.stats()['state']
+        FakeUpstream.mode, FakeUpstream.delay = 'ok', 0.6
+        timeouts = [call(client) for _ in range(4)]
+        if (client_errors == ['error'] * 5 and state_after_400 == 'closed'
+                and timeouts == ['error'] * 3 + ['rejected'] and client.stats()['models']['gpt-4.1-mini']['timeouts'] == 3):
+            print("✓ 400 responses keep the breaker closed, 3 timeouts open it")
+        else:
+            print(f"✗ 400: {client_errors} ({state_after_400}), slow: {timeouts}")
+            return False
+
+        # Test 4: Fehlerkontext der Präsentation wird gefüllt
+        print("\nTest 4: Error context is stored")
+        import app as app_module
+        from app import app, db, User, Presentation, Feedback, ProcessingQueueEntry, process_presentation_feedback
+
+        FakeUpstream.mode, FakeUpstream.delay = 'error', 0.0
+        original_base_url = app_module.llm_client.base_url
+        app_module.llm_client.base_url = base_url
+        try:
+            with app.app_context():
+                db.create_all()
+                user = User.query.filter_by(username='testuser_breaker').first()
+                if not user:
+                    user = User(username='testuser_breaker')
+                    user.set_password('testpass')
+                    db.session.add(user)
+                    db.session.commit()
+                presentation = Presentation(title='Breaker', access_code=uuid.uuid4().hex[:8], user_id=user.id)
+                db.session.add(presentation)
+                db.session.commit()
+                presentation_id = presentation.id
+                db.session.add(Feedback(content='Gibt es die Folien?', presentation_id=presentation_id))
+                db.session.commit()
+
+            started = time.monotonic()
+            process_presentation_feedback(presentation_id)
+            with app.app_context():
+                presentation = db.session.get(Presentation, presentation_id)
+                entry = db.session.get(ProcessingQueueEntry, presentation_id)
+                delay = (presentation.retry_after - presentation.last_error_time).total_seconds()
+                ok = ('500' in (presentation.last_error_message or '') and entry is not None and entry.attempts == 1
+                      and entry.lease_owner is None and entry.due_at == presentation.retry_after
+                      and app.config['FEEDBACK_RETRY_DELAY'] * 0.5 <= delay <= app.config['FEEDBACK_RETRY_DELAY']
+                      and time.monotonic() - started < 5)
+            app_module.remove_from_processing_queue(presentation_id)
+        finally:
+            app_module.llm_client.base_url = original_base_url
+
+        if ok:
+            print(f"✓ last_error_message and retry_after (+{delay:.1f}s) stored, attempt counted")
+        else:
+            print("✗ Error context not stored as expected")
+            return False
+    finally:
+        server.shutdown()
+
+    print("\nAll circuit breaker tests passed! ✓")
+    return True
+
+if __name__ == "__main__":
+    success = test_llm_circuit_breaker()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+Test script for hedged LLM requests and call deadlines, run against a local fake
+OpenAI upstream with controllable latency
+"""
+
+import json
+import sys
+import threading
+import time
+from collections import deque
+from types import SimpleNamespace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from llm_client import LLMClient, LLMError, CircuitBreaker, CircuitOpenError, DeadlineExceededError
+
+class FakeUpstream(BaseHTTPRequestHandler):
+    """Chat-Completions-Attrappe: Antwortzeit aus delays (in Eingangsreihenfolge), sonst delay.
+    Gestreamte Anfragen liefern stream_chunks Fragmente im Abstand von stream_gaps"""
+    protocol_version = 'HTTP/1.1'
+    hits = 0
+    delay = 0.0
+    delays = deque()
+    lock = threading.Lock()
+    stream_gaps = []
+
+    def do_POST(self):
+        payload = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+        if payload.get('stream'):
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Transfer-Encoding', 'chunked')
+            self.end_headers()
+            for gap in FakeUpstream.stream_gaps:
+                time.sleep(gap)
+                self.write_chunk(f"data: {json.dumps({'choices': [{'delta': {'content': 'Text '}}]})}\n\n")
+            self.write_chunk("data: [DONE]\n\n")
+            self.write_chunk("")
+            return
+        with FakeUpstream.lock:
+            FakeUpstream.hits += 1
+            delay = FakeUpstream.delays.popleft() if FakeUpstream.delays else FakeUpstream.delay
+        time.sleep(delay)
+        data = json.dumps({'choices': [{'message': {'content': '{"items": []}'}}]}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def write_chunk(self, text):
+        data = text.encode()
+        self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+        self.wfile.flush()
+
+    def log_message(self, *args):
+        pass
+
+class QuietServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def handle_error(self, request, client_address):
+        pass  # Abgebrochene Verbindungen (Client-Timeout) sind hier gewollt
+
+def call(client, **kwargs):
+    return client.chat_completion(model='gpt-4.1-mini', messages=[{'role': 'user', 'content': 'Hallo'}],
+                                  max_tokens=10, **kwargs)
+
+def test_llm_hedging():
+    print("Testing hedged LLM requests against a fake upstream...")
+
+    server = QuietServer(('127.0.0.1', 0), FakeUpstream)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+    breaker = CircuitBreaker(failure_threshold=3)
+    client = LLMClient(api_key='test', base_url=base_url, read_timeout=5, breaker=breaker,
+                       hedge_percentile=0.9, hedge_max_rate=0.2, hedge_min_samples=10)
+
+    try:
+        # Test 1: Ausreißer - die zweite Anfrage gewinnt
+        print("\nTest 1: Hedge wins against a slow outlier")
+        FakeUpstream.delay = 0.02
+        for _ in range(10):
+            call(client, hedge=True)
+        FakeUpstream.hits = 0
+        FakeUpstream.delays.extend([2.0])  # Nur die erste Anfrage hängt
+        started = time.monotonic()
+        call(client, hedge=True)
+        elapsed = time.monotonic() - started
+        hedging = client.stats()['hedging']
+        if elapsed < 1.0 and FakeUpstream.hits == 2 and hedging['fired'] == 1 and hedging['won'] == 1:
+            print(f"✓ Answer after {elapsed:.2f}s instead of 2s, hedge fired after {client.hedge_delay('gpt-4.1-mini'):.3f}s")
+        else:
+            print(f"✗ Elapsed {elapsed:.2f}s, upstream hits {FakeUpstream.hits}, {hedging}")
+            return False
+
+        # Test 2: Obergrenze - höchstens hedge_max_rate zusätzliche Anfragen
+        print("\nTest 2: Hedge rate is capped")
+        time.sleep(2.1)  # Verworfene Anfrage aus Test 1 läuft aus
+        FakeUpstream.hits = 0
+        FakeUpstream.delay = 0.5
+        threads = [threading.Thread(target=call, args=(client,), kwargs={'hedge': True}) for _ in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        hedging = client.stats()['hedging']
+        new_hedges = hedging['fired'] - 1
+        if (hedging['fired'] <= hedging['max_rate'] * hedging['eligible'] and hedging['skipped'] >= 5
+                and FakeUpstream.hits == 10 + new_hedges):
+            print(f"✓ {hedging['fired']} hedges for {hedging['eligible']} calls (rate {hedging['rate']}), "
+                  f"{hedging['skipped']} skipped")
+        else:
+            print(f"✗ Upstream hits {FakeUpstream.hits}, {hedging}")
+            return False
+
+        # Test 3: Deadline begrenzt den Aufruf - nur die gesendete Anfrage zählt für den Breaker
+        print("\nTest 3: Deadline")
+        time.sleep(0.6)
+        FakeUpstream.hits = 0
+        FakeUpstream.delay = 1.0
+        started = time.monotonic()
+        try:
+            call(client, deadline=time.monotonic() + 0.3)
+            outcome = 'ok'
+        except DeadlineExceededError:
+            outcome = 'deadline'
+        except LLMError:
+            outcome = 'error'
+        elapsed = time.monotonic() - started
+        try:
+            call(client, deadline=time.monotonic() - 1)
+            expired = 'ok'
+        except DeadlineExceededError:
+            expired = 'deadline'
+        if (outcome == 'deadline' and elapsed < 0.6 and expired == 'deadline' and FakeUpstream.hits == 1
+                and breaker.stats()['consecutive_failures'] == 1 and client.stats()['deadline_exceeded'] == 2):
+            print(f"✓ Call stopped after {elapsed:.2f}s and counted, expired deadline never reached the upstream")
+        else:
+            print(f"✗ Outcome {outcome} after {elapsed:.2f}s, expired: {expired}, hits {FakeUpstream.hits}, {breaker.stats()}")
+            return False
+
+        # Test 4: Deadline beendet auch gestreamte Aufrufe (tröpfelnd oder hängend)
+        print("\nTest 4: Deadline for streamed calls")
+        outcomes = []
+        for gaps in ([0.1] * 30, [0.05, 3.0]):
+            FakeUpstream.stream_gaps = gaps
+            received = []
+            started = time.monotonic()
+            try:
+                for delta in client.stream_chat_completion(model='gpt-4.1-mini', messages=[{'role': 'user', 'content': 'Hallo'}],
+                                                           max_tokens=10, deadline=time.monotonic() + 0.5):
+                    received.append(delta)
+                outcome = 'ok'
+            except DeadlineExceededError:
+                outcome = 'deadline'
+            except LLMError as e:
+                outcome = f'error: {e}'
+            outcomes.append((outcome, len(received), round(time.monotonic() - started, 2)))
+        if (all(outcome == 'deadline' and received > 0 and elapsed < 0.8 for outcome, received, elapsed in outcomes)
+                and breaker.stats()['state'] == 'closed'):
+            print(f"✓ Slow and stalled streams stopped after {outcomes[0][2]}s and {outcomes[1][2]}s")
+        else:
+            print(f"✗ Outcomes: {outcomes}, {breaker.stats()}")
+            return False
+
+        # Test 5: Hängt der Upstream länger als die Deadline, öffnet der Breaker
+        print("\nTest 5: Timeouts cut by the deadline open the breaker")
+        FakeUpstream.hits = 0
+        FakeUpstream.delay = 2.0
+        breaker = CircuitBreaker(failure_threshold=3)
+        client = LLMClient(api_key='test', base_url=base_url, read_timeout=0.9, breaker=breaker)
+        outcomes = []
+        for _ in range(8):
+            try:
+                call(client, deadline=time.monotonic() + 0.3)
+                outcomes.append('ok')
+            except CircuitOpenError:
+                outcomes.append('open')
+            except DeadlineExceededError:
+                outcomes.append('deadline')
+        if outcomes == ['deadline'] * 3 + ['open'] * 5 and FakeUpstream.hits == 3 and breaker.stats()['state'] == 'open':
+            print("✓ Breaker opened after 3 calls, the remaining 5 were rejected locally")
+        else:
+            print(f"✗ Outcomes {outcomes}, hits {FakeUpstream.hits}, {breaker.stats()}")
+            return False
+    finally:
+        server.shutdown()
+
+    # Test 6: Feedback-Aufrufe laufen gesichert mit Deadline aus dem Verarbeitungsintervall
+    print("\nTest 6: Feedback calls use a deadline derived from the processing interval")
+    import app as app_module
+    from app import app, request_feedback_items, empty_feedback_items
+
+    captured = {}
+
+    def fake_chat_completion(model, messages, max_tokens, **kwargs):
+        captured.update(kwargs)
+        return '{"items": []}'
+
+    original_client = app_module.llm_client
+    app_module.llm_client = SimpleNamespace(chat_completion=fake_chat_completion)
+    try:
+        started = time.monotonic()
+        request_feedback_items([('Gibt es die Folien?', 1)], None, empty_feedback_items(),
+                               deadline=app_module.feedback_deadline())
+    finally:
+        app_module.llm_client = original_client
+
+    budget = app.config['FEEDBACK_PROCESSING_INTERVAL'] * app.config['FEEDBACK_DEADLINE_FRACTION']
+    if captured.get('hedge') is True and abs(captured.get('deadline', 0) - started - budget) < 1:
+        print(f"✓ Hedged call with a {budget:.0f}s deadline")
+    else:
+        print(f"✗ Unexpected call options: {captured}")
+        return False
+
+    print("\nAll hedging tests passed! ✓")
+    return True
+
+if __name__ == "__main__":
+    success = test_llm_hedging()
+    sys.exit(0 if success else 1)
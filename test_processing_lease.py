@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Stress test: several processes share one SQLite file and process feedback
+concurrently - every feedback must reach the AI exactly once
+"""
+
+import json
+import os
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+
+WORKERS = 4
+PRESENTATIONS = 5
+FEEDBACKS_PER_WORKER = 80
+
+def setup_database():
+    """Legt Schema und Präsentationen an (eigener Prozess mit der Test-Datenbank)"""
+    from app import app, db, User, Presentation
+    with app.app_context():
+        db.create_all()
+        user = User(username='testuser_lease')
+        user.set_password('testpass')
+        db.session.add(user)
+        db.session.commit()
+        presentations = [Presentation(title=f'Lease {i}', access_code=f'lease{i:03d}', user_id=user.id)
+                         for i in range(PRESENTATIONS)]
+        db.session.add_all(presentations)
+        db.session.commit()
+        print(json.dumps([presentation.id for presentation in presentations]))
+
+def run_worker(index, presentation_ids, log_path):
+    """Verhält sich wie ein Gunicorn-Worker: nimmt Feedback an und verarbeitet im Hintergrund"""
+    import app as app_module
+    from app import (app, db, Feedback, ProcessingQueueEntry, feedback_ingest_buffer,
+                     empty_feedback_items, recover_processing_queue, presentations_in_flight)
+
+    app.config.update(FEEDBACK_WINDOW_MIN=0.05, FEEDBACK_WINDOW_MAX=0.3, FEEDBACK_MIN_SPACING=0,
+                      FEEDBACK_LEASE_RETRY=0.05, FEEDBACK_PROCESSING_INTERVAL=1)
+
+    def fake_generate_feedback_items(feedbacks, static_info_digest, existing_items, errors=None):
+        with open(log_path, 'a') as log:
+            log.write(json.dumps([feedback.id for feedback in feedbacks]) + '\n')
+        time.sleep(0.02)  # KI-Aufruf
+        return empty_feedback_items()
+
+    app_module.generate_feedback_items = fake_generate_feedback_items
+
+    with app.app_context():
+        recover_processing_queue()
+
+    pending = []
+    for i in range(FEEDBACKS_PER_WORKER):
+        presentation_id = presentation_ids[(i + index) % len(presentation_ids)]
+        pending.append(feedback_ingest_buffer.submit(presentation_id, f"Prozess {index} Frage {i}?"))
+        time.sleep(0.002)
+    if not all(item.wait(30) for item in pending):
+        sys.exit(2)
+
+    # Bis alles verarbeitet ist - auch Feedback, das andere Prozesse angenommen haben
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        with app.app_context():
+            unprocessed = Feedback.query.filter_by(is_processed=False).count()
+            queued = ProcessingQueueEntry.query.count()
+        if unprocessed == 0 and queued == 0 and not presentations_in_flight:
+            return
+        time.sleep(0.1)
+    sys.exit(3)
+
+def test_processing_lease():
+    print("Testing lease-based processing with several processes...")
+
+    with tempfile.TemporaryDirectory() as directory:
+        database = os.path.join(directory, 'lease.db')
+        env = dict(os.environ, DATABASE_URL=f'sqlite:///{database}', SECRET_KEY='test')
+        script = os.path.abspath(__file__)
+
+        setup = subprocess.run([sys.executable, script, 'setup'], env=env, capture_output=True, text=True)
+        presentation_ids = setup.stdout.strip().splitlines()[-1]
+
+        logs = [os.path.join(directory, f'worker{index}.log') for index in range(WORKERS)]
+        workers = [
+            subprocess.Popen([sys.executable, script, 'worker', str(index), presentation_ids, logs[index]],
+                             env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            for index in range(WORKERS)
+        ]
+        codes = [worker.wait(120) for worker in workers]
+
+        calls = []
+        for log_path in logs:
+            if os.path.exists(log_path):
+                with open(log_path) as log:
+                    calls.extend(json.loads(line) for line in log)
+        included = Counter(feedback_id for call in calls for feedback_id in call)
+
+        with sqlite3.connect(database) as conn:
+            feedback_ids = [row[0] for row in conn.execute('SELECT id FROM feedback')]
+            unprocessed = conn.execute('SELECT COUNT(*) FROM feedback WHERE is_processed = 0').fetchone()[0]
+
+    # Test 1: Alle Prozesse laufen durch, alles ist verarbeitet
+    print("\nTest 1: All feedback processed")
+    if codes == [0] * WORKERS and len(feedback_ids) == WORKERS * FEEDBACKS_PER_WORKER and unprocessed == 0:
+        print(f"✓ {len(feedback_ids)} feedbacks from {WORKERS} processes processed")
+    else:
+        print(f"✗ Exit codes {codes}, {len(feedback_ids)} feedbacks, {unprocessed} unprocessed")
+        return False
+
+    # Test 2: Kein Feedback wurde doppelt an die KI geschickt
+    print("\nTest 2: No feedback included twice")
+    duplicates = [feedback_id for feedback_id, count in included.items() if count > 1]
+    if not duplicates and set(included) == set(feedback_ids):
+        print(f"✓ {len(calls)} AI calls, every feedback included exactly once")
+    else:
+        print(f"✗ {len(duplicates)} feedbacks included more than once, {len(set(feedback_ids) - set(included))} missing")
+        return False
+
+    print("\nAll processing lease tests passed! ✓")
+    return True
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == 'setup':
+        setup_database()
+    elif len(sys.argv) > 1 and sys.argv[1] == 'worker':
+        run_worker(int(sys.argv[2]), json.loads(sys.argv[3]), sys.argv[4])
+    else:
+        success = test_processing_lease()
+        sys.exit(0 if success else 1)
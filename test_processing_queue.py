@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Test script for the durable feedback processing queue and its restart recovery
+"""
+
+import sys
+import uuid
+from datetime import datetime, timedelta
+import app as app_module
+from app import (app, db, User, Presentation, Feedback, ProcessingQueueEntry, feedback_processing_queue,
+                 upsert_processing_queue, complete_processing_queue, recover_processing_queue,
+                 remove_from_processing_queue, feedback_ingest_buffer, sync_processing_queue,
+                 process_presentation_feedback)
+
+def create_presentation(feedbacks=0, is_deleted=False):
+    user = User.query.filter_by(username='testuser_queue').first()
+    if not user:
+        user = User(username='testuser_queue')
+        user.set_password('testpass')
+        db.session.add(user)
+        db.session.commit()
+
+    presentation = Presentation(title='Warteschlange', access_code=uuid.uuid4().hex[:8],
+                                user_id=user.id, is_deleted=is_deleted)
+    db.session.add(presentation)
+    db.session.flush()
+    db.session.add_all([Feedback(content=f"Frage {i}?", presentation_id=presentation.id) for i in range(feedbacks)])
+    db.session.commit()
+    return presentation.id
+
+def test_processing_queue():
+    print("Testing durable processing queue...")
+
+    original_start = app_module.start_processing_thread
+    app_module.start_processing_thread = lambda: None  # Keine echten KI-Aufrufe im Test
+    try:
+        with app.app_context():
+            db.create_all()
+            now = datetime.utcnow()
+
+            # Test 1: Frühere Fälligkeit gewinnt beim Eintragen
+            print("\nTest 1: Upsert keeps the earlier due time")
+            planned = create_presentation(feedbacks=2)
+            upsert_processing_queue({planned: now + timedelta(seconds=30)})
+            upsert_processing_queue({planned: now + timedelta(seconds=10)})
+            upsert_processing_queue({planned: now + timedelta(seconds=50)})
+            db.session.commit()
+            entry = db.session.get(ProcessingQueueEntry, planned)
+            if entry.due_at == now + timedelta(seconds=10) and entry.attempts == 0:
+                print("✓ One row per presentation with the earliest due time")
+            else:
+                print(f"✗ Unexpected entry: due {entry.due_at}, attempts {entry.attempts}")
+                return False
+
+            # Test 2: Wiederherstellung nach einem Neustart
+            print("\nTest 2: Recovery after restart")
+            unplanned = create_presentation(feedbacks=3)   # Absturz vor dem Eintrag in die Warteschlange
+            finished = create_presentation(feedbacks=0)    # Veralteter Eintrag ohne wartendes Feedback
+            deleted = create_presentation(feedbacks=1, is_deleted=True)
+            upsert_processing_queue({finished: now, deleted: now})
+            db.session.commit()
+            for presentation_id in (planned, unplanned, finished, deleted):
+                remove_from_processing_queue(presentation_id)  # Speicher geht beim Neustart verloren
+
+            recover_processing_queue()
+            rows = {entry.presentation_id for entry in ProcessingQueueEntry.query.all()}
+            if (planned in feedback_processing_queue and unplanned in feedback_processing_queue
+                    and feedback_processing_queue[planned]['next_processing_time'] == now + timedelta(seconds=10)
+                    and finished not in rows and deleted not in rows and unplanned in rows
+                    and finished not in feedback_processing_queue and deleted not in feedback_processing_queue):
+                print("✓ Pending presentations re-enqueued, stale entries removed")
+            else:
+                print(f"✗ Unexpected state: rows {rows}, memory {sorted(feedback_processing_queue)}")
+                return False
+
+            # Test 3: Eintrag bleibt, solange unverarbeitetes Feedback wartet
+            print("\nTest 3: Completion only removes fully processed presentations")
+            feedbacks = Feedback.query.filter_by(presentation_id=unplanned).all()
+            for feedback in feedbacks[:2]:
+                feedback.is_processed = True
+            complete_processing_queue(unplanned)
+            db.session.commit()
+            kept = db.session.get(ProcessingQueueEntry, unplanned) is not None
+            feedbacks[2].is_processed = True
+            complete_processing_queue(unplanned)
+            db.session.commit()
+            removed = db.session.get(ProcessingQueueEntry, unplanned) is None
+            if kept and removed:
+                print("✓ Entry survives partial processing and is removed afterwards")
+            else:
+                print(f"✗ Kept: {kept}, removed: {removed}")
+                return False
+
+            # Test 4: Wiederherstellung nutzt den Index
+            print("\nTest 4: Pending feedback lookup uses the index")
+            plan = db.session.execute(db.text(
+                "EXPLAIN QUERY PLAN SELECT DISTINCT presentation_id FROM feedback WHERE is_processed = 0"
+            )).fetchall()
+            if any('ix_feedback_is_processed' in str(row) for row in plan):
+                print("✓ ix_feedback_is_processed is used")
+            else:
+                print(f"✗ Unexpected query plan: {plan}")
+                return False
+
+            for presentation_id in (planned, unplanned):
+                remove_from_processing_queue(presentation_id)
+
+            # Test 5: Worker-Modus - Web-Prozesse planen nur in der Datenbank
+            print("\nTest 5: Worker mode")
+            app.config['FEEDBACK_PROCESSING_MODE'] = 'worker'
+            app_module.processing_seen_feedback_id = db.session.query(db.func.max(Feedback.id)).scalar()
+            presentation_id = create_presentation()
+            pending = [feedback_ingest_buffer.submit(presentation_id, f"Frage {i}?") for i in range(3)]
+            committed = all(item.wait(10) for item in pending)
+            enqueued_by_web = presentation_id in feedback_processing_queue
+            arrivals = sync_processing_queue()
+            if (committed and not enqueued_by_web and arrivals == 3 and presentation_id in feedback_processing_queue
+                    and db.session.get(ProcessingQueueEntry, presentation_id) is not None and sync_processing_queue() == 0):
+                print("✓ Web process only writes the queue row, the worker picks up 3 new feedbacks once")
+            else:
+                print(f"✗ Enqueued by web: {enqueued_by_web}, arrivals: {arrivals}")
+                return False
+            remove_from_processing_queue(presentation_id)
+            app.config['FEEDBACK_PROCESSING_MODE'] = 'inline'
+
+            # Test 6: Eine fehlerhafte Zeile verwirft nicht den ganzen Batch
+            print("\nTest 6: Failed batch falls back to single rows")
+            presentation_id = create_presentation()
+            pending = [feedback_ingest_buffer.submit(presentation_id, f"Frage {i}?") for i in range(3)]
+            pending.insert(1, feedback_ingest_buffer.submit(presentation_id, None))  # NOT NULL verletzt
+            results = [item.wait(10) for item in pending]
+            stored = Feedback.query.filter_by(presentation_id=presentation_id).count()
+            if results == [True, False, True, True] and stored == 3 and pending[1].error is not None:
+                print("✓ 3 valid feedbacks stored, only the invalid one reported as failed")
+            else:
+                print(f"✗ Results {results}, {stored} stored")
+                return False
+            remove_from_processing_queue(presentation_id)
+
+            # Test 7: Unerwarteter Fehler gibt die Lease frei und plant mit Backoff neu
+            print("\nTest 7: Unexpected processing error")
+            presentation_id = create_presentation(feedbacks=2)
+            upsert_processing_queue({presentation_id: datetime.utcnow()})
+            db.session.commit()
+
+            def broken_generate_feedback_items(*args, **kwargs):
+                raise RuntimeError("Zusammenführen fehlgeschlagen")
+
+            original_generate = app_module.generate_feedback_items
+            app_module.generate_feedback_items = broken_generate_feedback_items
+            try:
+                process_presentation_feedback(presentation_id)
+            finally:
+                app_module.generate_feedback_items = original_generate
+            db.session.expire_all()
+            entry = db.session.get(ProcessingQueueEntry, presentation_id)
+            queued = feedback_processing_queue.get(presentation_id)
+            if (entry is not None and entry.lease_owner is None and entry.attempts == 1
+                    and queued is not None and queued['next_processing_time'] == entry.due_at > datetime.utcnow()):
+                print(f"✓ Lease released, retry planned at {entry.due_at:%H:%M:%S}")
+            else:
+                print(f"✗ Entry: {entry and (entry.lease_owner, entry.attempts)}, queued: {queued}")
+                return False
+            remove_from_processing_queue(presentation_id)
+    finally:
+        app.config['FEEDBACK_PROCESSING_MODE'] = 'inline'
+        app_module.start_processing_thread = original_start
+
+    print("\nAll processing queue tests passed! ✓")
+    return True
+
+if __name__ == "__main__":
+    success = test_processing_queue()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Test script for the rendered HTML cache of the live-info endpoints
+"""
+
+import sys
+import threading
+import time
+from app import RenderedHtmlCache
+
+def test_rendered_html_cache():
+    print("Testing rendered HTML cache...")
+
+    cache = RenderedHtmlCache()
+    render_calls = []
+
+    def slow_render():
+        render_calls.append(1)
+        time.sleep(0.1)
+        return '<p>Inhalt</p>'
+
+    # Test 1: Gleichzeitige Misses werden zusammengefasst
+    print("\nTest 1: Concurrent misses are coalesced")
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_render(1, 'public', 1, slow_render)))
+        for _ in range(10)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    if len(render_calls) == 1 and results == ['<p>Inhalt</p>'] * 10:
+        print("✓ Only one render for 10 concurrent requests")
+    else:
+        print(f"✗ Expected 1 render, got {len(render_calls)}")
+        return False
+
+    # Test 2: Neue Version erzwingt neues Rendering
+    print("\nTest 2: New version triggers re-render")
+    cache.get_or_render(1, 'public', 2, lambda: '<p>Neu</p>')
+    if cache.get_or_render(1, 'public', 2, slow_render) == '<p>Neu</p>':
+        print("✓ Cached HTML for new version is used")
+    else:
+        print("✗ New version was not rendered")
+        return False
+
+    # Test 3: Invalidierung entfernt alle Varianten einer Präsentation
+    print("\nTest 3: Invalidation")
+    cache.get_or_render(1, 'presenter', 2, lambda: '<p>Präsentator</p>')
+    cache.get_or_render(2, 'public', 1, lambda: '<p>Andere</p>')
+    cache.invalidate(1)
+    if (cache.get_or_render(1, 'presenter', 2, lambda: '<p>Frisch</p>') == '<p>Frisch</p>' and
+            cache.get_or_render(2, 'public', 1, lambda: '<p>Falsch</p>') == '<p>Andere</p>'):
+        print("✓ Invalidation only affects the given presentation")
+    else:
+        print("✗ Invalidation did not work as expected")
+        return False
+
+    print("\nAll rendered HTML cache tests passed! ✓")
+    return True
+
+if __name__ == "__main__":
+    success = test_rendered_html_cache()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Test script for the content-addressed static info cache
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from flask import Flask
+from app import db, StaticInfoResultCache, StaticInfoCacheEntry
+
+def scratch_app(directory):
+    """Eigene App mit leerer SQLite-Datenbank - die Verdrängung wirkt auf die ganze Tabelle"""
+    scratch = Flask(__name__)
+    scratch.config['SQLALCHEMY_DATABASE_URI'] = f"sqlite:///{os.path.join(directory, 'cache.db')}"
+    db.init_app(scratch)
+    return scratch
+
+def test_static_info_cache():
+    print("Testing static info cache...")
+
+    directory = tempfile.mkdtemp()
+    app = scratch_app(directory)
+    try:
+        return run_tests(app)
+    finally:
+        with app.app_context():
+            db.engine.dispose()
+        shutil.rmtree(directory, ignore_errors=True)
+
+def run_tests(app):
+    with app.app_context():
+        db.create_all()
+        cache = StaticInfoResultCache(max_bytes=1000, wait_timeout=10)
+        calls = []
+
+        def generate():
+            calls.append(1)
+            time.sleep(0.2)
+            return '# Info-Seite\n\nGenerierter Inhalt'
+
+        # Test 1: Gleichzeitige identische Anfragen teilen sich einen Aufruf
+        print("\nTest 1: Identical concurrent requests share one call")
+        key = StaticInfoResultCache.make_key('Titel', str(uuid.uuid4()), 'gpt-4.1', 1)
+        results = []
+
+        def worker():
+            with app.app_context():
+                results.append(cache.get_or_generate(key, generate))
+
+        threads = [threading.Thread(target=worker) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        if len(calls) == 1 and len(set(results)) == 1 and results[0]:
+            print("✓ One AI call for 5 identical concurrent requests")
+        else:
+            print(f"✗ Expected 1 call, got {len(calls)}")
+            return False
+
+        # Test 2: Wiederholte Anfrage kommt aus dem persistenten Cache
+        print("\nTest 2: Repeated request is served from SQLite")
+        fresh_cache = StaticInfoResultCache(max_bytes=1000, wait_timeout=10)
+        if fresh_cache.get_or_generate(key, generate) == results[0] and len(calls) == 1 and fresh_cache.hits == 1:
+            print("✓ Result survives a new cache instance")
+        else:
+            print("✗ Cached result was not reused")
+            return False
+
+        # Test 3: Größenbasierte Verdrängung
+        print("\nTest 3: Size-based eviction")
+        StaticInfoCacheEntry.query.delete()
+        db.session.commit()
+        keys = [StaticInfoResultCache.make_key(str(uuid.uuid4())) for _ in range(4)]
+        for key in keys:
+            cache.get_or_generate(key, lambda: 'x' * 400)
+        remaining = {entry.key for entry in StaticInfoCacheEntry.query.all()}
+        if remaining == set(keys[-2:]):
+            print("✓ Oldest entries are evicted above max_bytes")
+        else:
+            print(f"✗ Unexpected remaining entries: {len(remaining)}")
+            return False
+
+        print("\nAll static info cache tests passed! ✓")
+        return True
+
+if __name__ == "__main__":
+    success = test_static_info_cache()
+    sys.exit(0 if success else 1)